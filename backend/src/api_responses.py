@@ -0,0 +1,100 @@
+import asyncio
+import gzip
+import brotli
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Fast settings: search responses are a few KB of JSON, where higher levels barely shrink them further
+GZIP_COMPRESS_LEVEL = 6
+BROTLI_QUALITY = 4
+# Preferred first when the client accepts several
+SUPPORTED_ENCODINGS = ["br", "gzip"]
+# Bodies this large (big batch responses) are compressed off the event loop
+THREAD_COMPRESSION_MIN_SIZE = 64 * 1024
+
+
+class SearchJSONResponse(ORJSONResponse):
+    """orjson response that also takes an already rendered body, e.g. one from the search results cache."""
+
+    def render(self, content) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return super().render(content)
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Best supported encoding allowed by an Accept-Encoding header ('gzip, br' or 'br;q=0, gzip;q=0.8')."""
+    qualities = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[name.strip().lower()] = quality
+    for encoding in SUPPORTED_ENCODINGS:
+        if qualities.get(encoding, qualities.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL)
+
+
+class CompressionMiddleware:
+    """Brotli or gzip compression of responses of at least minimum_size bytes, negotiated via Accept-Encoding.
+
+    JSON responses are sent as a single body message, which is compressed as a whole; streamed
+    bodies (more_body) and already encoded responses pass through unchanged.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        started = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, started
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if started or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            started = True
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            if message.get("more_body", False) or len(body) < self.minimum_size or "content-encoding" in headers:
+                await send(start_message)
+                await send(message)
+                return
+
+            if len(body) >= THREAD_COMPRESSION_MIN_SIZE:
+                compressed_body = await asyncio.to_thread(compress_body, body, encoding)
+            else:
+                compressed_body = compress_body(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed_body))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed_body})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,52 @@
+import json
+import os
+import uuid
+from datetime import datetime
+
+from shared.utils.app_logger import logger
+
+UNVERSIONED = "unversioned"
+
+
+def new_dataset_version() -> str:
+    return f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+
+def write_dataset_version(file_path: str, collection_name: str, version: str | None = None) -> str:
+    """Write the dataset version marker at the end of an ingest and return the version string."""
+    version = version or new_dataset_version()
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(
+            {"version": version, "collection_name": collection_name, "created_at": datetime.now().isoformat()}, f
+        )
+    os.replace(tmp_path, file_path)
+    logger.info(f"Wrote dataset version {version} to {file_path}")
+    return version
+
+
+class DatasetVersion:
+    """Reads the dataset version written by the ingest, re-reading the file only when its mtime changes."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._mtime: float | None = None
+        self._version = UNVERSIONED
+
+    def current(self) -> str:
+        try:
+            mtime = os.stat(self.file_path).st_mtime
+        except FileNotFoundError:
+            self._mtime, self._version = None, UNVERSIONED
+            return self._version
+
+        if mtime != self._mtime:
+            try:
+                with open(self.file_path, "r") as f:
+                    self._version = json.load(f).get("version", UNVERSIONED)
+            except (json.JSONDecodeError, ValueError, OSError) as e:
+                logger.warning(f"Could not read dataset version from {self.file_path}: {e}")
+                self._version = UNVERSIONED
+            self._mtime = mtime
+        return self._version
@@ -45,6 +45,18 @@ TO_NORMALIZED_COLUMNS = [f"{NORMALIZED_COLUMN_PREFIX}{col}" for col in NUMERIC_C
 POSITION_COLUMNS = ["POS_GUARD", "POS_FORWARD", "POS_CENTER"]
 POSITION_WEIGHT = 3.0
 
+# Feature behind each embedding dimension, in vector order (normalized stats, then weighted position bits)
+EMBEDDING_FEATURES = NUMERIC_COLUMNS + POSITION_COLUMNS
+
+# Feature groups that query-time weights can target by name, features left out keep weight 1
+FEATURE_GROUPS = {
+    "scoring": ["PTS_RESPONSIBILITY", "PTS_PER_GAME", "PTS_PER_36", "USG%", "PER"],
+    "playmaking": ["AST_PER_GAME", "TOV_PER_GAME", "AST_TO_RATIO"],
+    "defense": ["STL_PER_GAME", "BLK_PER_GAME", "STL%", "BLK%"],
+    "shooting": ["TS%", "EFG%", "FG%", "3P%", "FT%"],
+    "physical": ["HEIGHT_INCHES", "WEIGHT", "REB_PER_GAME"],
+}
+
 
 class PlayerEmbeddings:
     def __init__(self, players_stats_df: pd.DataFrame):
@@ -0,0 +1,80 @@
+import math
+from functools import lru_cache
+from typing import NamedTuple
+import numpy as np
+from backend.src.embeddings import EMBEDDING_FEATURES, FEATURE_GROUPS
+
+# Named weightings for the common "X like Y" questions, keys are feature groups or single features
+WEIGHT_PRESETS = {
+    "scorer": {"scoring": 3.0, "shooting": 1.5},
+    "shooter": {"shooting": 3.0, "3P%": 2.0},
+    "playmaker": {"playmaking": 3.0, "scoring": 0.5},
+    "defender": {"defense": 3.0, "physical": 1.5, "scoring": 0.5},
+    "big": {"physical": 3.0, "defense": 2.0, "shooting": 0.5},
+}
+FLOAT32_MAX = float(np.finfo(np.float32).max)
+
+
+class FeatureWeights(NamedTuple):
+    # Preset name or canonical form of custom weights, used to cache the weighted matrix
+    key: str
+    # One weight per embedding dimension, multiplied into both the query and the stored vectors
+    vector: np.ndarray
+
+
+def build_weight_vector(weights: dict[str, float]) -> np.ndarray:
+    """Per-dimension weights from group and feature weights, a feature weight wins over its group's."""
+    feature_positions = {feature: position for position, feature in enumerate(EMBEDDING_FEATURES)}
+    vector = np.ones(len(EMBEDDING_FEATURES), dtype=np.float32)
+    group_weights = {name: weight for name, weight in weights.items() if name in FEATURE_GROUPS}
+    feature_weights = {name: weight for name, weight in weights.items() if name not in FEATURE_GROUPS}
+
+    for name, weight in list(group_weights.items()) + list(feature_weights.items()):
+        if name not in FEATURE_GROUPS and name not in feature_positions:
+            raise ValueError(
+                f"Unknown feature or feature group '{name}'. Expected one of {sorted(FEATURE_GROUPS)} "
+                f"or a feature from {EMBEDDING_FEATURES}"
+            )
+        # NaN passes a "< 0" check, and weights past float32 range turn into inf in the vector
+        if not math.isfinite(weight) or abs(weight) > FLOAT32_MAX:
+            raise ValueError(f"Weight of '{name}' must be a finite number, got {weight}")
+        if weight < 0:
+            raise ValueError(f"Weight of '{name}' must be >= 0, got {weight}")
+        for feature in FEATURE_GROUPS.get(name, [name]):
+            vector[feature_positions[feature]] = weight
+
+    if not vector.any():
+        raise ValueError("At least one feature needs a weight above 0")
+    return vector
+
+
+@lru_cache(maxsize=None)
+def preset_weights(preset: str) -> FeatureWeights:
+    if preset not in WEIGHT_PRESETS:
+        raise ValueError(f"Unknown weight preset '{preset}'. Expected one of {sorted(WEIGHT_PRESETS)}")
+    return FeatureWeights(key=preset, vector=build_weight_vector(WEIGHT_PRESETS[preset]))
+
+
+def parse_weights(weights: str) -> dict[str, float]:
+    """'shooting:3,3P%:2' -> {"shooting": 3.0, "3P%": 2.0}, the query string form of custom weights."""
+    parsed = {}
+    for item in weights.split(","):
+        name, separator, weight = item.strip().rpartition(":")
+        if not separator or not name:
+            raise ValueError(f"Invalid weight '{item}'. Expected format like 'shooting:3'")
+        try:
+            parsed[name.strip()] = float(weight)
+        except ValueError:
+            raise ValueError(f"Invalid weight '{item}'. Expected format like 'shooting:3'")
+    return parsed
+
+
+def resolve_feature_weights(
+    preset: str | None = None, weights: dict[str, float] | None = None
+) -> FeatureWeights | None:
+    """Weights of a preset, optionally overridden by custom weights, or None for the unweighted search."""
+    if not weights:
+        return preset_weights(preset) if preset else None
+    combined = {**WEIGHT_PRESETS[preset_weights(preset).key], **weights} if preset else weights
+    key = ",".join(f"{name}:{weight:g}" for name, weight in sorted(combined.items()))
+    return FeatureWeights(key=key, vector=build_weight_vector(combined))
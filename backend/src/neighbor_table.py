@@ -0,0 +1,180 @@
+import os
+import numpy as np
+import pandas as pd
+from shared.utils.app_logger import logger
+from backend.src.qdrant_wrapper import position_tokens
+from backend.src.numpy_search_engine import (
+    compute_scores,
+    era_mask,
+    position_mask,
+    prepare_search_matrix,
+    top_k_indices,
+)
+
+NEIGHBOR_TABLE_POSITIONS = ["Guard", "Forward", "Center"]
+ANY_FILTER = "any"
+
+
+def combination_key(position: str | None, era: str | None) -> str:
+    # Normalized like the live position filter, so 'guard' is served from the 'Guard' table
+    position = "-".join(position_tokens(position)) if position else None
+    return f"{position or ANY_FILTER}__{era or ANY_FILTER}"
+
+
+class NeighborTable:
+    """Precomputed top-K neighbors of every player for each position/era filter combination.
+
+    Built offline at ingest time with the same scoring as NumpySearchEngine, so serving a
+    similarity search for a known combination is a dictionary lookup plus an array slice.
+    Each row keeps the K best candidates *including* the player itself, so dropping the player
+    still leaves K - 1 neighbors to serve any offset/limit window within them.
+    """
+
+    def __init__(
+        self,
+        player_names: np.ndarray,
+        neighbors: dict[str, np.ndarray],
+        scores: dict[str, np.ndarray],
+        depth: int,
+        distance_metric: str,
+        dataset_version: str,
+    ):
+        self.player_names = player_names
+        self.neighbors = neighbors
+        self.scores = scores
+        self.depth = depth
+        self.distance_metric = distance_metric
+        self.dataset_version = dataset_version
+        self.player_rows = {name: row for row, name in enumerate(player_names)}
+
+    @classmethod
+    def build(
+        cls,
+        players_df: pd.DataFrame,
+        distance_metric: str,
+        depth: int,
+        dataset_version: str,
+        chunk_size: int = 512,
+    ) -> "NeighborTable":
+        """Compute neighbor tables from the processed players DataFrame (PLAYER_NAME, POSITION, embeddings)."""
+        player_names = players_df["PLAYER_NAME"].astype(str).str.lower().to_numpy(dtype=str)
+        positions = players_df["POSITION"].fillna("Unknown").astype(str).tolist()
+        last_played_years = np.array(
+            [int(str(season)[:4]) if season else 0 for season in players_df["LAST_PLAYED_SEASON"]], dtype=np.int32
+        )
+        matrix = prepare_search_matrix(players_df["embeddings"].tolist(), distance_metric)
+        squared_norms = np.einsum("ij,ij->i", matrix, matrix)
+
+        played_years = last_played_years[last_played_years > 0]
+        eras = [f"{decade}s" for decade in range(played_years.min() // 10 * 10, played_years.max() + 1, 10)]
+
+        neighbors, scores = {}, {}
+        for position in [None] + NEIGHBOR_TABLE_POSITIONS:
+            for era in [None] + eras:
+                mask = np.ones(len(player_names), dtype=bool)
+                if position:
+                    mask &= position_mask(positions, position)
+                if era:
+                    mask &= era_mask(last_played_years, era)
+                rows = np.flatnonzero(mask)
+                key = combination_key(position, era)
+                neighbors[key], scores[key] = cls._build_combination(
+                    matrix, squared_norms, rows, distance_metric, depth, chunk_size
+                )
+
+        logger.info(f"Built neighbor table for {len(player_names)} players and {len(neighbors)} filter combinations")
+        return cls(player_names, neighbors, scores, depth, distance_metric, dataset_version)
+
+    @staticmethod
+    def _build_combination(
+        matrix: np.ndarray,
+        squared_norms: np.ndarray,
+        rows: np.ndarray,
+        distance_metric: str,
+        depth: int,
+        chunk_size: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        total_players = matrix.shape[0]
+        neighbors = np.full((total_players, depth), -1, dtype=np.int32)
+        scores = np.zeros((total_players, depth), dtype=np.float32)
+        if rows.size == 0:
+            return neighbors, scores
+
+        candidates = matrix[rows]
+        candidate_squared_norms = squared_norms[rows]
+        width = min(depth, rows.size)
+        for start in range(0, total_players, chunk_size):
+            queries = matrix[start : start + chunk_size]
+            chunk_scores = compute_scores(candidates, candidate_squared_norms, queries, distance_metric)
+            chunk_top = top_k_indices(chunk_scores, width, distance_metric)
+            neighbors[start : start + chunk_size, :width] = rows[chunk_top]
+            scores[start : start + chunk_size, :width] = np.take_along_axis(chunk_scores, chunk_top, axis=-1)
+        return neighbors, scores
+
+    def save(self, file_path: str) -> None:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        arrays = {f"neighbors__{key}": value for key, value in self.neighbors.items()}
+        arrays.update({f"scores__{key}": value for key, value in self.scores.items()})
+        tmp_path = f"{file_path}.tmp.npz"
+        np.savez_compressed(
+            tmp_path,
+            player_names=self.player_names,
+            depth=np.array(self.depth),
+            distance_metric=np.array(self.distance_metric),
+            dataset_version=np.array(self.dataset_version),
+            **arrays,
+        )
+        os.replace(tmp_path, file_path)
+        logger.info(f"Saved neighbor table to {file_path}")
+
+    @classmethod
+    def load(cls, file_path: str) -> "NeighborTable":
+        with np.load(file_path, allow_pickle=False) as data:
+            neighbors = {
+                name.removeprefix("neighbors__"): data[name] for name in data.files if name.startswith("neighbors__")
+            }
+            scores = {name.removeprefix("scores__"): data[name] for name in data.files if name.startswith("scores__")}
+            return cls(
+                player_names=data["player_names"],
+                neighbors=neighbors,
+                scores=scores,
+                depth=int(data["depth"]),
+                distance_metric=str(data["distance_metric"]),
+                dataset_version=str(data["dataset_version"]),
+            )
+
+    def get_neighbors(
+        self,
+        player_name: str,
+        position: str | None,
+        era: str | None,
+        limit: int,
+        offset: int = 0,
+        score_threshold: float | None = None,
+    ) -> list[tuple[str, float]] | None:
+        """Lowercased names and scores of neighbors offset..offset+limit (player excluded), or None when
+        the table can't answer this query."""
+        key = combination_key(position, era)
+        player_row = self.player_rows.get(player_name.lower())
+        if key not in self.neighbors or player_row is None:
+            return None
+
+        neighbor_rows = self.neighbors[key][player_row]
+        neighbor_scores = self.scores[key][player_row]
+        # Padding means every candidate of this filter combination fits in the row
+        complete = bool((neighbor_rows < 0).any())
+        neighbors = [
+            (row, float(score)) for row, score in zip(neighbor_rows, neighbor_scores) if row >= 0 and row != player_row
+        ]
+        if score_threshold is not None:
+            if self.distance_metric == "Euclidean":
+                within_threshold = [(row, score) for row, score in neighbors if score <= score_threshold]
+            else:
+                within_threshold = [(row, score) for row, score in neighbors if score >= score_threshold]
+            # Rows are sorted, so once one neighbor misses the threshold all deeper ones do too
+            complete = complete or len(within_threshold) < len(neighbors)
+            neighbors = within_threshold
+
+        if not complete and len(neighbors) < offset + limit:
+            return None
+        return [(str(self.player_names[row]), score) for row, score in neighbors[offset : offset + limit]]
@@ -0,0 +1,224 @@
+import numpy as np
+from qdrant_client.models import Record, ScoredPoint
+from shared.config import settings
+from shared.utils.app_logger import logger
+from backend.src.qdrant_wrapper import QdrantClientWrapper, SimilarPlayersQuery, position_tokens
+from backend.src.feature_weights import FeatureWeights
+
+# Weighted copies of the matrix kept per weights key (presets and recent custom weights)
+MAX_WEIGHTED_MATRICES = 32
+
+
+def normalize_vectors(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def prepare_search_matrix(vectors, distance_metric: str) -> np.ndarray:
+    """Stack vectors into a contiguous float32 matrix the way Qdrant stores them."""
+    matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    if distance_metric == "Cosine":
+        # Qdrant stores cosine vectors normalized, so a plain dot product gives the same score
+        matrix = np.ascontiguousarray(normalize_vectors(matrix))
+    return matrix
+
+
+def compute_scores(
+    matrix: np.ndarray, squared_norms: np.ndarray, queries: np.ndarray, distance_metric: str
+) -> np.ndarray:
+    """Scores of every matrix row against one query (1D) or a batch of queries (2D, one row per query)."""
+    if distance_metric == "Cosine":
+        return normalize_vectors(queries) @ matrix.T
+    if distance_metric == "Dot":
+        return queries @ matrix.T
+    query_squared_norms = np.einsum("...i,...i->...", queries, queries)[..., np.newaxis]
+    squared_distances = squared_norms - 2 * (queries @ matrix.T) + query_squared_norms
+    return np.sqrt(np.maximum(squared_distances, 0))
+
+
+def top_k_indices(scores: np.ndarray, k: int, distance_metric: str) -> np.ndarray:
+    """Indices of the k best scores along the last axis, best first."""
+    # Euclidean scores are distances, so closer players have lower scores
+    ranking_scores = scores if distance_metric == "Euclidean" else -scores
+    k = min(k, scores.shape[-1])
+    top_indices = np.argpartition(ranking_scores, k - 1, axis=-1)[..., :k]
+    order = np.argsort(np.take_along_axis(ranking_scores, top_indices, axis=-1), axis=-1, kind="stable")
+    return np.take_along_axis(top_indices, order, axis=-1)
+
+
+def blend_query_vectors(vectors: list[list], weights: list[float]) -> list:
+    """Weighted mean of player vectors, the query vector of a multi-player search."""
+    return np.average(np.asarray(vectors, dtype=np.float32), axis=0, weights=weights).tolist()
+
+
+def position_mask(positions: list[str], position: str) -> np.ndarray:
+    # Same matching as the Qdrant position filter: every word of the filter among the player's position words
+    filter_tokens = set(position_tokens(position))
+    return np.array(
+        [filter_tokens.issubset(position_tokens(player_position)) for player_position in positions], dtype=bool
+    )
+
+
+def era_mask(last_played_years: np.ndarray, era: str) -> np.ndarray:
+    decade_start, decade_end = QdrantClientWrapper.era_to_year_range(era)
+    return (last_played_years >= decade_start) & (last_played_years <= decade_end)
+
+
+class NumpySearchEngine:
+    """In-process similarity search over the whole players collection.
+
+    The collection is small (a few thousand 29D vectors), so every point is kept in one
+    contiguous float32 matrix and a search is a single matmul plus argpartition instead of
+    a network round-trip to Qdrant. Scores and ordering follow Qdrant's distance semantics
+    so the results can be used interchangeably with QdrantClientWrapper.search_similar_players.
+    """
+
+    def __init__(self, distance_metric: str):
+        self.distance_metric = distance_metric
+        self.matrix = np.empty((0, 0), dtype=np.float32)
+        self.squared_norms = np.empty(0, dtype=np.float32)
+        self.ids: list = []
+        self.rows_by_id: dict = {}
+        self.rows_by_player_name: dict[str, int] = {}
+        self.payloads: list[dict] = []
+        self.positions: list[str] = []
+        self.last_played_years = np.empty(0, dtype=np.int32)
+        self._position_masks: dict[str, np.ndarray] = {}
+        self._era_masks: dict[str, np.ndarray] = {}
+        self._weighted_matrices: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+    @property
+    def is_loaded(self) -> bool:
+        return len(self.ids) > 0
+
+    def load(self, records: list[Record]) -> None:
+        """Replace the in-memory matrix and payloads with the given collection points."""
+        matrix = prepare_search_matrix([record.vector for record in records], self.distance_metric)
+        self.matrix = matrix
+        self.squared_norms = np.einsum("ij,ij->i", matrix, matrix)
+        self.ids = [record.id for record in records]
+        self.rows_by_id = {point_id: row for row, point_id in enumerate(self.ids)}
+        self.payloads = [record.payload or {} for record in records]
+        self.rows_by_player_name = {
+            str(payload.get("PLAYER_NAME_LOWER_CASE", "")): row for row, payload in enumerate(self.payloads)
+        }
+        self.positions = [str(payload.get("POSITION", "")) for payload in self.payloads]
+        self.last_played_years = np.array(
+            [int(payload.get("LAST_PLAYED_YEAR", 0)) for payload in self.payloads], dtype=np.int32
+        )
+        self._position_masks = {}
+        self._era_masks = {}
+        self._weighted_matrices = {}
+        logger.info(f"Loaded {len(self.ids)} players into the NumPy search engine with shape {self.matrix.shape}")
+
+    def _position_mask(self, position: str) -> np.ndarray:
+        if position not in self._position_masks:
+            self._position_masks[position] = position_mask(self.positions, position)
+        return self._position_masks[position]
+
+    def _era_mask(self, era: str) -> np.ndarray:
+        if era not in self._era_masks:
+            self._era_masks[era] = era_mask(self.last_played_years, era)
+        return self._era_masks[era]
+
+    def _weighted_matrix(self, feature_weights: FeatureWeights | None) -> tuple[np.ndarray, np.ndarray]:
+        """Matrix and squared norms with every dimension multiplied by its weight, cached per weights key.
+
+        Stored cosine rows are unit length, which only rescales each row, so weighting them and
+        normalizing again gives the same cosine scores as weighting the original vectors.
+        """
+        if feature_weights is None:
+            return self.matrix, self.squared_norms
+        if feature_weights.vector.shape[0] != self.matrix.shape[1]:
+            raise ValueError(
+                f"Got {feature_weights.vector.shape[0]} feature weights for {self.matrix.shape[1]}D vectors"
+            )
+        if feature_weights.key not in self._weighted_matrices:
+            if len(self._weighted_matrices) >= MAX_WEIGHTED_MATRICES:
+                self._weighted_matrices.pop(next(iter(self._weighted_matrices)))
+            matrix = prepare_search_matrix(self.matrix * feature_weights.vector, self.distance_metric)
+            self._weighted_matrices[feature_weights.key] = matrix, np.einsum("ij,ij->i", matrix, matrix)
+        return self._weighted_matrices[feature_weights.key]
+
+    def _build_search_mask(self, position: str = None, era: str = None) -> np.ndarray | None:
+        mask = None
+        if position:
+            mask = self._position_mask(position)
+        if era:
+            decade_mask = self._era_mask(era)
+            mask = decade_mask if mask is None else mask & decade_mask
+        return mask
+
+    def _top_results(
+        self, scores: np.ndarray, mask: np.ndarray | None, query: SimilarPlayersQuery
+    ) -> list[ScoredPoint]:
+        exclude_rows = [
+            self.rows_by_id[point_id] for point_id in query.exclude_ids or () if point_id in self.rows_by_id
+        ]
+        exclude_rows += [
+            self.rows_by_player_name[player_name.lower()]
+            for player_name in query.exclude_player_names or ()
+            if player_name.lower() in self.rows_by_player_name
+        ]
+        if exclude_rows:
+            mask = np.ones(len(self.ids), dtype=bool) if mask is None else mask.copy()
+            mask[exclude_rows] = False
+        if query.score_threshold is not None:
+            # Inclusive like Qdrant: a minimum score, or a maximum distance for Euclidean
+            if self.distance_metric == "Euclidean":
+                within_threshold = scores <= query.score_threshold
+            else:
+                within_threshold = scores >= query.score_threshold
+            mask = within_threshold if mask is None else mask & within_threshold
+
+        rows = None if mask is None else np.flatnonzero(mask)
+        if rows is not None:
+            if rows.size == 0:
+                return []
+            scores = scores[rows]
+
+        limit = query.limit or settings.QDRANT_VECTOR_SEARCH_LIMIT
+        top_indices = top_k_indices(scores, query.offset + limit, self.distance_metric)[query.offset :]
+        row_indices = top_indices if rows is None else rows[top_indices]
+        return [
+            ScoredPoint(id=self.ids[row], version=0, score=float(scores[i]), payload=self.payloads[row])
+            for i, row in zip(top_indices, row_indices)
+        ]
+
+    def search_similar_players(
+        self,
+        query_vector: list,
+        position: str = None,
+        era: str = None,
+        limit: int = None,
+        offset: int = 0,
+        score_threshold: float = None,
+        exclude_ids: list = None,
+        exclude_player_names: list = None,
+        feature_weights: FeatureWeights = None,
+    ) -> list[ScoredPoint]:
+        query = SimilarPlayersQuery(
+            query_vector, position, era, limit, offset, score_threshold, exclude_ids, exclude_player_names
+        )
+        return self.search_similar_players_batch([query], feature_weights=feature_weights)[0]
+
+    def search_similar_players_batch(
+        self, queries: list[SimilarPlayersQuery], feature_weights: FeatureWeights = None
+    ) -> list[list[ScoredPoint]]:
+        """Vectorized equivalent of Qdrant search_batch: one matmul for all queries.
+
+        With feature_weights, queries and stored vectors are scored with every dimension
+        multiplied by its weight (the way POSITION_WEIGHT scales the position bits at ingest).
+        """
+        if not queries:
+            return []
+        matrix, squared_norms = self._weighted_matrix(feature_weights)
+        query_matrix = np.asarray([query.query_vector for query in queries], dtype=np.float32)
+        if feature_weights is not None:
+            query_matrix = query_matrix * feature_weights.vector
+        all_scores = compute_scores(matrix, squared_norms, query_matrix, self.distance_metric)
+        return [
+            self._top_results(scores, self._build_search_mask(position=query.position, era=query.era), query)
+            for scores, query in zip(all_scores, queries)
+        ]
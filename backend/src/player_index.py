@@ -0,0 +1,41 @@
+from qdrant_client.models import Record
+from shared.utils.app_logger import logger
+
+
+class PlayerIndex:
+    """In-memory lookup of collection points by lowercased player name.
+
+    Built from a full scroll of the collection so that resolving a player's vector and payload
+    is a dictionary probe instead of a filtered Qdrant scroll per request.
+    """
+
+    def __init__(self):
+        self.by_name: dict[str, Record] = {}
+        # Collection signature the in-memory indexes were built from, see QdrantClientWrapper.get_collection_signature
+        self.signature: tuple | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return len(self.by_name) > 0
+
+    def load(self, records: list[Record]) -> None:
+        by_name = {}
+        for record in records:
+            payload = record.payload or {}
+            player_name_lower = payload.get("PLAYER_NAME_LOWER_CASE")
+            if player_name_lower:
+                by_name[player_name_lower] = record
+
+        # Swap the dictionary in one go so concurrent readers never see a half-built index
+        self.by_name = by_name
+        logger.info(f"Loaded {len(by_name)} players into the in-memory player index")
+
+    def get_by_name(self, player_name: str) -> Record | None:
+        return self.by_name.get(player_name.lower())
+
+    def search_players_by_name(self, player_name: str) -> tuple[list, list]:
+        """Same contract as QdrantClientWrapper.search_players_by_name: (vector, [record])."""
+        record = self.get_by_name(player_name)
+        if record is None:
+            raise ValueError(f"Player {player_name} not found in the in-memory player index.")
+        return record.vector, [record]
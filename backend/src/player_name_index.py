@@ -0,0 +1,174 @@
+import re
+import unicodedata
+from collections import Counter
+from pprint import pformat
+import jellyfish
+from rapidfuzz import process
+from shared.utils.app_logger import logger
+
+# Candidates sharing the most trigrams with the input that are passed on to rapidfuzz scoring
+MAX_FUZZY_CANDIDATES = 200
+# Metaphone codes a phonetic alias key needs, shorter keys ("KT" of "KD") collide with arbitrary typos
+MIN_PHONETIC_KEY_CODES = 4
+
+
+def fold_player_name(player_name: str) -> str:
+    """Lowercase and strip accents so 'Nikola Jokić' and 'nikola jokic' index the same way."""
+    decomposed = unicodedata.normalize("NFKD", player_name.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).strip()
+
+
+def phonetic_key(player_name: str) -> str:
+    """Metaphone code per name token, so 'Koby Briant' and 'Kobe Bryant' share 'KB BRNT'-style keys."""
+    letters_only = re.sub(r"[^a-z ]", "", fold_player_name(player_name))
+    return jellyfish.metaphone(letters_only) if letters_only.strip() else ""
+
+
+def player_name_from_file_name(file_name: str) -> str:
+    """'LeBron_James_career_stats.parquet' -> 'LeBron James'."""
+    return file_name.rsplit("_", 2)[0].replace("_", " ")
+
+
+def trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class PlayerNameIndex:
+    """Name resolution structures compiled once from the raw stats file names and the alias tables.
+
+    Every substring of a name shares all of its trigrams with it, so intersecting trigram postings
+    gives the exact candidates for the substring check. Token and trigram overlap narrow the
+    candidates for the rapidfuzz fallback, so only a few hundred names are scored per lookup.
+    """
+
+    def __init__(self):
+        self.player_names: list[str] = []
+        # Same names as player_names with the original casing of the stats files, for display
+        self.display_names: list[str] = []
+        self.players_aliases: list[dict] = []
+        self.folded_names: list[str] = []
+        self.token_postings: dict[str, set[int]] = {}
+        self.trigram_postings: dict[str, set[int]] = {}
+        self.aliases: dict[str, str] = {}
+        # Phonetic key -> (full name, folded aliases with that key) the input is scored against
+        self.phonetic_aliases: dict[str, tuple[str, list[str]]] = {}
+        # mtimes of the sources the index was built from, to rebuild only when they change
+        self.source_mtime: tuple | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return len(self.player_names) > 0
+
+    def build(self, file_names: list[str], players_aliases: list[dict]) -> None:
+        display_names_by_name = {}
+        for file_name in file_names:
+            display_name = player_name_from_file_name(file_name)
+            display_names_by_name.setdefault(display_name.lower(), display_name)
+        player_names = list(display_names_by_name)
+        folded_names = [fold_player_name(player_name) for player_name in player_names]
+
+        token_postings: dict[str, set[int]] = {}
+        trigram_postings: dict[str, set[int]] = {}
+        for position, folded_name in enumerate(folded_names):
+            for token in folded_name.split():
+                token_postings.setdefault(token, set()).add(position)
+            for trigram in trigrams(folded_name):
+                trigram_postings.setdefault(trigram, set()).add(position)
+
+        aliases = {}
+        phonetic_candidates: dict[str, set[str]] = {}
+        phonetic_alias_names: dict[str, list[str]] = {}
+        for player in players_aliases:
+            for alias in [player["full_name"]] + player["aliases"]:
+                folded_alias = fold_player_name(alias)
+                # Aliases shared by several players (e.g. "James") resolve to the first one listed
+                aliases.setdefault(folded_alias, player["full_name"])
+                key = phonetic_key(alias)
+                # Single-word aliases ("Luka", "Bird") sound like too many typos to be resolved by sound
+                if len(folded_alias.split()) < 2 or len(key.replace(" ", "")) < MIN_PHONETIC_KEY_CODES:
+                    continue
+                phonetic_candidates.setdefault(key, set()).add(player["full_name"])
+                phonetic_alias_names.setdefault(key, []).append(folded_alias)
+        # A phonetic key is only a shortcut when it points to a single player
+        phonetic_aliases = {
+            key: (next(iter(full_names)), phonetic_alias_names[key])
+            for key, full_names in phonetic_candidates.items()
+            if len(full_names) == 1
+        }
+
+        self.player_names = player_names
+        self.display_names = list(display_names_by_name.values())
+        self.players_aliases = players_aliases
+        self.folded_names = folded_names
+        self.token_postings = token_postings
+        self.trigram_postings = trigram_postings
+        self.aliases = aliases
+        self.phonetic_aliases = phonetic_aliases
+        logger.info(
+            f"Built player name index with {len(player_names)} names, {len(trigram_postings)} trigrams, "
+            f"{len(aliases)} aliases and {len(phonetic_aliases)} phonetic alias keys"
+        )
+
+    def get_alias_match(self, user_input_player_name: str) -> str | None:
+        return self.aliases.get(fold_player_name(user_input_player_name))
+
+    def get_phonetic_alias_match(self, user_input_player_name: str, threshold: int) -> dict | None:
+        """Player whose alias sounds like the input, with the rapidfuzz score of the closest such alias."""
+        phonetic_alias = self.phonetic_aliases.get(phonetic_key(user_input_player_name))
+        if phonetic_alias is None:
+            return None
+        full_name, alias_names = phonetic_alias
+        best_alias = process.extractOne(fold_player_name(user_input_player_name), alias_names, score_cutoff=threshold)
+        if best_alias is None:
+            return None
+        return {"full_name": full_name, "score": best_alias[1]}
+
+    def _substring_matches(self, target: str) -> list[int]:
+        target_trigrams = trigrams(target)
+        if not target_trigrams:
+            return [position for position, folded_name in enumerate(self.folded_names) if target in folded_name]
+
+        postings = sorted((self.trigram_postings.get(trigram, set()) for trigram in target_trigrams), key=len)
+        candidates = set.intersection(*postings) if postings[0] else set()
+        return sorted(position for position in candidates if target in self.folded_names[position])
+
+    def _fuzzy_candidates(self, target: str) -> list[int]:
+        shared_trigrams = Counter()
+        for trigram in trigrams(target):
+            shared_trigrams.update(self.trigram_postings.get(trigram, ()))
+        candidates = {position for position, _ in shared_trigrams.most_common(MAX_FUZZY_CANDIDATES)}
+        for token in target.split():
+            candidates.update(self.token_postings.get(token, ()))
+        return sorted(candidates)
+
+    def find_all_potential_matches(self, target: str, threshold: int) -> dict:
+        """Substring matches of the input (an error when ambiguous), else a phonetic alias, else rapidfuzz matches."""
+        target = fold_player_name(target)
+        exact_matches = [self.player_names[position] for position in self._substring_matches(target)]
+
+        if exact_matches:
+            if len(exact_matches) > 1:
+                logger.warning(f"Multiple exact matches found for {target}: \n{pformat(exact_matches, indent=1)}")
+                return {
+                    "target": target,
+                    "error": "Multiple matches found. Please be more specific.",
+                    "matches": exact_matches,
+                }
+            logger.info(f"Exact match found for {target}: {exact_matches[0]}")
+            return {"target": target, "potential_matches": [{"full_name": exact_matches[0], "score": 100}]}
+
+        # Misspelled alias ("shakeel oneal"): resolved by sound before any fuzzy scoring
+        phonetic_match = self.get_phonetic_alias_match(target, threshold)
+        if phonetic_match:
+            logger.info(f"Phonetic alias match found for {target}: {phonetic_match}")
+            return {"target": target, "potential_matches": [phonetic_match]}
+
+        candidate_positions = self._fuzzy_candidates(target)
+        results = process.extract(
+            target, [self.folded_names[position] for position in candidate_positions], score_cutoff=threshold
+        )
+        logger.info(f"Found {len(results)} matches for {target} among {len(candidate_positions)} candidates")
+        potential_matches = [
+            {"full_name": self.player_names[candidate_positions[index]], "score": score} for _, score, index in results
+        ]
+        return {"target": target, "potential_matches": potential_matches}
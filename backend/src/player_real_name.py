@@ -1,29 +1,76 @@
 from shared.utils.app_logger import logger
-from backend.utils.fuzz_utils import find_all_potential_matches
+from backend.src.player_name_index import PlayerNameIndex
+import json
 import os
 from shared.config import settings
+from backend.src.search_metrics import stage_timer
 from pprint import pformat
 
+player_name_index = PlayerNameIndex()
+
+
+def load_players_aliases(file_path: str) -> list[dict]:
+    """Built-in PLAYERS_ALIASES plus the entries of the optional external aliases JSON file.
+
+    The file holds a list of {"full_name": str, "aliases": [str, ...]} objects, so the alias table
+    can cover the whole roster without code changes.
+    """
+    if not os.path.exists(file_path):
+        return PLAYERS_ALIASES
+    try:
+        with open(file_path, "r") as f:
+            file_aliases = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error(f"Failed to load player aliases from {file_path}: {e}")
+        return PLAYERS_ALIASES
+
+    valid_aliases = [
+        player
+        for player in file_aliases
+        if isinstance(player, dict)
+        and isinstance(player.get("full_name"), str)
+        and isinstance(player.get("aliases"), list)
+    ]
+    if len(valid_aliases) != len(file_aliases):
+        logger.warning(f"Skipped {len(file_aliases) - len(valid_aliases)} malformed entries in {file_path}")
+    return PLAYERS_ALIASES + valid_aliases
+
+
+def load_player_name_index(data_dir: str) -> None:
+    """Build the name index from the raw stats file names and aliases, skipped when neither changed."""
+    aliases_file_path = settings.PLAYER_ALIASES_FILE_PATH
+    mtime = (
+        os.path.getmtime(data_dir),
+        os.path.getmtime(aliases_file_path) if os.path.exists(aliases_file_path) else None,
+    )
+    if player_name_index.is_loaded and mtime == player_name_index.source_mtime:
+        return
+    player_name_index.build(os.listdir(data_dir), load_players_aliases(aliases_file_path))
+    player_name_index.source_mtime = mtime
+
+
+def get_player_name_index(data_dir: str) -> PlayerNameIndex:
+    if not player_name_index.is_loaded:
+        load_player_name_index(data_dir)
+    return player_name_index
+
 
 def get_player_from_aliases(user_input_player_name: str) -> str | None:
-    for player in PLAYERS_ALIASES:
-        logger.debug(f"Checking aliases for player: {player} and user input: {user_input_player_name}")
-        if player["full_name"].lower() == user_input_player_name.lower():
-            logger.info(f'Exact match found for "{player["full_name"]}" of user input "{user_input_player_name}"')
-            return player["full_name"]
-        elif any(alias.lower() == user_input_player_name.lower() for alias in player["aliases"]):
-            logger.info(f'Full match found for "{player["full_name"]}" of user input "{user_input_player_name}"')
-            return player["full_name"]
-    logger.debug(f'No aliases match found for "{user_input_player_name}"')
-    return None
+    alias_match = get_player_name_index(settings.RAW_NBA_DATA_PATH).get_alias_match(user_input_player_name)
+    if alias_match:
+        logger.info(f'Alias match found for "{alias_match}" of user input "{user_input_player_name}"')
+    else:
+        logger.debug(f'No aliases match found for "{user_input_player_name}"')
+    return alias_match
 
 
 def get_player_from_local_files(user_input_player_name: str, data_dir: str) -> dict:
-    files: list = os.listdir(data_dir)
-    potential_matches = find_all_potential_matches(user_input_player_name, files, settings.FUZZ_THRESHOLD_LOCAL_NAME)
-    return potential_matches
+    return get_player_name_index(data_dir).find_all_potential_matches(
+        user_input_player_name, settings.FUZZ_THRESHOLD_LOCAL_NAME
+    )
 
 
+@stage_timer("name_resolution")
 def get_real_player_name(user_input_player_name: str) -> dict:
 
     alias_match = get_player_from_aliases(user_input_player_name)
@@ -37,16 +84,20 @@ def get_real_player_name(user_input_player_name: str) -> dict:
         return potential_matches
 
     all_matches = []
-    if potential_matches:
+    if potential_matches.get("potential_matches"):
         first_full_name = potential_matches["potential_matches"][0]["full_name"]
     else:
         first_full_name = user_input_player_name
 
-    if potential_matches:
+    if potential_matches.get("potential_matches"):
         logger.debug(
             f"Potential matches from local files for {user_input_player_name}: \n{pformat(potential_matches, indent=1)}"
         )
+        best_score = potential_matches["potential_matches"][0]["score"]
+        # Only the best-scoring names, a weak fuzzy tail match must not win just because it has aliases
         for match in potential_matches["potential_matches"]:
+            if match["score"] < best_score:
+                break
             player_name = match["full_name"]
             alias_match = get_player_from_aliases(player_name)
             if alias_match:
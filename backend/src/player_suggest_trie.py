@@ -0,0 +1,105 @@
+from backend.src.player_name_index import fold_player_name
+from shared.utils.app_logger import logger
+
+
+class TrieNode:
+    __slots__ = ("children", "player_ids", "top_player_ids")
+
+    def __init__(self):
+        self.children: dict[str, "TrieNode"] = {}
+        # Players whose key ends exactly at this node
+        self.player_ids: set[int] = set()
+        # Best ranked players anywhere below this node, filled once after all keys are inserted
+        self.top_player_ids: list[int] = []
+
+
+class PlayerSuggestTrie:
+    """Prefix trie over folded full names, name tokens (e.g. last names) and aliases for typeahead.
+
+    Every node keeps the top ranked players of its subtree, computed once per build, so a
+    suggestion is a walk of len(prefix) nodes plus a slice, independent of the roster size.
+    Players are ranked by search popularity, then alphabetically.
+    """
+
+    def __init__(self):
+        self.root = TrieNode()
+        self.player_names: list[str] = []
+        self.popularity: dict[str, int] = {}
+        self.max_results = 0
+        # Inputs the trie was built from, to skip rebuilds when nothing changed
+        self.source: tuple | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return len(self.player_names) > 0
+
+    def build(
+        self, player_names: list[str], players_aliases: list[dict], popularity: dict[str, int], max_results: int
+    ) -> None:
+        player_ids = {}
+        display_names: list[str] = []
+        keys: list[tuple[str, int]] = []
+
+        def add_player(player_name: str) -> int:
+            folded_name = fold_player_name(player_name)
+            if folded_name not in player_ids:
+                player_ids[folded_name] = len(player_ids)
+                display_names.append(player_name)
+                tokens = folded_name.split()
+                keys.extend((" ".join(tokens[i:]), player_ids[folded_name]) for i in range(len(tokens)))
+            return player_ids[folded_name]
+
+        for player_name in player_names:
+            add_player(player_name)
+        for player in players_aliases:
+            player_id = add_player(player["full_name"])
+            keys.extend((fold_player_name(alias), player_id) for alias in player["aliases"])
+
+        root = TrieNode()
+        for key, player_id in keys:
+            node = root
+            for char in key:
+                node = node.children.setdefault(char, TrieNode())
+            node.player_ids.add(player_id)
+
+        rank = sorted(
+            range(len(display_names)),
+            key=lambda i: (-popularity.get(fold_player_name(display_names[i]), 0), display_names[i]),
+        )
+        rank_of = {player_id: position for position, player_id in enumerate(rank)}
+        self._compute_top_player_ids(root, rank_of, max_results)
+
+        self.root = root
+        self.player_names = display_names
+        self.popularity = popularity
+        self.max_results = max_results
+        logger.info(f"Built player suggest trie with {len(display_names)} players and {len(keys)} keys")
+
+    @staticmethod
+    def _compute_top_player_ids(root: TrieNode, rank_of: dict[int, int], max_results: int) -> None:
+        # Iterative post-order walk, children are finished before their parent merges them
+        stack = [(root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children.values())
+                continue
+            candidates = set(node.player_ids)
+            for child in node.children.values():
+                candidates.update(child.top_player_ids)
+            node.top_player_ids = sorted(candidates, key=rank_of.__getitem__)[:max_results]
+
+    def suggest(self, prefix: str, limit: int) -> list[dict]:
+        node = self.root
+        for char in fold_player_name(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [
+            {
+                "player_name": self.player_names[player_id],
+                "popularity": self.popularity.get(fold_player_name(self.player_names[player_id]), 0),
+            }
+            for player_id in node.top_player_ids[:limit]
+        ]
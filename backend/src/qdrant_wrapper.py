@@ -1,17 +1,81 @@
-import asyncio
 from datetime import datetime
 import re
 import uuid
-from qdrant_client import QdrantClient
-from qdrant_client.models import PointStruct, Filter, FieldCondition, MatchText, Range
+from typing import NamedTuple
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.models import (
+    Distance,
+    HnswConfigDiff,
+    PointStruct,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+    Filter,
+    FieldCondition,
+    HasIdCondition,
+    MatchAny,
+    MatchText,
+    MatchValue,
+    PayloadSchemaType,
+    Range,
+    Record,
+    ScoredPoint,
+    SearchRequest,
+    TextIndexParams,
+    TokenizerType,
+)
 from shared.utils.app_logger import logger
+from backend.utils.search_results import SEARCH_RESULT_PAYLOAD_FIELDS
 from backend.src.embeddings import PlayerEmbeddings
+from backend.src.search_metrics import qdrant_request
 from shared.config import settings
 import pandas as pd
 from tqdm import tqdm
 from pprint import pformat
 from tasks.data_loading.process_data import fetch_all_players_from_local_files
 
+# Boolean payload flags for the position filters the API offers, so they don't need a text match
+POSITION_FLAG_FIELDS = {"Guard": "POS_GUARD", "Forward": "POS_FORWARD", "Center": "POS_CENTER"}
+
+DISTANCE_METRICS = {"Cosine": Distance.COSINE, "Dot": Distance.DOT, "Euclidean": Distance.EUCLID}
+
+PAYLOAD_INDEXES = {
+    "PLAYER_NAME_LOWER_CASE": PayloadSchemaType.KEYWORD,
+    "POSITION": TextIndexParams(type="text", tokenizer=TokenizerType.WORD, lowercase=True),
+    "LAST_PLAYED_YEAR": PayloadSchemaType.INTEGER,
+    **{flag_field: PayloadSchemaType.BOOL for flag_field in POSITION_FLAG_FIELDS.values()},
+}
+
+
+def position_tokens(position: str) -> list[str]:
+    """Words of a position capitalized like the stored ones, e.g. 'forward-guard' -> ['Forward', 'Guard'].
+
+    A position filter keeps the players whose position has every word of the filter, in any case
+    and order: what MatchText does on the lowercased word-tokenized POSITION index. Qdrant filters
+    and the NumPy masks both go through this, so every search path matches the same players.
+    """
+    return list(dict.fromkeys(word.capitalize() for word in re.findall(r"[0-9A-Za-z]+", position)))
+
+
+class SimilarPlayersQuery(NamedTuple):
+    """One similar-players search: filters, the result window, a score cutoff and points to leave out."""
+
+    query_vector: list
+    position: str | None = None
+    era: str | None = None
+    # None means settings.QDRANT_VECTOR_SEARCH_LIMIT
+    limit: int | None = None
+    offset: int = 0
+    # Minimum score, or maximum distance for Euclidean, as in Qdrant's score_threshold
+    score_threshold: float | None = None
+    # Usually the searched players' own points, excluded inside the filter instead of afterwards
+    exclude_ids: list | None = None
+    # The same players by lowercased name, which still holds when exclude_ids come from a stale in-memory index
+    exclude_player_names: list | None = None
+
 
 class QdrantClientWrapper:
     def __init__(self, host: str, port: int, collection_name: str):
@@ -31,31 +95,87 @@ class QdrantClientWrapper:
         existing_collections = [c.name for c in self.client.get_collections().collections]
         logger.info(f"Found existing collections: {existing_collections}")
 
-        if self.collection_name in existing_collections:
+        self._initialize_collection(self.collection_name, vector_size, reset_collection, existing_collections)
+        self.create_payload_indexes()
+        if settings.QDRANT_DEBUG_COLLECTION_ENABLED:
+            self._initialize_collection(
+                self.debug_collection_name, vector_size, reset_collection, existing_collections, on_disk_payload=True
+            )
+
+    def _initialize_collection(
+        self,
+        collection_name: str,
+        vector_size: int,
+        reset_collection: bool,
+        existing_collections: list[str],
+        on_disk_payload: bool = False,
+    ) -> None:
+        if collection_name in existing_collections:
             if reset_collection:
-                logger.info(f"Resetting collection '{self.collection_name}'...")
-                self.client.delete_collection(self.collection_name)
+                logger.info(f"Resetting collection '{collection_name}'...")
+                self.client.delete_collection(collection_name)
             else:
-                logger.info(f"Collection '{self.collection_name}' already exists. Skipping reset.")
+                logger.info(f"Collection '{collection_name}' already exists. Skipping reset.")
                 return
 
-        logger.info(f"Creating collection: '{self.collection_name}'...")
+        logger.info(f"Creating collection: '{collection_name}'...")
         self.client.create_collection(
-            self.collection_name,
-            vectors_config={
-                "size": vector_size,
-                "distance": settings.QDRANT_VECTOR_DISTANCE_METRIC,
-            },
+            collection_name,
+            vectors_config=VectorParams(
+                size=vector_size,
+                distance=DISTANCE_METRICS[settings.QDRANT_VECTOR_DISTANCE_METRIC],
+                on_disk=settings.QDRANT_VECTORS_ON_DISK,
+            ),
+            hnsw_config=HnswConfigDiff(m=settings.QDRANT_HNSW_M, ef_construct=settings.QDRANT_HNSW_EF_CONSTRUCT),
+            quantization_config=self._build_quantization_config(),
+            on_disk_payload=on_disk_payload or settings.QDRANT_PAYLOAD_ON_DISK,
         )
 
     @staticmethod
-    def _row_to_point(row) -> PointStruct:
+    def _build_quantization_config() -> ScalarQuantization | None:
+        if not settings.QDRANT_QUANTIZATION_ENABLED:
+            return None
+        # Quantized vectors stay in RAM even when the original vectors are on disk; rescoring reads those
+        return ScalarQuantization(scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True))
+
+    @staticmethod
+    def _build_search_params() -> SearchParams | None:
+        """Search-time HNSW/quantization options, or None to use the collection defaults."""
+        quantization = None
+        if settings.QDRANT_QUANTIZATION_ENABLED:
+            quantization = QuantizationSearchParams(
+                rescore=settings.QDRANT_QUANTIZATION_RESCORE, oversampling=settings.QDRANT_QUANTIZATION_OVERSAMPLING
+            )
+        if settings.QDRANT_HNSW_EF is None and quantization is None:
+            return None
+        return SearchParams(hnsw_ef=settings.QDRANT_HNSW_EF, quantization=quantization)
+
+    def create_payload_indexes(self) -> None:
+        """Index every payload field the API filters on. Creating an existing index is a no-op."""
+        for field_name, field_schema in PAYLOAD_INDEXES.items():
+            self.client.create_payload_index(
+                collection_name=self.collection_name, field_name=field_name, field_schema=field_schema, wait=True
+            )
+        logger.info(f"Created payload indexes on {list(PAYLOAD_INDEXES)} for collection '{self.collection_name}'")
+
+    @property
+    def debug_collection_name(self) -> str:
+        return f"{self.collection_name}_debug"
+
+    @staticmethod
+    def _row_to_serving_payload(row) -> dict:
+        """Payload of the main collection: only what the API filters on, indexes or returns."""
         # Convert metadata values to native Python types to avoid error
         # "Unable to serialize unknown type: <class 'numpy.int64'>"
-        metadata = {
+        return {
+            "PLAYER_ID": int(row.get("PLAYER_ID", 0)),
             "PLAYER_NAME": str(row["PLAYER_NAME"]),
             "PLAYER_NAME_LOWER_CASE": str(row["PLAYER_NAME"]).lower(),
             "POSITION": str(row.get("POSITION", "Unknown")),
+            **{
+                flag_field: position in str(row.get("POSITION", "Unknown"))
+                for position, flag_field in POSITION_FLAG_FIELDS.items()
+            },
             "HEIGHT_INCHES": int(row.get("HEIGHT_INCHES", 0)),
             "WEIGHT": int(row.get("WEIGHT", 0)),
             "PTS_PER_GAME": float(row["PTS_PER_GAME"]),
@@ -84,11 +204,14 @@ class QdrantClientWrapper:
             "LAST_PLAYED_SEASON": str(row["LAST_PLAYED_SEASON"]),
             "LAST_PLAYED_YEAR": int(str(row["LAST_PLAYED_SEASON"])[:4]) if row.get("LAST_PLAYED_SEASON") else 0,
             "TOTAL_SEASONS": int(row["TOTAL_SEASONS"]),
-            "CREATED_AT": datetime.now().isoformat(),
         }
 
-        # Mainly added for debugging purposes
-        normalized_metadata = {
+    @staticmethod
+    def _row_to_debug_payload(row) -> dict:
+        """Normalized stats behind the embedding, kept in the on-disk debug collection only."""
+        return {
+            "PLAYER_NAME": str(row["PLAYER_NAME"]),
+            "CREATED_AT": datetime.now().isoformat(),
             "NORMALIZED_PTS_PER_GAME": float(row["NORM_PTS_PER_GAME"]),
             "NORMALIZED_REB_PER_GAME": float(row["NORM_REB_PER_GAME"]),
             "NORMALIZED_AST_PER_GAME": float(row["NORM_AST_PER_GAME"]),
@@ -114,50 +237,58 @@ class QdrantClientWrapper:
             "NORMALIZED_TOTAL_SEASONS": float(row["NORM_TOTAL_SEASONS"]),
             "NORMALIZED_HEIGHT_INCHES": float(row["NORM_HEIGHT_INCHES"]),
             "NORMALIZED_WEIGHT": float(row["NORM_WEIGHT"]),
-            "EMBEDDINGS": str(row["embeddings"]),
         }
 
-        data_payload = {**metadata, **normalized_metadata}
-        return PointStruct(
-            id=str(uuid.uuid4()),
-            vector=row["embeddings"],
-            payload=data_payload,
-        )
+    @classmethod
+    def _row_to_points(cls, row) -> tuple[PointStruct, PointStruct]:
+        """Serving and debug points for one player, sharing the same id so they can be joined."""
+        point_id = str(uuid.uuid4())
+        serving_point = PointStruct(id=point_id, vector=row["embeddings"], payload=cls._row_to_serving_payload(row))
+        debug_point = PointStruct(id=point_id, vector=row["embeddings"], payload=cls._row_to_debug_payload(row))
+        return serving_point, debug_point
 
     def upsert_players_data_to_qdrant(self, all_players_df: pd.DataFrame, batch_size: int = 100) -> None:
-        batch = []
+        batch, debug_batch = [], []
         total = len(all_players_df)
 
         for _, row in tqdm(all_players_df.iterrows(), total=total, desc="Upserting players to Qdrant"):
-            batch.append(self._row_to_point(row))
+            serving_point, debug_point = self._row_to_points(row)
+            batch.append(serving_point)
+            debug_batch.append(debug_point)
 
             if len(batch) >= batch_size:
-                self.client.upsert(collection_name=self.collection_name, points=batch)
-                batch = []
+                self._upsert_batch(batch, debug_batch)
+                batch, debug_batch = [], []
 
         if batch:
-            self.client.upsert(collection_name=self.collection_name, points=batch)
+            self._upsert_batch(batch, debug_batch)
 
         logger.info(f"Upserted {total} players to Qdrant.")
 
+    def _upsert_batch(self, batch: list[PointStruct], debug_batch: list[PointStruct]) -> None:
+        self.client.upsert(collection_name=self.collection_name, points=batch)
+        if settings.QDRANT_DEBUG_COLLECTION_ENABLED:
+            self.client.upsert(collection_name=self.debug_collection_name, points=debug_batch)
+
     def store_players_embedding(
         self,
         data_dir: str,
-    ) -> None:
+    ) -> pd.DataFrame:
         players_stats_df = fetch_all_players_from_local_files(data_dir)
         logger.debug(f"Processing players list of length {len(players_stats_df)} for embeddings and metadata...")
         embeddings_creator = PlayerEmbeddings(players_stats_df)
         processed_df = embeddings_creator.create_players_embeddings()
         self.upsert_players_data_to_qdrant(processed_df)
+        return processed_df
 
     def search_players_by_name(self, player_name: str) -> tuple[list, list]:
         player_name_lower = player_name.lower()
         logger.info(f"Searching for player {player_name} in Qdrant collection '{self.collection_name}'")
         results, _ = self.client.scroll(
             collection_name=self.collection_name,
-            scroll_filter={"must": [{"key": "PLAYER_NAME_LOWER_CASE", "match": {"value": player_name_lower}}]},
+            scroll_filter=self._player_names_filter([player_name_lower]),
             with_vectors=True,  # we need the vector to search for the player
-            with_payload=True,  # Need payload for stats or embeddings
+            with_payload=SEARCH_RESULT_PAYLOAD_FIELDS,  # Only the fields the response formatters read
             limit=1,  # Only fetch one point
         )
 
@@ -174,7 +305,57 @@ class QdrantClientWrapper:
             raise ValueError(f"Player {player_name} not found in Qdrant.")
 
     @staticmethod
-    def _era_to_year_range(era: str) -> tuple[int, int]:
+    def _player_names_filter(player_names_lower: list[str]) -> Filter:
+        return Filter(must=[FieldCondition(key="PLAYER_NAME_LOWER_CASE", match=MatchAny(any=player_names_lower))])
+
+    def search_players_by_names(self, player_names: list[str]) -> dict[str, Record]:
+        """Fetch several players with a single scroll, keyed by lowercased player name."""
+        player_names_lower = list(dict.fromkeys(name.lower() for name in player_names))
+        if not player_names_lower:
+            return {}
+        logger.info(f"Searching for {len(player_names_lower)} players in Qdrant collection '{self.collection_name}'")
+        results, _ = self.client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=self._player_names_filter(player_names_lower),
+            with_vectors=True,
+            with_payload=SEARCH_RESULT_PAYLOAD_FIELDS,
+            limit=len(player_names_lower),
+        )
+        return {record.payload["PLAYER_NAME_LOWER_CASE"]: record for record in results}
+
+    def fetch_all_players(self, batch_size: int = 1000) -> list[Record]:
+        """Scroll through the whole collection and return every point with its vector and payload."""
+        records = []
+        offset = None
+        while True:
+            batch, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                limit=batch_size,
+                offset=offset,
+                with_vectors=True,
+                with_payload=True,
+            )
+            records.extend(batch)
+            if offset is None:
+                break
+        logger.info(f"Fetched {len(records)} players from Qdrant collection '{self.collection_name}'")
+        return records
+
+    def get_collection_signature(self) -> tuple[int, str | int | None]:
+        """Cheap fingerprint of the collection contents: point count plus the first point id.
+
+        Point ids are random UUIDs generated at ingest, so a re-ingest changes the signature
+        even when the number of players stays the same.
+        """
+        points_count = self.client.count(collection_name=self.collection_name, exact=True).count
+        first_points, _ = self.client.scroll(
+            collection_name=self.collection_name, limit=1, with_payload=False, with_vectors=False
+        )
+        first_point_id = first_points[0].id if first_points else None
+        return points_count, first_point_id
+
+    @staticmethod
+    def era_to_year_range(era: str) -> tuple[int, int]:
         """Convert a decade string like '1990s' to a numeric year range.
 
         Returns (decade_start, decade_end) inclusive, e.g. (1990, 1999).
@@ -186,17 +367,33 @@ class QdrantClientWrapper:
         return decade_start, decade_end
 
     @staticmethod
-    def _build_search_filter(position: str = None, era: str = None) -> Filter | None:
-        """Build a Qdrant Filter with optional position and era conditions."""
+    def validate_search_filter(position: str = None, era: str = None) -> None:
+        """Raise ValueError for filters a search would reject, so callers can report them up front."""
+        QdrantClientWrapper._build_search_filter(position=position, era=era)
+
+    @staticmethod
+    def _build_search_filter(
+        position: str = None,
+        era: str = None,
+        exclude_ids: list = None,
+        position_flags: bool = True,
+        exclude_player_names: list = None,
+    ) -> Filter | None:
+        """Build a Qdrant Filter with optional position and era conditions, excluding the given points and players.
+
+        Without position_flags (collections ingested before the POS_* flags) every position word is a text match.
+        """
         conditions = []
 
-        if position:
-            conditions.append(
-                FieldCondition(key="POSITION", match=MatchText(text=position))
-            )
+        for position_token in position_tokens(position) if position else []:
+            if position_flags and position_token in POSITION_FLAG_FIELDS:
+                flag_field = POSITION_FLAG_FIELDS[position_token]
+                conditions.append(FieldCondition(key=flag_field, match=MatchValue(value=True)))
+            else:
+                conditions.append(FieldCondition(key="POSITION", match=MatchText(text=position_token)))
 
         if era:
-            decade_start, decade_end = QdrantClientWrapper._era_to_year_range(era)
+            decade_start, decade_end = QdrantClientWrapper.era_to_year_range(era)
             conditions.append(
                 FieldCondition(
                     key="LAST_PLAYED_YEAR",
@@ -204,31 +401,238 @@ class QdrantClientWrapper:
                 )
             )
 
-        if conditions:
-            return Filter(must=conditions)
+        must_not = []
+        if exclude_ids:
+            must_not.append(HasIdCondition(has_id=list(exclude_ids)))
+        if exclude_player_names:
+            names = [player_name.lower() for player_name in exclude_player_names]
+            must_not.append(FieldCondition(key="PLAYER_NAME_LOWER_CASE", match=MatchAny(any=names)))
+        must_not = must_not or None
+        if conditions or must_not:
+            return Filter(must=conditions or None, must_not=must_not)
         return None
 
-    def search_similar_players(self, query_vector: list, position: str = None, era: str = None) -> list:
-        query_filter = self._build_search_filter(position=position, era=era)
+    def search_similar_players(
+        self,
+        query_vector: list,
+        position: str = None,
+        era: str = None,
+        limit: int = None,
+        offset: int = 0,
+        score_threshold: float = None,
+        exclude_ids: list = None,
+        exclude_player_names: list = None,
+    ) -> list:
         results = self.client.search(
             collection_name=self.collection_name,
             query_vector=query_vector,
-            query_filter=query_filter,
-            limit=settings.QDRANT_VECTOR_SEARCH_LIMIT,
-            with_payload=True,
+            query_filter=self._build_search_filter(
+                position=position, era=era, exclude_ids=exclude_ids, exclude_player_names=exclude_player_names
+            ),
+            search_params=self._build_search_params(),
+            limit=limit or settings.QDRANT_VECTOR_SEARCH_LIMIT,
+            offset=offset,
+            score_threshold=score_threshold,
+            with_payload=SEARCH_RESULT_PAYLOAD_FIELDS,
         )
         return results
 
+    @classmethod
+    def _build_search_requests(
+        cls, queries: list[SimilarPlayersQuery], position_flags: bool = True
+    ) -> list[SearchRequest]:
+        return [
+            SearchRequest(
+                vector=query.query_vector,
+                filter=cls._build_search_filter(
+                    position=query.position,
+                    era=query.era,
+                    exclude_ids=query.exclude_ids,
+                    position_flags=position_flags,
+                    exclude_player_names=query.exclude_player_names,
+                ),
+                params=cls._build_search_params(),
+                limit=query.limit or settings.QDRANT_VECTOR_SEARCH_LIMIT,
+                offset=query.offset,
+                score_threshold=query.score_threshold,
+                with_payload=SEARCH_RESULT_PAYLOAD_FIELDS,
+            )
+            for query in queries
+        ]
+
+    def search_similar_players_batch(self, queries: list[SimilarPlayersQuery]) -> list[list[ScoredPoint]]:
+        """Run several searches in one search_batch call."""
+        if not queries:
+            return []
+        return self.client.search_batch(
+            collection_name=self.collection_name, requests=self._build_search_requests(queries)
+        )
 
-class AsyncQdrantClientWrapper(QdrantClientWrapper):
-    """Async wrapper around QdrantClientWrapper for use with FastAPI.
 
-    Delegates to the sync methods via asyncio.to_thread to avoid
-    blocking the event loop.
+class AsyncQdrantClientWrapper:
+    """Async Qdrant access for FastAPI, built on the native AsyncQdrantClient.
+
+    The client and its connection pool (HTTP/2 keep-alive or a gRPC channel when prefer_grpc
+    is set) are created once by connect() in the app lifespan and shared by every request
+    until close(). Filters and requests are built with the same helpers as QdrantClientWrapper.
     """
 
+    def __init__(
+        self, host: str, port: int, collection_name: str, prefer_grpc: bool = False, grpc_port: int = 6334
+    ):
+        self.host = host
+        self.port = port
+        self.grpc_port = grpc_port
+        self.prefer_grpc = prefer_grpc
+        self.collection_name = collection_name
+        self.client: AsyncQdrantClient | None = None
+        # Whether position filters can use the POS_* flags, see check_position_flags
+        self.position_flags = True
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def connect(self) -> None:
+        if self.client is not None:
+            return
+        self.client = AsyncQdrantClient(
+            host=self.host, port=self.port, grpc_port=self.grpc_port, prefer_grpc=self.prefer_grpc
+        )
+        transport = f"gRPC on port {self.grpc_port}" if self.prefer_grpc else f"REST on port {self.port}"
+        logger.info(f"Connected async Qdrant client to {self.host} using {transport}")
+
+    async def close(self) -> None:
+        if self.client is None:
+            return
+        await self.client.close()
+        self.client = None
+        logger.info("Closed async Qdrant client")
+
+    async def check_position_flags(self) -> bool:
+        """Use the POS_* flags in position filters only when the collection has their payload indexes.
+
+        Both come with an ingest since the flags were added, older collections get text matches until re-ingested.
+        """
+        with qdrant_request("get_collection"):
+            collection_info = await self.client.get_collection(self.collection_name)
+        indexed_fields = collection_info.payload_schema or {}
+        missing_flag_fields = [field for field in POSITION_FLAG_FIELDS.values() if field not in indexed_fields]
+        if missing_flag_fields and self.position_flags:
+            logger.warning(
+                f"Collection '{self.collection_name}' has no {missing_flag_fields} payload indexes, position filters"
+                " use text matches until the data is re-ingested"
+            )
+        self.position_flags = not missing_flag_fields
+        return self.position_flags
+
     async def search_players_by_name(self, player_name: str) -> tuple[list, list]:
-        return await asyncio.to_thread(super().search_players_by_name, player_name)
+        player_name_lower = player_name.lower()
+        logger.info(f"Searching for player {player_name} in Qdrant collection '{self.collection_name}'")
+        with qdrant_request("scroll"):
+            results, _ = await self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=QdrantClientWrapper._player_names_filter([player_name_lower]),
+                with_vectors=True,
+                with_payload=SEARCH_RESULT_PAYLOAD_FIELDS,
+                limit=1,
+            )
+        if not results:
+            raise ValueError(f"Player {player_name} not found in Qdrant.")
+        logger.info(f"Found results: {len(results)} for player '{player_name}' in collection '{self.collection_name}'")
+        return results[0].vector, results
+
+    async def search_players_by_names(self, player_names: list[str]) -> dict[str, Record]:
+        player_names_lower = list(dict.fromkeys(name.lower() for name in player_names))
+        if not player_names_lower:
+            return {}
+        logger.info(f"Searching for {len(player_names_lower)} players in Qdrant collection '{self.collection_name}'")
+        with qdrant_request("scroll"):
+            results, _ = await self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=QdrantClientWrapper._player_names_filter(player_names_lower),
+                with_vectors=True,
+                with_payload=SEARCH_RESULT_PAYLOAD_FIELDS,
+                limit=len(player_names_lower),
+            )
+        return {record.payload["PLAYER_NAME_LOWER_CASE"]: record for record in results}
 
-    async def search_similar_players(self, query_vector: list, position: str = None, era: str = None) -> list:
-        return await asyncio.to_thread(super().search_similar_players, query_vector, position, era)
+    async def search_similar_players(
+        self,
+        query_vector: list,
+        position: str = None,
+        era: str = None,
+        limit: int = None,
+        offset: int = 0,
+        score_threshold: float = None,
+        exclude_ids: list = None,
+        exclude_player_names: list = None,
+    ) -> list:
+        with qdrant_request("search"):
+            return await self.client.search(
+                collection_name=self.collection_name,
+                query_vector=query_vector,
+                query_filter=QdrantClientWrapper._build_search_filter(
+                    position=position,
+                    era=era,
+                    exclude_ids=exclude_ids,
+                    position_flags=self.position_flags,
+                    exclude_player_names=exclude_player_names,
+                ),
+                search_params=QdrantClientWrapper._build_search_params(),
+                limit=limit or settings.QDRANT_VECTOR_SEARCH_LIMIT,
+                offset=offset,
+                score_threshold=score_threshold,
+                with_payload=SEARCH_RESULT_PAYLOAD_FIELDS,
+            )
+
+    async def search_similar_players_batch(self, queries: list[SimilarPlayersQuery]) -> list[list[ScoredPoint]]:
+        if not queries:
+            return []
+        with qdrant_request("search_batch"):
+            return await self.client.search_batch(
+                collection_name=self.collection_name,
+                requests=QdrantClientWrapper._build_search_requests(queries, position_flags=self.position_flags),
+            )
+
+    async def sample_players(self, limit: int) -> list[Record]:
+        """The first points of the collection, whatever players it holds."""
+        with qdrant_request("scroll"):
+            records, _ = await self.client.scroll(
+                collection_name=self.collection_name,
+                limit=limit,
+                with_vectors=True,
+                with_payload=SEARCH_RESULT_PAYLOAD_FIELDS,
+            )
+        return records
+
+    async def fetch_all_players(self, batch_size: int = 1000) -> list[Record]:
+        records = []
+        offset = None
+        while True:
+            with qdrant_request("scroll"):
+                batch, offset = await self.client.scroll(
+                    collection_name=self.collection_name,
+                    limit=batch_size,
+                    offset=offset,
+                    with_vectors=True,
+                    with_payload=True,
+                )
+            records.extend(batch)
+            if offset is None:
+                break
+        logger.info(f"Fetched {len(records)} players from Qdrant collection '{self.collection_name}'")
+        return records
+
+    async def get_collection_signature(self) -> tuple[int, str | int | None]:
+        with qdrant_request("count"):
+            points_count = (await self.client.count(collection_name=self.collection_name, exact=True)).count
+        with qdrant_request("scroll"):
+            first_points, _ = await self.client.scroll(
+                collection_name=self.collection_name, limit=1, with_payload=False, with_vectors=False
+            )
+        first_point_id = first_points[0].id if first_points else None
+        return points_count, first_point_id
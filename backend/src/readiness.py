@@ -0,0 +1,48 @@
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from shared.utils.app_logger import logger
+
+
+class Readiness:
+    """Outcome of the API's startup checks and whether it can take traffic, as reported by /ready.
+
+    Every check records whether it passed and how long it took. The API is ready once all
+    required checks passed; optional ones (e.g. the in-memory indexes, which have a Qdrant
+    fallback) only show up in the report.
+    """
+
+    def __init__(self):
+        self.checks: dict[str, dict] = {}
+        self.ready = False
+        self.ready_at: str | None = None
+        self.attempts = 0
+
+    @asynccontextmanager
+    async def check(self, name: str, required: bool = True):
+        """Run the wrapped block as a named check; a failure is recorded and logged instead of raised."""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            logger.error(f"Startup check '{name}' failed: {e}")
+            self.checks[name] = {"ok": False, "required": required, "error": str(e)}
+        else:
+            self.checks[name] = {"ok": True, "required": required}
+        self.checks[name]["duration_ms"] = round((time.perf_counter() - start) * 1000, 2)
+
+    def start_attempt(self) -> None:
+        self.checks = {}
+        self.attempts += 1
+
+    def finish_attempt(self) -> bool:
+        self.ready = all(check["ok"] for check in self.checks.values() if check["required"])
+        if self.ready:
+            self.ready_at = datetime.now(timezone.utc).isoformat()
+            logger.info(f"API is ready after {self.attempts} warm-up attempt(s): {self.checks}")
+        else:
+            logger.warning(f"API is not ready after warm-up attempt {self.attempts}: {self.checks}")
+        return self.ready
+
+    def status(self) -> dict:
+        return {"ready": self.ready, "ready_at": self.ready_at, "attempts": self.attempts, "checks": self.checks}
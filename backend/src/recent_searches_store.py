@@ -2,45 +2,254 @@ import json
 import os
 import tempfile
 import threading
+from collections import Counter, deque
+from contextlib import contextmanager
+from itertools import islice
 from datetime import datetime, timedelta
 from datetime import timezone as _tz
 
+import portalocker
+
+from backend.src.player_name_index import fold_player_name
 from shared.config import settings
 from shared.utils.app_logger import logger
 
 MAX_ENTRIES = 5000
+# Searches without results don't count for their player, their name is whatever was typed
+RESULTS_FOUND_KEYS = {True: "found", False: "not_found"}
+
+
+class SearchAggregates:
+    """Counts of the buffered searches per player, position, era, country and results_found.
+
+    Updated entry by entry as searches enter and leave the buffer, so they cover the same
+    rolling window without ever replaying the log. Empty values are not counted.
+    """
+
+    FIELDS = ["player_name", "position", "era", "country", "results_found"]
+
+    def __init__(self):
+        self.searches = 0
+        self.counts: dict[str, Counter] = {field: Counter() for field in self.FIELDS}
+
+    @staticmethod
+    def _counted_values(entry: dict):
+        results_found = entry.get("results_found")
+        if results_found in RESULTS_FOUND_KEYS:
+            yield "results_found", RESULTS_FOUND_KEYS[results_found]
+        if entry.get("player_name") and results_found is not False:
+            # Folded like the name index, so "Nikola Jokić" and "nikola jokic" are one player
+            yield "player_name", fold_player_name(entry["player_name"])
+        for field in ["position", "era", "country"]:
+            if entry.get(field):
+                yield field, entry[field]
+
+    def _update(self, entry: dict, delta: int) -> None:
+        self.searches += delta
+        for field, value in self._counted_values(entry):
+            counter = self.counts[field]
+            counter[value] += delta
+            if counter[value] <= 0:
+                del counter[value]
+
+    def add(self, entry: dict) -> None:
+        self._update(entry, 1)
+
+    def remove(self, entry: dict) -> None:
+        self._update(entry, -1)
+
+    def clear(self) -> None:
+        self.searches = 0
+        for counter in self.counts.values():
+            counter.clear()
+
+    def summary(self, top: int) -> dict:
+        """Top players and countries, all positions and eras, and the share of searches that found nothing."""
+        found, not_found = (self.counts["results_found"][key] for key in RESULTS_FOUND_KEYS.values())
+        return {
+            "searches": self.searches,
+            "top_players": [
+                {"player_name": player_name, "searches": count}
+                for player_name, count in self.counts["player_name"].most_common(top)
+            ],
+            "positions": dict(self.counts["position"].most_common()),
+            "eras": dict(self.counts["era"].most_common()),
+            "countries": dict(self.counts["country"].most_common(top)),
+            "results_found": {"found": found, "not_found": not_found},
+            "zero_result_rate": round(not_found / (found + not_found), 4) if found + not_found else None,
+        }
 
 
 class RecentSearchesStore:
+    """Recent searches kept in an append-only JSON Lines log, one compact record per search.
+
+    Recording a search appends a single line, so its cost doesn't depend on how many searches
+    are retained. Expired entries and entries beyond MAX_ENTRIES stay in the log until compact()
+    rewrites it, which the API runs periodically in the background; readers skip them meanwhile.
+
+    Reads are served from an in-memory buffer of the live entries, newest first. Own appends
+    update it directly; appends and compactions by other processes are picked up by a stat()
+    of the log on each read, reading only the bytes past the last known offset (or the whole
+    log once its inode changed).
+
+    SearchAggregates over the buffer are kept in step with it, for analytics and popularity.
+
+    Several processes (uvicorn workers) can share the log. Appends hold a shared lock on a
+    sidecar '.lock' file, so they still run concurrently, each a single O_APPEND write; whatever
+    rewrites or truncates the log holds it exclusively, so no append lands in a replaced file.
+    """
+
     def __init__(self, file_path: str, ttl_days: int):
         self.file_path = file_path
         self.ttl_days = ttl_days
         self._lock = threading.Lock()
+        self._lock_file_path = self.file_path + ".lock"
+        self._recent_entries: deque[dict] = deque()
+        self._aggregates = SearchAggregates()
+        # Inode and size of the log as far as it has been read into _recent_entries
+        self._log_inode: int | None = None
+        self._log_offset = 0
         os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        with self._log_lock(exclusive=True):
+            self._migrate_legacy_json_file()
+            self._truncate_partial_line()
+        self._load_log()
+
+    @contextmanager
+    def _log_lock(self, exclusive: bool):
+        """Lock of the log across processes, held shared by appends and exclusively by rewrites."""
+        with open(self._lock_file_path, "a") as lock_file:
+            portalocker.lock(lock_file, portalocker.LOCK_EX if exclusive else portalocker.LOCK_SH)
+            yield
+
+    def _migrate_legacy_json_file(self) -> None:
+        """One-time import of the JSON array file the store used before the log, kept as is afterwards."""
+        legacy_file_path = os.path.splitext(self.file_path)[0] + ".json"
+        if legacy_file_path == self.file_path or os.path.exists(self.file_path):
+            return
+        if not os.path.exists(legacy_file_path):
+            return
+        try:
+            with open(legacy_file_path, "r") as f:
+                entries = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not migrate recent searches from {legacy_file_path}: {e}")
+            return
+        entries = [entry for entry in entries if isinstance(entry, dict)] if isinstance(entries, list) else []
+        self._write(sorted(entries, key=lambda e: e.get("searched_at", "")))
+        logger.info(f"Migrated {len(entries)} recent searches from {legacy_file_path} to {self.file_path}")
+
+    def _truncate_partial_line(self) -> None:
+        """Drop a last line cut short by a crash mid-append, so the next append starts on a line of its own."""
+        if not os.path.exists(self.file_path):
+            return
+        with open(self.file_path, "rb+") as f:
+            content_end = f.seek(0, os.SEEK_END)
+            if content_end == 0:
+                return
+            f.seek(max(content_end - 64 * 1024, 0))
+            tail = f.read()
+            if tail.endswith(b"\n"):
+                return
+            f.truncate(content_end - len(tail) + tail.rfind(b"\n") + 1)
+        logger.warning(f"Removed a partially written last line from {self.file_path}")
+
+    @staticmethod
+    def _parse_lines(data: bytes) -> tuple[list[dict], int]:
+        """Entries of the complete lines in data and their length in bytes.
+
+        A trailing partial line is left for the next read, another process may still be appending it.
+        """
+        complete_data = data[: data.rfind(b"\n") + 1]
+        entries = []
+        for line in complete_data.splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A line cut short by a crash mid-append, the rest of the log is still valid
+                continue
+            if isinstance(entry, dict):
+                entries.append(entry)
+        return entries, len(complete_data)
 
     def _read(self) -> list[dict]:
         if not os.path.exists(self.file_path):
             return []
+        with open(self.file_path, "rb") as f:
+            return self._parse_lines(f.read())[0]
+
+    def _load_log(self, full_reload: bool = True) -> None:
+        """Read the log into the buffer from the known offset, or all of it when replaced (compacted) or truncated."""
         try:
-            with open(self.file_path, "r") as f:
-                data = json.load(f)
-                return data if isinstance(data, list) else []
-        except (json.JSONDecodeError, ValueError):
-            logger.warning(f"Corrupt recent searches file at {self.file_path}, resetting.")
-            return []
+            f = open(self.file_path, "rb")
+        except FileNotFoundError:
+            self._clear_recent_entries()
+            self._log_inode, self._log_offset = None, 0
+            return
+        with f:
+            stat = os.fstat(f.fileno())
+            if full_reload or stat.st_ino != self._log_inode or stat.st_size < self._log_offset:
+                self._clear_recent_entries()
+                self._log_offset = 0
+            f.seek(self._log_offset)
+            entries, bytes_read = self._parse_lines(f.read())
+        self._log_inode = stat.st_ino
+        self._log_offset += bytes_read
+        self._add_recent_entries(entries)
+
+    def _clear_recent_entries(self) -> None:
+        self._recent_entries.clear()
+        self._aggregates.clear()
+
+    def _pop_oldest_entry(self) -> None:
+        self._aggregates.remove(self._recent_entries.pop())
+
+    def _add_recent_entries(self, entries: list[dict]) -> None:
+        entries = sorted(self._purge_expired(entries), key=lambda e: e["searched_at"])[-MAX_ENTRIES:]
+        if not entries:
+            return
+        if self._recent_entries and entries[0]["searched_at"] < self._recent_entries[0]["searched_at"]:
+            # Older than something buffered, only after another process's append raced ours: rebuilt in order
+            entries = sorted([*self._recent_entries, *entries], key=lambda e: e["searched_at"])[-MAX_ENTRIES:]
+            self._clear_recent_entries()
+        while self._recent_entries and len(self._recent_entries) + len(entries) > MAX_ENTRIES:
+            self._pop_oldest_entry()
+        # Pushed to the front newest last, so the buffer stays newest first
+        self._recent_entries.extendleft(entries)
+        for entry in entries:
+            self._aggregates.add(entry)
+
+    def _revalidate(self) -> None:
+        """Catch up with other processes' writes and drop expired entries; a single stat() when there were none."""
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            if self._log_inode is not None:
+                self._load_log()
+            stat = None
+        if stat and (stat.st_ino != self._log_inode or stat.st_size != self._log_offset):
+            self._load_log(full_reload=False)
+        # Same UTC isoformat for every entry, so the strings order like the timestamps
+        cutoff = (datetime.now(_tz.utc) - timedelta(days=self.ttl_days)).isoformat()
+        while self._recent_entries and self._recent_entries[-1]["searched_at"] < cutoff:
+            self._pop_oldest_entry()
 
     def _write(self, entries: list[dict]) -> None:
         dir_name = os.path.dirname(self.file_path)
         fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
         try:
             with os.fdopen(fd, "w") as f:
-                json.dump(entries, f, indent=2)
+                f.writelines(self._to_line(entry) for entry in entries)
             os.replace(tmp_path, self.file_path)
         except Exception:
             if os.path.exists(tmp_path):
                 os.remove(tmp_path)
             raise
 
+    @staticmethod
+    def _to_line(entry: dict) -> str:
+        return json.dumps(entry, separators=(",", ":")) + "\n"
+
     def _purge_expired(self, entries: list[dict]) -> list[dict]:
         cutoff = datetime.now(_tz.utc) - timedelta(days=self.ttl_days)
         result = []
@@ -52,8 +261,8 @@ class RecentSearchesStore:
                 continue
         return result
 
-    def record_search(
-        self,
+    @staticmethod
+    def new_entry(
         player_name: str,
         position: str | None = None,
         era: str | None = None,
@@ -65,47 +274,97 @@ class RecentSearchesStore:
         region: str | None = None,
         city: str | None = None,
         timezone: str | None = None,
-    ) -> None:
+    ) -> dict:
+        """A search as stored, timestamped now, for record_search or a later append_entries."""
+        return {
+            "player_name": player_name.title(),
+            "position": position,
+            "era": era,
+            "searched_at": datetime.now(_tz.utc).isoformat(),
+            "original_query": original_query,
+            "search_source": search_source,
+            "results_found": results_found,
+            "client_ip": client_ip,
+            "country": country,
+            "region": region,
+            "city": city,
+            "timezone": timezone,
+        }
+
+    def record_search(self, player_name: str, **search_fields) -> None:
+        """Record one search, see new_entry for the fields."""
+        self.append_entries([self.new_entry(player_name, **search_fields)])
+
+    def append_entries(self, entries: list[dict]) -> None:
+        """Append entries to the log in a single write."""
+        if not entries:
+            return
+        data = b"".join(self._to_line(entry).encode() for entry in entries)
         try:
-            with self._lock:
+            with self._lock, self._log_lock(exclusive=False):
+                with open(self.file_path, "ab") as f:
+                    f.write(data)
+                    f.flush()
+                    log_end = f.tell()
+                    log_inode = os.fstat(f.fileno()).st_ino
+                # Buffered directly only when the lines landed right after what was read so far, else the
+                # next read picks them up from the log along with the other process's lines
+                if log_inode == self._log_inode and log_end - len(data) == self._log_offset:
+                    self._log_offset = log_end
+                    self._add_recent_entries(entries)
+        except Exception as e:
+            logger.error(f"Failed to record {len(entries)} recent searches: {e}")
+
+    def _live_entries(self, entries: list[dict]) -> list[dict]:
+        """Unexpired entries, newest first, capped at MAX_ENTRIES: what the log holds right after compact()."""
+        entries = self._purge_expired(entries)
+        entries.sort(key=lambda e: e["searched_at"], reverse=True)
+        return entries[:MAX_ENTRIES]
+
+    def compact(self) -> None:
+        """Rewrite the log without expired entries and entries beyond MAX_ENTRIES."""
+        try:
+            with self._lock, self._log_lock(exclusive=True):
                 entries = self._read()
-                entries = self._purge_expired(entries)
-
-                now = datetime.now(_tz.utc).isoformat()
-
-                entries.append({
-                    "player_name": player_name.title(),
-                    "position": position,
-                    "era": era,
-                    "searched_at": now,
-                    "original_query": original_query,
-                    "search_source": search_source,
-                    "results_found": results_found,
-                    "client_ip": client_ip,
-                    "country": country,
-                    "region": region,
-                    "city": city,
-                    "timezone": timezone,
-                })
-
-                # Cap at MAX_ENTRIES (keep most recent)
-                entries.sort(key=lambda e: e["searched_at"], reverse=True)
-                entries = entries[:MAX_ENTRIES]
-
-                self._write(entries)
+                live_entries = self._live_entries(entries)
+                if len(live_entries) == len(entries):
+                    return
+                # Oldest first, so later appends keep the log in chronological order
+                self._write(live_entries[::-1])
+                self._load_log()
+            logger.info(f"Compacted recent searches log from {len(entries)} to {len(live_entries)} entries")
         except Exception as e:
-            logger.error(f"Failed to record recent search: {e}")
+            logger.error(f"Failed to compact recent searches: {e}")
 
     def get_recent_searches(self, limit: int) -> list[dict]:
         try:
-            entries = self._read()
-            entries = self._purge_expired(entries)
-            entries.sort(key=lambda e: e["searched_at"], reverse=True)
-            return entries[:limit]
+            with self._lock:
+                self._revalidate()
+                return list(islice(self._recent_entries, limit))
         except Exception as e:
             logger.error(f"Failed to read recent searches: {e}")
             return []
 
+    def get_search_counts(self) -> dict[str, int]:
+        """Number of unexpired searches that found results per folded player name (fold_player_name)."""
+        try:
+            with self._lock:
+                self._revalidate()
+                return dict(self._aggregates.counts["player_name"])
+        except Exception as e:
+            logger.error(f"Failed to count recent searches: {e}")
+            return {}
+
+    def get_search_analytics(self, top: int) -> dict:
+        """SearchAggregates summary of the unexpired searches, the newest MAX_ENTRIES at most."""
+        try:
+            with self._lock:
+                self._revalidate()
+                return {"window_days": self.ttl_days, **self._aggregates.summary(top)}
+        except Exception as e:
+            logger.error(f"Failed to summarize recent searches: {e}")
+            return {}
+
 
 recent_searches_store = RecentSearchesStore(
     file_path=settings.RECENT_SEARCHES_FILE_PATH,
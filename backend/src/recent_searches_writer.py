@@ -0,0 +1,137 @@
+import asyncio
+import time
+
+from backend.src.recent_searches_store import RecentSearchesStore, recent_searches_store
+from backend.src.search_metrics import (
+    RECORD_SEARCH_FLUSH_BATCH_SIZE,
+    RECORD_SEARCH_FLUSH_SECONDS,
+    RECORD_SEARCH_QUEUE_DEPTH,
+    RECORD_SEARCH_REJECTED,
+)
+from shared.config import settings
+from shared.utils.app_logger import logger
+
+
+class RecentSearchesWriter:
+    """Write-behind queue in front of the recent searches store.
+
+    Requests only enqueue their search; a background task appends them to the log in batches,
+    once batch_size searches are waiting or flush_interval seconds after the first one arrived.
+    A full queue makes enqueue() wait up to enqueue_timeout for room before giving up, and
+    stop() flushes whatever is still queued.
+    """
+
+    def __init__(
+        self,
+        store: RecentSearchesStore,
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+        enqueue_timeout: float,
+    ):
+        self.store = store
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        # Created in start(), so the queue belongs to the event loop serving the app
+        self._queue: asyncio.Queue | None = None
+        self._flush_task: asyncio.Task | None = None
+        RECORD_SEARCH_QUEUE_DEPTH.set_function(lambda: self.queue_depth)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    @property
+    def running(self) -> bool:
+        return self._flush_task is not None
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self) -> None:
+        """Stop accepting searches and write the queued ones, directly if the flush loop died or is stuck."""
+        if not self.running:
+            return
+        flush_task, self._flush_task = self._flush_task, None
+        if not flush_task.done():
+            try:
+                # Behind every queued search, so the loop drains the queue before it sees it
+                await asyncio.wait_for(self._queue.put(None), timeout=self.enqueue_timeout)
+                await flush_task
+            except asyncio.TimeoutError:
+                logger.warning("Recent searches flush loop made no room to stop, writing the queue directly")
+                flush_task.cancel()
+                await asyncio.gather(flush_task, return_exceptions=True)
+            except Exception as e:
+                logger.error(f"Recent searches flush loop failed while stopping: {e}")
+        elif not flush_task.cancelled() and flush_task.exception():
+            logger.error(f"Recent searches flush loop had died: {flush_task.exception()}")
+
+        # Whatever a dead or stuck flush loop left queued
+        queue, self._queue = self._queue, None
+        remaining = [queue.get_nowait() for _ in range(queue.qsize())]
+        remaining = [entry for entry in remaining if entry is not None]
+        if remaining:
+            await asyncio.to_thread(self.store.append_entries, remaining)
+
+    async def enqueue(self, entry: dict) -> bool:
+        """Queue a store entry (RecentSearchesStore.new_entry) for writing; False when the queue stayed full."""
+        if not self.running:
+            # Before startup or after shutdown there is no flush loop, so write it right away
+            await asyncio.to_thread(self.store.append_entries, [entry])
+            return True
+        try:
+            await asyncio.wait_for(self._queue.put(entry), timeout=self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            RECORD_SEARCH_REJECTED.inc()
+            logger.warning(f"Recent searches queue full ({self.max_queue_size}), dropped a search")
+            return False
+        return True
+
+    async def _next_batch(self) -> tuple[list[dict], bool]:
+        """Entries to flush next and whether stop() was requested."""
+        entry = await self._queue.get()
+        if entry is None:
+            return [], True
+        batch = [entry]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                entry = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                break
+            if entry is None:
+                return batch, True
+            batch.append(entry)
+        return batch, False
+
+    async def _flush(self, batch: list[dict]) -> None:
+        start = time.perf_counter()
+        # append_entries logs its own failures, the batch is lost then as a direct write would be
+        await asyncio.to_thread(self.store.append_entries, batch)
+        RECORD_SEARCH_FLUSH_SECONDS.observe(time.perf_counter() - start)
+        RECORD_SEARCH_FLUSH_BATCH_SIZE.observe(len(batch))
+
+    async def _flush_periodically(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, stopping = await self._next_batch()
+            if batch:
+                await self._flush(batch)
+
+
+recent_searches_writer = RecentSearchesWriter(
+    store=recent_searches_store,
+    max_queue_size=settings.RECORD_SEARCH_QUEUE_MAX_SIZE,
+    batch_size=settings.RECORD_SEARCH_FLUSH_BATCH_SIZE,
+    flush_interval=settings.RECORD_SEARCH_FLUSH_INTERVAL_SECONDS,
+    enqueue_timeout=settings.RECORD_SEARCH_ENQUEUE_TIMEOUT_SECONDS,
+)
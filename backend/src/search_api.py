@@ -1,23 +1,213 @@
 import asyncio
+import os
+from contextlib import asynccontextmanager
 from typing import Optional
-from fastapi import FastAPI, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+from pydantic import BaseModel, Field, field_validator
 from shared.config import settings
-from backend.src.qdrant_wrapper import AsyncQdrantClientWrapper
+from backend.src.qdrant_wrapper import AsyncQdrantClientWrapper, QdrantClientWrapper, SimilarPlayersQuery
+from backend.src.numpy_search_engine import NumpySearchEngine, blend_query_vectors
+from backend.src.embeddings import FEATURE_GROUPS
+from backend.src.feature_weights import WEIGHT_PRESETS, FeatureWeights, parse_weights, resolve_feature_weights
+from backend.src.player_index import PlayerIndex
+from backend.src.search_results_cache import SearchResultsCache
+from backend.src.dataset_version import DatasetVersion
+from backend.src.neighbor_table import NeighborTable
+from qdrant_client.models import ScoredPoint
 from backend.src.recent_searches_store import recent_searches_store
+from backend.src.recent_searches_writer import recent_searches_writer
 from shared.utils.app_logger import logger
+from backend.src.api_responses import CompressionMiddleware, SearchJSONResponse
 from backend.utils.search_results import (
+    formatted_players,
     format_logger_search_result,
-    remove_same_player,
     format_similar_players_search_result,
     format_user_requested_player_career_stats,
 )
-from backend.src.player_real_name import get_real_player_name
+from backend.src.player_real_name import get_real_player_name, load_player_name_index, player_name_index
+from backend.src.player_suggest_trie import PlayerSuggestTrie
+from backend.src.readiness import Readiness
+from backend.src.search_metrics import SearchResultsCacheCollector, ServerTimingMiddleware, stage_timer
+
+# Players taken from the collection itself and searched once at startup, so any dataset can pass readiness
+WARMUP_PLAYERS_COUNT = 3
 
-app = FastAPI()
 client = AsyncQdrantClientWrapper(
-    host=settings.QDRANT_HOST, port=settings.QDRANT_PORT, collection_name=settings.QDRANT_COLLECTION_NAME
+    host=settings.QDRANT_HOST,
+    port=settings.QDRANT_PORT,
+    collection_name=settings.QDRANT_COLLECTION_NAME,
+    prefer_grpc=settings.QDRANT_PREFER_GRPC,
+    grpc_port=settings.QDRANT_GRPC_PORT,
+)
+numpy_search_engine = NumpySearchEngine(distance_metric=settings.QDRANT_VECTOR_DISTANCE_METRIC)
+player_index = PlayerIndex()
+search_results_cache = SearchResultsCache(
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES, ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS
 )
+dataset_version = DatasetVersion(settings.DATASET_VERSION_FILE_PATH)
+player_suggest_trie = PlayerSuggestTrie()
+REGISTRY.register(SearchResultsCacheCollector(search_results_cache.stats))
+readiness = Readiness()
+neighbor_table: NeighborTable | None = None
+neighbor_table_mtime: float | None = None
+
+
+def numpy_search_engine_enabled() -> bool:
+    # Weighted searches need the stored matrix in process even when Qdrant serves the plain ones
+    return settings.SEARCH_BACKEND == "numpy" or settings.WEIGHTED_SEARCH_ENABLED
+
+
+def in_memory_indexes_enabled() -> bool:
+    return settings.PLAYER_INDEX_ENABLED or numpy_search_engine_enabled()
+
+
+async def load_in_memory_indexes() -> None:
+    signature = await client.get_collection_signature()
+    records = await client.fetch_all_players()
+    if settings.PLAYER_INDEX_ENABLED:
+        player_index.load(records)
+    if numpy_search_engine_enabled():
+        numpy_search_engine.load(records)
+    # Response fields of every player, so search responses only add the per-search fields
+    formatted_players.load(records)
+    player_index.signature = signature
+
+
+def load_neighbor_table() -> None:
+    global neighbor_table, neighbor_table_mtime
+    if not settings.NEIGHBOR_TABLE_ENABLED or not os.path.exists(settings.NEIGHBOR_TABLE_FILE_PATH):
+        return
+    mtime = os.path.getmtime(settings.NEIGHBOR_TABLE_FILE_PATH)
+    if mtime == neighbor_table_mtime:
+        return
+    try:
+        neighbor_table = NeighborTable.load(settings.NEIGHBOR_TABLE_FILE_PATH)
+        neighbor_table_mtime = mtime
+        logger.info(f"Loaded neighbor table for dataset version {neighbor_table.dataset_version}")
+    except Exception as e:
+        logger.error(f"Failed to load neighbor table from {settings.NEIGHBOR_TABLE_FILE_PATH}: {e}")
+
+
+def load_player_names() -> None:
+    """Name resolution index, then the typeahead trie ranked by current search popularity."""
+    load_player_name_index(settings.RAW_NBA_DATA_PATH)
+    popularity = recent_searches_store.get_search_counts() if settings.RECENT_SEARCHES_ENABLED else {}
+    source = (player_name_index.source_mtime, popularity)
+    if source == player_suggest_trie.source:
+        return
+    player_suggest_trie.build(
+        player_name_index.display_names,
+        player_name_index.players_aliases,
+        popularity,
+        settings.PLAYER_SUGGEST_MAX_RESULTS,
+    )
+    player_suggest_trie.source = source
+
+
+async def refresh_in_memory_indexes_periodically() -> None:
+    while True:
+        await asyncio.sleep(settings.PLAYER_INDEX_REFRESH_SECONDS)
+        try:
+            signature = await client.get_collection_signature()
+            if signature != player_index.signature:
+                logger.info(f"Collection '{client.collection_name}' changed, reloading in-memory indexes")
+                await client.check_position_flags()
+                await load_in_memory_indexes()
+            if neighbor_table is None or neighbor_table.dataset_version != dataset_version.current():
+                await asyncio.to_thread(load_neighbor_table)
+            await asyncio.to_thread(load_player_names)
+        except Exception as e:
+            logger.error(f"Failed to refresh in-memory indexes: {e}")
+
+
+async def compact_recent_searches_periodically() -> None:
+    while True:
+        await asyncio.to_thread(recent_searches_store.compact)
+        await asyncio.sleep(settings.RECENT_SEARCHES_COMPACTION_SECONDS)
+
+
+async def run_warm_queries() -> None:
+    """Exercise name resolution, a Qdrant lookup, a similarity search and response rendering once."""
+    # Straight to Qdrant, so its connection is warm even when the in-memory indexes serve requests
+    records = await client.sample_players(WARMUP_PLAYERS_COUNT)
+    if not records:
+        raise ValueError(f"Collection '{client.collection_name}' returned no players to warm up with")
+
+    # Only warms the name index: players missing from the raw data files do not resolve, which is logged
+    player_names = [record.payload["PLAYER_NAME_LOWER_CASE"] for record in records]
+    # A dropped last letter goes through the fuzzy path
+    await asyncio.to_thread(resolve_player_names, [*player_names, player_names[0][:-1]])
+
+    for record in records:
+        query = SimilarPlayersQuery(
+            record.vector, exclude_ids=[record.id], exclude_player_names=[record.payload["PLAYER_NAME_LOWER_CASE"]]
+        )
+        search_result = await run_similar_players_search(query)
+        player_result = {"player_name": record.payload["PLAYER_NAME"]}
+        search_response(format_similar_players_search_result(player_result, search_result))
+
+
+async def warm_up() -> bool:
+    """Connect, verify the collection, build the in-memory indexes and run warm queries; True once ready."""
+    readiness.start_attempt()
+    async with readiness.check("qdrant_collection"):
+        await client.connect()
+        points_count, _ = await client.get_collection_signature()
+        if points_count == 0:
+            raise ValueError(f"Collection '{client.collection_name}' has no points, run the data ingest first")
+        logger.info(f"Collection '{client.collection_name}' has {points_count} points")
+        await client.check_position_flags()
+    if not readiness.checks["qdrant_collection"]["ok"]:
+        return readiness.finish_attempt()
+    async with readiness.check("neighbor_table", required=False):
+        await asyncio.to_thread(load_neighbor_table)
+    # get_real_player_name builds the index lazily on first use, so a failure here only delays the cost
+    async with readiness.check("player_names", required=False):
+        await asyncio.to_thread(load_player_names)
+    if in_memory_indexes_enabled():
+        # Qdrant path stays available, so a failed load only costs performance
+        async with readiness.check("in_memory_indexes", required=False):
+            await load_in_memory_indexes()
+    async with readiness.check("warm_queries"):
+        await run_warm_queries()
+    return readiness.finish_attempt()
+
+
+async def warm_up_until_ready() -> None:
+    while not await warm_up():
+        await asyncio.sleep(settings.READINESS_RETRY_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    refresh_task = None
+    warm_up_task = None
+    compaction_task = None
+    # The first attempt runs before the server accepts requests, so a healthy start serves warm
+    if not await warm_up():
+        warm_up_task = asyncio.create_task(warm_up_until_ready())
+    if in_memory_indexes_enabled():
+        refresh_task = asyncio.create_task(refresh_in_memory_indexes_periodically())
+    if settings.RECENT_SEARCHES_ENABLED:
+        compaction_task = asyncio.create_task(compact_recent_searches_periodically())
+        recent_searches_writer.start()
+    yield
+    # Writes the searches still queued, so none accepted before shutdown is lost
+    await recent_searches_writer.stop()
+    for task in [warm_up_task, refresh_task, compaction_task]:
+        if task:
+            task.cancel()
+    await client.close()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+if settings.RESPONSE_COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.RESPONSE_COMPRESSION_MIN_SIZE)
+if settings.SERVER_TIMING_ENABLED:
+    # Added last so it wraps compression and its "total" covers the whole response
+    app.add_middleware(ServerTimingMiddleware)
 
 
 @app.get("/")
@@ -25,6 +215,20 @@ async def get_root() -> dict[str, str]:
     return {"message": "Service is up and running."}
 
 
+@app.get("/ready")
+async def get_readiness() -> ORJSONResponse:
+    """200 once the startup warm-up passed, 503 before; for health checks that gate traffic."""
+    return ORJSONResponse(readiness.status(), status_code=200 if readiness.ready else 503)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    """Prometheus scrape endpoint: search stage and Qdrant request histograms plus the cache counters."""
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/version")
 async def get_version() -> dict[str, str]:
     return {
@@ -33,10 +237,38 @@ async def get_version() -> dict[str, str]:
     }
 
 
-async def generate_similar_players_search_query_vector(player_name: str) -> list | None:
+async def search_players_by_name(player_name: str) -> tuple[list, list]:
+    with stage_timer("player_lookup"):
+        if player_index.is_loaded:
+            try:
+                return player_index.search_players_by_name(player_name)
+            except ValueError:
+                # The index may lag behind a fresh ingest until the next refresh, so ask Qdrant before giving up
+                logger.debug(f"Player {player_name} not found in the in-memory player index, falling back to Qdrant")
+        return await client.search_players_by_name(player_name)
+
+
+async def search_players_by_names(player_names: list[str]) -> dict:
+    """Look up several players at once: in-memory index first, then one Qdrant scroll for the rest."""
+    with stage_timer("player_lookup"):
+        records = {}
+        missing_player_names = []
+        for player_name in player_names:
+            record = player_index.get_by_name(player_name) if player_index.is_loaded else None
+            if record is None:
+                missing_player_names.append(player_name)
+            else:
+                records[player_name.lower()] = record
+        if missing_player_names:
+            records.update(await client.search_players_by_names(missing_player_names))
+        return records
+
+
+async def generate_similar_players_search_query_vector(player_name: str) -> tuple[list, str | int] | None:
+    """Vector of the player and the id of its point, which the similarity search leaves out."""
     try:
-        query_vector, _ = await client.search_players_by_name(player_name.lower())
-        return query_vector
+        query_vector, records = await search_players_by_name(player_name.lower())
+        return query_vector, records[0].id
     except Exception as e:
         logger.error(f"Error searching for player {player_name} embeddings in Qdrant: {e}")
         return None
@@ -44,13 +276,134 @@ async def generate_similar_players_search_query_vector(player_name: str) -> list
 
 async def fetch_user_input_player_stats(player_name: str) -> list | None:
     try:
-        _, career_stats = await client.search_players_by_name(player_name.lower())
+        _, career_stats = await search_players_by_name(player_name.lower())
         return career_stats
     except Exception as e:
         logger.error(f"Error searching for player {player_name} stats in Qdrant: {e}")
         return None
 
 
+def similarity_score_threshold(min_score: float | None) -> float | None:
+    """The requested min_score, else QDRANT_VECTOR_SEARCH_SCORE_THRESHOLD where 0 means no threshold."""
+    if min_score is not None:
+        return min_score
+    return settings.QDRANT_VECTOR_SEARCH_SCORE_THRESHOLD or None
+
+
+def request_feature_weights(weight_preset: str | None, weights: str | dict | None) -> FeatureWeights | None:
+    """Feature weights of a request, weights come as 'shooting:3,3P%:2' in query strings or a dict in bodies."""
+    try:
+        feature_weights = resolve_feature_weights(
+            weight_preset, parse_weights(weights) if isinstance(weights, str) else weights
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if feature_weights is not None and not numpy_search_engine.is_loaded:
+        raise HTTPException(status_code=503, detail="Weighted similarity search is not available right now")
+    return feature_weights
+
+
+async def run_similar_players_search(query: SimilarPlayersQuery, feature_weights: FeatureWeights = None) -> list:
+    with stage_timer("similarity_search"):
+        if feature_weights is not None:
+            # Qdrant can't reweight stored vectors per query, weighted searches always use the in-process matrix
+            return numpy_search_engine.search_similar_players(**query._asdict(), feature_weights=feature_weights)
+        if settings.SEARCH_BACKEND == "numpy" and numpy_search_engine.is_loaded:
+            return numpy_search_engine.search_similar_players(**query._asdict())
+        return await client.search_similar_players(**query._asdict())
+
+
+def search_cache_key(endpoint: str, player_name: str, *search_params) -> tuple:
+    # The dataset version changes as soon as an ingest ends, the in-memory indexes only at their next refresh;
+    # keyed on both, responses built from stale indexes are never served once the indexes caught up
+    return endpoint, player_name.lower(), *search_params, dataset_version.current(), player_index.signature
+
+
+def get_cached_search_result(cache_key: tuple) -> bytes | None:
+    if not settings.SEARCH_CACHE_ENABLED:
+        return None
+    return search_results_cache.get(cache_key)
+
+
+def cache_search_result(cache_key: tuple, search_result: bytes) -> None:
+    if settings.SEARCH_CACHE_ENABLED:
+        search_results_cache.set(cache_key, search_result)
+
+
+def search_response(content: dict | list, cache_key: tuple = None) -> SearchJSONResponse:
+    """Render a search response once with orjson, skipping FastAPI's encoder, and cache the rendered body.
+
+    Cache hits are returned as SearchJSONResponse(cached_body) without serializing again.
+    """
+    with stage_timer("serialization"):
+        response = SearchJSONResponse(content)
+    if cache_key is not None:
+        cache_search_result(cache_key, response.body)
+    return response
+
+
+@stage_timer("neighbor_table")
+def search_precomputed_neighbors(
+    real_player_name: str,
+    position: str = None,
+    era: str = None,
+    limit: int = None,
+    offset: int = 0,
+    score_threshold: float = None,
+) -> list | None:
+    """Similar players from the precomputed neighbor table, or None to fall back to a live search.
+
+    The table is only trusted when it was built for the current dataset version, and neighbor
+    payloads come from the in-memory player index, so both have to be loaded.
+    """
+    if neighbor_table is None or not player_index.is_loaded:
+        return None
+    if neighbor_table.dataset_version != dataset_version.current():
+        return None
+
+    neighbors = neighbor_table.get_neighbors(
+        real_player_name,
+        position,
+        era,
+        limit or settings.QDRANT_VECTOR_SEARCH_LIMIT,
+        offset=offset,
+        score_threshold=score_threshold,
+    )
+    if neighbors is None:
+        return None
+
+    search_result = []
+    for neighbor_name, score in neighbors:
+        record = player_index.get_by_name(neighbor_name)
+        if record is None:
+            return None
+        search_result.append(ScoredPoint(id=record.id, version=0, score=score, payload=record.payload))
+    logger.debug(f"Served similar players of {real_player_name} from the precomputed neighbor table")
+    return search_result
+
+
+async def run_similar_players_search_batch(
+    queries: list[SimilarPlayersQuery], feature_weights: FeatureWeights = None
+) -> list[list]:
+    with stage_timer("similarity_search"):
+        if feature_weights is not None:
+            return numpy_search_engine.search_similar_players_batch(queries, feature_weights=feature_weights)
+        if settings.SEARCH_BACKEND == "numpy" and numpy_search_engine.is_loaded:
+            return numpy_search_engine.search_similar_players_batch(queries)
+        return await client.search_similar_players_batch(queries)
+
+
+def resolve_player_names(player_names: list[str]) -> list[dict]:
+    player_results = []
+    for player_name in player_names:
+        try:
+            player_results.append(get_real_player_name(player_name))
+        except Exception as e:
+            logger.error(f"Error resolving player name '{player_name}': {e}")
+            player_results.append({"target": player_name, "error": f"Could not resolve player name '{player_name}'"})
+    return player_results
+
+
 async def handle_player_search_result(player_result, player_name) -> dict:
     if player_result.get("error"):
         return {
@@ -70,6 +423,11 @@ async def handle_player_search_result(player_result, player_name) -> dict:
 async def user_requested_player_career_stats(player_name: str) -> dict | list:
     logger.info(f"Received request for career stats for player: {player_name}")
     player_name = player_name.lower()
+    cache_key = search_cache_key("career_stats", player_name)
+    cached_result = get_cached_search_result(cache_key)
+    if cached_result is not None:
+        return SearchJSONResponse(cached_result)
+
     player_result = await asyncio.to_thread(get_real_player_name, player_name)
 
     result = await handle_player_search_result(player_result, player_name)
@@ -82,8 +440,9 @@ async def user_requested_player_career_stats(player_name: str) -> dict | list:
         logger.error(f"Failed to retrieve career stats for player: {real_player_name}")
         return {"searched_player": player_result, "error": f"No career stats found for '{real_player_name}'"}
     logger.info(f"Retrieved career stats for player: {real_player_name}")
-    logger.debug(f"Retrieved career stats: {career_stats}")
-    return format_user_requested_player_career_stats(player_result, career_stats)
+    logger.opt(lazy=True).debug("Retrieved career stats: {}", lambda: career_stats)
+    response = format_user_requested_player_career_stats(player_result, career_stats)
+    return search_response(response, cache_key)
 
 
 @app.get("/search_similar_players/")
@@ -91,8 +450,21 @@ async def search_similar_players(
     player_name: str,
     position: Optional[str] = None,
     era: Optional[str] = None,
+    k: int = Query(default=settings.QDRANT_VECTOR_SEARCH_LIMIT, gt=0, le=settings.SIMILAR_PLAYERS_MAX_K),
+    offset: int = Query(default=0, ge=0, le=settings.SIMILAR_PLAYERS_MAX_OFFSET),
+    min_score: Optional[float] = None,
+    weight_preset: Optional[str] = None,
+    weights: Optional[str] = None,
 ) -> dict | list:
     player_name = player_name.lower()
+    feature_weights = request_feature_weights(weight_preset, weights)
+    cache_key = search_cache_key(
+        "similar_players", player_name, position, era, k, offset, min_score, feature_weights and feature_weights.key
+    )
+    cached_result = get_cached_search_result(cache_key)
+    if cached_result is not None:
+        return SearchJSONResponse(cached_result)
+
     player_result = await asyncio.to_thread(get_real_player_name, player_name)
 
     result = await handle_player_search_result(player_result, player_name)
@@ -104,17 +476,40 @@ async def search_similar_players(
         f"Received search query for real player name: {real_player_name} from user input: {player_name}"
         f" with filters - position: {position}, era: {era}"
     )
+    try:
+        QdrantClientWrapper.validate_search_filter(position=position, era=era)
+    except ValueError as e:
+        return {"searched_player": player_result, "similar_players": [], "error": str(e)}
 
-    query_vector = await generate_similar_players_search_query_vector(real_player_name)
-    if not query_vector:
-        raise HTTPException(status_code=500, detail=f"Could not generate query vector for player '{real_player_name}'")
+    score_threshold = similarity_score_threshold(min_score)
+    search_result = None
+    if feature_weights is None:
+        search_result = search_precomputed_neighbors(real_player_name, position, era, k, offset, score_threshold)
+    if search_result is None:
+        query = await generate_similar_players_search_query_vector(real_player_name)
+        if not query:
+            raise HTTPException(
+                status_code=500, detail=f"Could not generate query vector for player '{real_player_name}'"
+            )
 
-    search_result = await client.search_similar_players(query_vector, position=position, era=era)
-    search_result = remove_same_player(search_result, real_player_name)
+        query_vector, point_id = query
+        search_result = await run_similar_players_search(
+            SimilarPlayersQuery(
+                query_vector,
+                position,
+                era,
+                k,
+                offset,
+                score_threshold,
+                exclude_ids=[point_id],
+                exclude_player_names=[real_player_name],
+            ),
+            feature_weights,
+        )
     if search_result:
-        format_logger_search_result(search_result)
-        logger.debug(f"Found results: {format_logger_search_result(search_result)}")
-        return format_similar_players_search_result(player_result, search_result)
+        logger.opt(lazy=True).debug("Found results: {}", lambda: format_logger_search_result(search_result))
+        response = format_similar_players_search_result(player_result, search_result)
+        return search_response(response, cache_key)
     else:
         logger.error(
             f"No results found for player '{real_player_name}' in collection '{client.collection_name}' from user input '{player_name}'"
@@ -122,6 +517,341 @@ async def search_similar_players(
         return {"searched_player": {"target": real_player_name, "player_name": player_name}, "similar_players": []}
 
 
+@app.get("/player_profile_with_similar_players/")
+async def player_profile_with_similar_players(
+    player_name: str,
+    position: Optional[str] = None,
+    era: Optional[str] = None,
+    k: int = Query(default=settings.QDRANT_VECTOR_SEARCH_LIMIT, gt=0, le=settings.SIMILAR_PLAYERS_MAX_K),
+    offset: int = Query(default=0, ge=0, le=settings.SIMILAR_PLAYERS_MAX_OFFSET),
+    min_score: Optional[float] = None,
+    weight_preset: Optional[str] = None,
+    weights: Optional[str] = None,
+) -> dict:
+    """Career stats of the requested player and their similar players in one round-trip.
+
+    Resolves the player name and fetches the vector and payload only once, instead of the
+    two separate /user_requested_player_career_stats/ and /search_similar_players/ calls.
+    """
+    player_name = player_name.lower()
+    feature_weights = request_feature_weights(weight_preset, weights)
+    cache_key = search_cache_key(
+        "profile_with_similar_players",
+        player_name,
+        position,
+        era,
+        k,
+        offset,
+        min_score,
+        feature_weights and feature_weights.key,
+    )
+    cached_result = get_cached_search_result(cache_key)
+    if cached_result is not None:
+        return SearchJSONResponse(cached_result)
+
+    player_result = await asyncio.to_thread(get_real_player_name, player_name)
+
+    result = await handle_player_search_result(player_result, player_name)
+    if result["error"]:
+        return result
+
+    real_player_name = result["searched_player"]["player_name"]
+    logger.info(
+        f"Received profile and similarity query for real player name: {real_player_name} from user input: {player_name}"
+        f" with filters - position: {position}, era: {era}"
+    )
+    try:
+        QdrantClientWrapper.validate_search_filter(position=position, era=era)
+    except ValueError as e:
+        return {"searched_player": player_result, "error": str(e)}
+
+    try:
+        query_vector, career_stats = await search_players_by_name(real_player_name.lower())
+    except Exception as e:
+        logger.error(f"Error searching for player {real_player_name} in Qdrant: {e}")
+        return {"searched_player": player_result, "error": f"No career stats found for '{real_player_name}'"}
+
+    score_threshold = similarity_score_threshold(min_score)
+    search_result = None
+    if feature_weights is None:
+        search_result = search_precomputed_neighbors(real_player_name, position, era, k, offset, score_threshold)
+    if search_result is None:
+        search_result = await run_similar_players_search(
+            SimilarPlayersQuery(
+                query_vector,
+                position,
+                era,
+                k,
+                offset,
+                score_threshold,
+                exclude_ids=[career_stats[0].id],
+                exclude_player_names=[real_player_name],
+            ),
+            feature_weights,
+        )
+    if search_result:
+        logger.opt(lazy=True).debug("Found results: {}", lambda: format_logger_search_result(search_result))
+    else:
+        logger.error(
+            f"No results found for player '{real_player_name}' in collection '{client.collection_name}' from user input '{player_name}'"
+        )
+
+    response = {
+        "searched_player": player_result,
+        "career_stats": format_user_requested_player_career_stats(player_result, career_stats),
+        "similar_players": format_similar_players_search_result(player_result, search_result),
+        "error": None,
+    }
+    return search_response(response, cache_key)
+
+
+@app.get("/cache/stats")
+async def get_cache_stats() -> dict:
+    return {
+        "enabled": settings.SEARCH_CACHE_ENABLED,
+        "dataset_version": dataset_version.current(),
+        "search_results_cache": search_results_cache.stats(),
+    }
+
+
+class BatchSearchItem(BaseModel):
+    player_name: str
+    position: Optional[str] = None
+    era: Optional[str] = None
+
+
+class SimilarPlayersSearchOptions(BaseModel):
+    # Result window and score cutoff, as in the query params of the single player endpoints
+    k: int = Field(default=settings.QDRANT_VECTOR_SEARCH_LIMIT, gt=0, le=settings.SIMILAR_PLAYERS_MAX_K)
+    offset: int = Field(default=0, ge=0, le=settings.SIMILAR_PLAYERS_MAX_OFFSET)
+    min_score: Optional[float] = None
+    # A preset from GET /similarity_weights/ and/or {"feature or group": weight} overrides
+    weight_preset: Optional[str] = None
+    weights: Optional[dict[str, float]] = None
+
+
+class BatchSearchRequest(SimilarPlayersSearchOptions):
+    players: list[BatchSearchItem] = Field(..., min_length=1, max_length=settings.BATCH_SEARCH_MAX_ITEMS)
+
+    @field_validator("players")
+    @classmethod
+    def unique_player_names(cls, players: list[BatchSearchItem]) -> list[BatchSearchItem]:
+        # Results are keyed by the input name, a repeated one would silently overwrite the earlier result
+        player_names = [item.player_name for item in players]
+        duplicates = sorted({player_name for player_name in player_names if player_names.count(player_name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate player names {duplicates}, each player_name can appear once per batch")
+        return players
+
+
+@app.post("/search_similar_players/batch/")
+async def search_similar_players_batch(body: BatchSearchRequest) -> dict:
+    """Similar players for many inputs at once, keyed by the input player name.
+
+    Names are resolved in one pass, vectors fetched with one lookup and all live searches sent
+    as a single batch. A failing item only sets its own "error" and never fails the whole batch.
+    """
+    logger.info(f"Received batch similarity search for {len(body.players)} players")
+    player_results = await asyncio.to_thread(resolve_player_names, [item.player_name.lower() for item in body.players])
+    score_threshold = similarity_score_threshold(body.min_score)
+    feature_weights = request_feature_weights(body.weight_preset, body.weights)
+
+    results = {}
+    resolved_items = []
+    for item, player_result in zip(body.players, player_results):
+        result = await handle_player_search_result(player_result, item.player_name.lower())
+        if result["error"]:
+            results[item.player_name] = {**result, "similar_players": []}
+        else:
+            resolved_items.append((item, player_result, result["searched_player"]["player_name"]))
+
+    try:
+        records = await search_players_by_names([real_player_name for _, _, real_player_name in resolved_items])
+    except Exception as e:
+        logger.error(f"Error fetching batch player vectors from Qdrant: {e}")
+        records = {}
+
+    live_search_items = []
+    for item, player_result, real_player_name in resolved_items:
+        record = records.get(real_player_name.lower())
+        if record is None:
+            results[item.player_name] = {
+                "searched_player": player_result,
+                "similar_players": [],
+                "error": f"No career stats found for '{real_player_name}'",
+            }
+            continue
+        try:
+            # Validate filters up front so one bad era can't fail the shared search_batch call
+            QdrantClientWrapper.validate_search_filter(position=item.position, era=item.era)
+        except ValueError as e:
+            results[item.player_name] = {"searched_player": player_result, "similar_players": [], "error": str(e)}
+            continue
+
+        search_result = None
+        if feature_weights is None:
+            search_result = search_precomputed_neighbors(
+                real_player_name, item.position, item.era, body.k, body.offset, score_threshold
+            )
+        if search_result is None:
+            live_search_items.append((item, player_result, real_player_name, record))
+        else:
+            results[item.player_name] = {
+                "searched_player": player_result,
+                "similar_players": format_similar_players_search_result(player_result, search_result),
+                "error": None,
+            }
+
+    if live_search_items:
+        queries = [
+            SimilarPlayersQuery(
+                record.vector,
+                item.position,
+                item.era,
+                body.k,
+                body.offset,
+                score_threshold,
+                exclude_ids=[record.id],
+                exclude_player_names=[real_player_name],
+            )
+            for item, _, real_player_name, record in live_search_items
+        ]
+        try:
+            search_results = await run_similar_players_search_batch(queries, feature_weights)
+        except Exception as e:
+            logger.error(f"Error running batch similarity search: {e}")
+            search_results = [e] * len(live_search_items)
+
+        for (item, player_result, _, _), search_result in zip(live_search_items, search_results):
+            if isinstance(search_result, Exception):
+                results[item.player_name] = {
+                    "searched_player": player_result,
+                    "similar_players": [],
+                    "error": "Similarity search failed",
+                }
+                continue
+            results[item.player_name] = {
+                "searched_player": player_result,
+                "similar_players": format_similar_players_search_result(player_result, search_result),
+                "error": None,
+            }
+
+    return search_response({"results": results})
+
+
+class BlendPlayer(BaseModel):
+    player_name: str
+    # Share of this player in the blended vector, relative to the other players
+    weight: float = Field(default=1.0, gt=0)
+
+
+class BlendSearchRequest(SimilarPlayersSearchOptions):
+    players: list[BlendPlayer] = Field(..., min_length=1, max_length=settings.BLEND_SEARCH_MAX_PLAYERS)
+    position: Optional[str] = None
+    era: Optional[str] = None
+
+
+@app.post("/search_similar_players/blend/")
+async def search_similar_players_blend(body: BlendSearchRequest) -> dict:
+    """Similar players to a blend of several players: the weighted mean of their vectors.
+
+    Names are resolved in one pass and all vectors fetched with one lookup; the input
+    players are excluded inside the search filter.
+    """
+    feature_weights = request_feature_weights(body.weight_preset, body.weights)
+    blend_key = ",".join(f"{player.player_name.lower()}:{player.weight:g}" for player in body.players)
+    cache_key = search_cache_key(
+        "blend",
+        blend_key,
+        body.position,
+        body.era,
+        body.k,
+        body.offset,
+        body.min_score,
+        feature_weights and feature_weights.key,
+    )
+    cached_result = get_cached_search_result(cache_key)
+    if cached_result is not None:
+        return SearchJSONResponse(cached_result)
+
+    logger.info(
+        f"Received blended similarity search for {blend_key} with filters - position: {body.position}, era: {body.era}"
+    )
+    player_results = await asyncio.to_thread(
+        resolve_player_names, [player.player_name.lower() for player in body.players]
+    )
+    error = next((player_result["error"] for player_result in player_results if player_result.get("error")), None)
+    if error:
+        return {"searched_players": player_results, "similar_players": [], "error": error}
+
+    real_player_names = [player_result["player_name"] for player_result in player_results]
+    try:
+        records = await search_players_by_names(real_player_names)
+    except Exception as e:
+        logger.error(f"Error fetching blend player vectors from Qdrant: {e}")
+        records = {}
+    missing_player_name = next((name for name in real_player_names if name.lower() not in records), None)
+    if missing_player_name:
+        return {
+            "searched_players": player_results,
+            "similar_players": [],
+            "error": f"No career stats found for '{missing_player_name}'",
+        }
+
+    try:
+        QdrantClientWrapper.validate_search_filter(position=body.position, era=body.era)
+    except ValueError as e:
+        return {"searched_players": player_results, "similar_players": [], "error": str(e)}
+
+    input_records = [records[name.lower()] for name in real_player_names]
+    query_vector = blend_query_vectors(
+        [record.vector for record in input_records], [player.weight for player in body.players]
+    )
+    search_result = await run_similar_players_search(
+        SimilarPlayersQuery(
+            query_vector,
+            body.position,
+            body.era,
+            body.k,
+            body.offset,
+            similarity_score_threshold(body.min_score),
+            exclude_ids=[record.id for record in input_records],
+            exclude_player_names=real_player_names,
+        ),
+        feature_weights,
+    )
+
+    # Rows keep the single-player schema, the most weighted input stands for the blend; all are in searched_players
+    weights = [player.weight for player in body.players]
+    representative_player_result = player_results[weights.index(max(weights))]
+    response = {
+        "searched_players": player_results,
+        "career_stats": [
+            career_stats
+            for player_result, record in zip(player_results, input_records)
+            for career_stats in format_user_requested_player_career_stats(player_result, [record])
+        ],
+        "similar_players": format_similar_players_search_result(representative_player_result, search_result),
+        "error": None,
+    }
+    return search_response(response, cache_key)
+
+
+@app.get("/similarity_weights/")
+async def get_similarity_weights() -> dict:
+    """Weight presets and feature groups accepted by the similar players endpoints."""
+    return {"presets": WEIGHT_PRESETS, "feature_groups": FEATURE_GROUPS}
+
+
+@app.get("/players/suggest")
+async def suggest_players(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(default=settings.PLAYER_SUGGEST_MAX_RESULTS, gt=0, le=settings.PLAYER_SUGGEST_MAX_RESULTS),
+) -> dict:
+    """Typeahead over player names, last names and aliases, most searched players first."""
+    return {"query": q, "suggestions": player_suggest_trie.suggest(q, limit)}
+
+
 class RecordSearchRequest(BaseModel):
     player_name: str
     position: Optional[str] = None
@@ -140,20 +870,9 @@ class RecordSearchRequest(BaseModel):
 async def record_search(body: RecordSearchRequest) -> dict:
     if not settings.RECENT_SEARCHES_ENABLED:
         return {"status": "disabled"}
-    await asyncio.to_thread(
-        recent_searches_store.record_search,
-        player_name=body.player_name,
-        position=body.position,
-        era=body.era,
-        original_query=body.original_query,
-        search_source=body.search_source,
-        results_found=body.results_found,
-        client_ip=body.client_ip,
-        country=body.country,
-        region=body.region,
-        city=body.city,
-        timezone=body.timezone,
-    )
+    entry = recent_searches_store.new_entry(**body.model_dump())
+    if not await recent_searches_writer.enqueue(entry):
+        raise HTTPException(status_code=503, detail="Too many searches waiting to be recorded, try again later")
     return {"status": "ok"}
 
 
@@ -163,3 +882,11 @@ async def get_recent_searches(limit: int = Query(default=10, gt=0, le=50)) -> di
         return {"recent_searches": []}
     searches = await asyncio.to_thread(recent_searches_store.get_recent_searches, limit)
     return {"recent_searches": searches}
+
+
+@app.get("/analytics/searches")
+async def get_search_analytics(top: int = Query(default=10, gt=0, le=100)) -> dict:
+    """Search counts per player, position, era and country over the recent searches window, and the zero-result rate."""
+    if not settings.RECENT_SEARCHES_ENABLED:
+        raise HTTPException(status_code=404, detail="Recent searches are disabled")
+    return await asyncio.to_thread(recent_searches_store.get_search_analytics, top)
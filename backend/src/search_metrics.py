@@ -0,0 +1,125 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable
+from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# In-memory stages take microseconds, Qdrant round-trips and fuzzy name matching up to seconds
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+SEARCH_STAGE_SECONDS = Histogram(
+    "search_stage_duration_seconds",
+    "Time spent in each stage of the search pipeline",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+)
+QDRANT_REQUEST_SECONDS = Histogram(
+    "qdrant_request_duration_seconds",
+    "Latency of requests from the async Qdrant client",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+QDRANT_REQUEST_ERRORS = Counter(
+    "qdrant_request_errors", "Requests from the async Qdrant client that raised", ["operation"]
+)
+
+RECORD_SEARCH_QUEUE_DEPTH = Gauge("record_search_queue_depth", "Searches waiting in the write-behind queue")
+RECORD_SEARCH_FLUSH_SECONDS = Histogram(
+    "record_search_flush_duration_seconds",
+    "Time to append one batch of queued searches to the recent searches log",
+    buckets=LATENCY_BUCKETS,
+)
+RECORD_SEARCH_FLUSH_BATCH_SIZE = Histogram(
+    "record_search_flush_batch_size",
+    "Searches appended per flush of the write-behind queue",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+RECORD_SEARCH_REJECTED = Counter(
+    "record_search_rejected", "Searches not recorded because the write-behind queue stayed full"
+)
+
+# Stage durations of the current request, summed per stage; None outside a ServerTimingMiddleware request
+_request_stage_timings: ContextVar[dict[str, float] | None] = ContextVar("request_stage_timings", default=None)
+
+
+@contextmanager
+def stage_timer(stage: str):
+    """Time a search stage into the stage histogram and the current request's Server-Timing.
+
+    Works as a context manager and as a decorator of sync functions. Timings made in threads
+    started with asyncio.to_thread still land in the request, since the context is copied.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        SEARCH_STAGE_SECONDS.labels(stage).observe(elapsed)
+        timings = _request_stage_timings.get()
+        if timings is not None:
+            timings[stage] = timings.get(stage, 0.0) + elapsed
+
+
+@contextmanager
+def qdrant_request(operation: str):
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        QDRANT_REQUEST_ERRORS.labels(operation).inc()
+        raise
+    finally:
+        QDRANT_REQUEST_SECONDS.labels(operation).observe(time.perf_counter() - start)
+
+
+def server_timing_header(timings: dict[str, float]) -> str:
+    """Server-Timing value with durations in ms, e.g. 'name_resolution;dur=0.41, total;dur=2.87'."""
+    return ", ".join(f"{stage};dur={elapsed * 1000:.2f}" for stage, elapsed in timings.items())
+
+
+class ServerTimingMiddleware:
+    """Collect the stage timings of each request and send them back in a Server-Timing header.
+
+    Stages that run concurrently (batch searches) are summed, so they can add up to more than
+    the "total" entry, which is the time until the response headers were sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings: dict[str, float] = {}
+        token = _request_stage_timings.set(timings)
+        start = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                timings["total"] = time.perf_counter() - start
+                MutableHeaders(scope=message).append("Server-Timing", server_timing_header(timings))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stage_timings.reset(token)
+
+
+class SearchResultsCacheCollector(Collector):
+    """Expose the search results cache counters, read from cache.stats() at scrape time."""
+
+    def __init__(self, stats: Callable[[], dict]):
+        self.stats = stats
+
+    def collect(self):
+        stats = self.stats()
+        for name in ["hits", "misses", "evictions", "expirations"]:
+            yield CounterMetricFamily(f"search_results_cache_{name}", f"Search results cache {name}", value=stats[name])
+        yield GaugeMetricFamily("search_results_cache_size", "Entries in the search results cache", value=stats["size"])
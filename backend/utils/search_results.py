@@ -1,77 +1,150 @@
 import json
-from shared.utils.app_logger import logger
+from backend.src.search_metrics import stage_timer
+
+# Payload keys read by the formatters below and by name lookups; searches request only these
+SEARCH_RESULT_PAYLOAD_FIELDS = [
+    "PLAYER_NAME",
+    "PLAYER_NAME_LOWER_CASE",
+    "POSITION",
+    "HEIGHT_INCHES",
+    "WEIGHT",
+    "GP",
+    "GS",
+    "LAST_PLAYED_AGE",
+    "LAST_PLAYED_SEASON",
+    "TOTAL_SEASONS",
+    "PTS_PER_GAME",
+    "REB_PER_GAME",
+    "AST_PER_GAME",
+    "STL_PER_GAME",
+    "BLK_PER_GAME",
+    "TOV_PER_GAME",
+    "MIN_PER_GAME",
+    "FG%",
+    "FT%",
+    "3P%",
+    "TS%",
+    "EFG%",
+    "PER",
+    "WS/48",
+    "USG%",
+    "PTS_PER_36",
+    "AST_TO_RATIO",
+    "STL%",
+    "BLK%",
+    "PTS_RESPONSIBILITY",
+]
 
 
 def filter_search_result(search_result: list, score_threshold: float) -> list:
     return [result for result in search_result if result.score > score_threshold]
 
 
+def similar_player_fields(payload: dict) -> dict:
+    """Response fields of a similar player that only depend on the player, not on the search."""
+    return {
+        "player_name": payload["PLAYER_NAME"],
+        "position": payload.get("POSITION"),
+        "height_inches": payload.get("HEIGHT_INCHES"),
+        "weight": payload.get("WEIGHT"),
+        "games_played": payload.get("GP"),
+        "games_started": payload.get("GS"),
+        "last_played_age": payload.get("LAST_PLAYED_AGE"),
+        "last_played_season": payload.get("LAST_PLAYED_SEASON"),
+        "total_seasons": payload.get("TOTAL_SEASONS"),
+        "points_per_game": payload.get("PTS_PER_GAME"),
+        "rebounds_per_game": payload.get("REB_PER_GAME"),
+        "assists_per_game": payload.get("AST_PER_GAME"),
+        "steals_per_game": payload.get("STL_PER_GAME"),
+        "blocks_per_game": payload.get("BLK_PER_GAME"),
+        "turnovers_per_game": payload.get("TOV_PER_GAME"),
+        "minutes_per_game": payload.get("MIN_PER_GAME"),
+        "field_goal_percentage": payload.get("FG%"),
+        "free_throw_percentage": payload.get("FT%"),
+        "three_point_percentage": payload.get("3P%"),
+        "true_shooting_percentage": payload.get("TS%"),
+        "effective_field_goal_percentage": payload.get("EFG%"),
+        "player_efficiency_rating": payload.get("PER"),
+        "win_shares_per_48": payload.get("WS/48"),
+        "usage_rate": payload.get("USG%"),
+        "points_per_36": payload.get("PTS_PER_36"),
+        "assist_turnover_ratio": payload.get("AST_TO_RATIO"),
+        "steal_percentage": payload.get("STL%"),
+        "block_percentage": payload.get("BLK%"),
+        "points_responsibility": payload.get("PTS_RESPONSIBILITY"),
+    }
+
+
+def career_stats_fields(payload: dict) -> dict:
+    return {
+        "player_name": payload["PLAYER_NAME"],
+        "position": payload.get("POSITION"),
+        "height_inches": payload.get("HEIGHT_INCHES"),
+        "weight": payload.get("WEIGHT"),
+        "games_played": payload.get("GP"),
+        "games_started": payload.get("GS"),
+        "last_played_age": payload.get("LAST_PLAYED_AGE"),
+        "last_played_season": payload.get("LAST_PLAYED_SEASON"),
+        "total_seasons": payload.get("TOTAL_SEASONS"),
+        "points_per_game": payload.get("PTS_PER_GAME"),
+        "rebounds_per_game": payload.get("REB_PER_GAME"),
+        "assists_per_game": payload.get("AST_PER_GAME"),
+        "steals_per_game": payload.get("STL_PER_GAME"),
+        "blocks_per_game": payload.get("BLK_PER_GAME"),
+        "turnovers_per_game": payload.get("TOV_PER_GAME"),
+        "minutes_per_game": payload.get("MIN_PER_GAME"),
+        "true_shooting_percentage": payload.get("TS%"),
+        "free_throw_percentage": payload.get("FT%"),
+        "field_goal_percentage": payload.get("FG%"),
+        "three_point_percentage": payload.get("3P%"),
+        "effective_field_goal_percentage": payload.get("EFG%"),
+        "player_efficiency_rating": payload.get("PER"),
+    }
+
+
+class FormattedPlayers:
+    """Response fields of every player, formatted once per collection load and keyed by point id.
+
+    Point ids are new uuids on every ingest, so an id always maps to the payload it was formatted
+    from. Points missing from the cache (e.g. right after an ingest) are formatted on the fly.
+    """
+
+    def __init__(self):
+        self.similar_player_fields: dict = {}
+        self.career_stats_fields: dict = {}
+
+    def load(self, records: list) -> None:
+        self.similar_player_fields = {record.id: similar_player_fields(record.payload) for record in records}
+        self.career_stats_fields = {record.id: career_stats_fields(record.payload) for record in records}
+
+    def get_similar_player_fields(self, result) -> dict:
+        fields = self.similar_player_fields.get(result.id)
+        return fields if fields is not None else similar_player_fields(result.payload)
+
+    def get_career_stats_fields(self, result) -> dict:
+        fields = self.career_stats_fields.get(result.id)
+        return fields if fields is not None else career_stats_fields(result.payload)
+
+
+formatted_players = FormattedPlayers()
+
+
+@stage_timer("formatting")
 def format_similar_players_search_result(search_player_name, search_result: list) -> list[dict]:
     return [
         {
             "searched_player": search_player_name,
-            "player_name": result.payload["PLAYER_NAME"],
-            "position": result.payload.get("POSITION"),
-            "height_inches": result.payload.get("HEIGHT_INCHES"),
-            "weight": result.payload.get("WEIGHT"),
-            "games_played": result.payload.get("GP"),
-            "games_started": result.payload.get("GS"),
-            "last_played_age": result.payload.get("LAST_PLAYED_AGE"),
-            "last_played_season": result.payload.get("LAST_PLAYED_SEASON"),
-            "total_seasons": result.payload.get("TOTAL_SEASONS"),
-            "points_per_game": result.payload.get("PTS_PER_GAME"),
-            "rebounds_per_game": result.payload.get("REB_PER_GAME"),
-            "assists_per_game": result.payload.get("AST_PER_GAME"),
-            "steals_per_game": result.payload.get("STL_PER_GAME"),
-            "blocks_per_game": result.payload.get("BLK_PER_GAME"),
-            "turnovers_per_game": result.payload.get("TOV_PER_GAME"),
-            "minutes_per_game": result.payload.get("MIN_PER_GAME"),
-            "field_goal_percentage": result.payload.get("FG%"),
-            "free_throw_percentage": result.payload.get("FT%"),
-            "three_point_percentage": result.payload.get("3P%"),
-            "true_shooting_percentage": result.payload.get("TS%"),
-            "effective_field_goal_percentage": result.payload.get("EFG%"),
-            "player_efficiency_rating": result.payload.get("PER"),
-            "win_shares_per_48": result.payload.get("WS/48"),
-            "usage_rate": result.payload.get("USG%"),
-            "points_per_36": result.payload.get("PTS_PER_36"),
-            "assist_turnover_ratio": result.payload.get("AST_TO_RATIO"),
-            "steal_percentage": result.payload.get("STL%"),
-            "block_percentage": result.payload.get("BLK%"),
-            "points_responsibility": result.payload.get("PTS_RESPONSIBILITY"),
+            **formatted_players.get_similar_player_fields(result),
             "similarity_score": result.score,
         }
         for result in search_result
     ]
 
 
+@stage_timer("formatting")
 def format_user_requested_player_career_stats(search_player_name, search_result: list) -> list[dict]:
     return [
-        {
-            "searched_player": search_player_name,
-            "player_name": result.payload["PLAYER_NAME"],
-            "position": result.payload.get("POSITION"),
-            "height_inches": result.payload.get("HEIGHT_INCHES"),
-            "weight": result.payload.get("WEIGHT"),
-            "games_played": result.payload.get("GP"),
-            "games_started": result.payload.get("GS"),
-            "last_played_age": result.payload.get("LAST_PLAYED_AGE"),
-            "last_played_season": result.payload.get("LAST_PLAYED_SEASON"),
-            "total_seasons": result.payload.get("TOTAL_SEASONS"),
-            "points_per_game": result.payload.get("PTS_PER_GAME"),
-            "rebounds_per_game": result.payload.get("REB_PER_GAME"),
-            "assists_per_game": result.payload.get("AST_PER_GAME"),
-            "steals_per_game": result.payload.get("STL_PER_GAME"),
-            "blocks_per_game": result.payload.get("BLK_PER_GAME"),
-            "turnovers_per_game": result.payload.get("TOV_PER_GAME"),
-            "minutes_per_game": result.payload.get("MIN_PER_GAME"),
-            "true_shooting_percentage": result.payload.get("TS%"),
-            "free_throw_percentage": result.payload.get("FT%"),
-            "field_goal_percentage": result.payload.get("FG%"),
-            "three_point_percentage": result.payload.get("3P%"),
-            "effective_field_goal_percentage": result.payload.get("EFG%"),
-            "player_efficiency_rating": result.payload.get("PER"),
-        }
+        {"searched_player": search_player_name, **formatted_players.get_career_stats_fields(result)}
         for result in search_result
     ]
 
@@ -80,7 +153,3 @@ def format_logger_search_result(search_result: list) -> str:
     logger_results = [{**result.payload, "similarity_score": result.score} for result in search_result]
     return json.dumps(logger_results, indent=1)
 
-
-def remove_same_player(search_results: list, player_name: str) -> list:
-    logger.debug(f"Removing same player: {player_name} from search results {search_results}")
-    return [result for result in search_results if result.payload["PLAYER_NAME_LOWER_CASE"] != player_name.lower()]
@@ -0,0 +1,220 @@
+"""Latency and throughput benchmark of the search API, fully offline.
+
+The FastAPI app runs in-process (httpx ASGI transport, so a single worker and no sockets)
+against an in-memory Qdrant seeded with synthetic players, and each endpoint is driven at a
+fixed concurrency. Results are written as JSON, compare runs with benchmarks.compare_results.
+
+    python -m benchmarks.api_benchmark --players 5000 --requests 2000 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+import numpy as np
+from dotenv import dotenv_values
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_DIR, "benchmarks", "results")
+SEARCH_POSITIONS = [None, "Guard", "Forward", "Center"]
+SEARCH_ERAS = [None, "1970s", "1990s", "2010s"]
+
+
+def configure_environment(data_dir: str, search_cache_enabled: bool, search_backend: str | None) -> None:
+    """Point every file the API reads or writes into data_dir and pin the rest of the settings.
+
+    Settings are read when shared.config is first imported, so this runs before the app is
+    imported. Values missing from the environment come from .env_EXAMPLE rather than a local
+    .env, so runs on different machines use the same configuration.
+    """
+    os.environ.update(
+        {
+            "RAW_NBA_DATA_PATH": os.path.join(data_dir, "raw_parquet_files"),
+            "PLAYER_ALIASES_FILE_PATH": os.path.join(data_dir, "player_aliases.json"),
+            "DATASET_VERSION_FILE_PATH": os.path.join(data_dir, "dataset_version.json"),
+            "NEIGHBOR_TABLE_FILE_PATH": os.path.join(data_dir, "neighbor_table.npz"),
+            "RECENT_SEARCHES_FILE_PATH": os.path.join(data_dir, "recent_searches.jsonl"),
+            "SEARCH_CACHE_ENABLED": str(search_cache_enabled),
+        }
+    )
+    if search_backend:
+        os.environ["SEARCH_BACKEND"] = search_backend
+    # Per-request INFO logs would dominate the console and the timings
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    for key, value in dotenv_values(os.path.join(REPO_DIR, ".env_EXAMPLE")).items():
+        os.environ.setdefault(key, value)
+
+
+def git_revision() -> str:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        changes = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=REPO_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if changes else commit
+
+
+def build_requests(endpoint: str, player_names: list[str], count: int, rng: random.Random) -> list[tuple]:
+    """(method, path, httpx request kwargs) for count requests to one endpoint."""
+    requests = []
+    for _ in range(count):
+        player_name = rng.choice(player_names)
+        position, era = rng.choice(SEARCH_POSITIONS), rng.choice(SEARCH_ERAS)
+        if endpoint == "search_similar_players":
+            params = {"player_name": player_name, "position": position, "era": era}
+            requests.append(("GET", "/search_similar_players/", {"params": {k: v for k, v in params.items() if v}}))
+        elif endpoint == "user_requested_player_career_stats":
+            requests.append(("GET", "/user_requested_player_career_stats/", {"params": {"player_name": player_name}}))
+        elif endpoint == "record_search":
+            body = {"player_name": player_name, "position": position, "era": era, "search_source": "benchmark"}
+            requests.append(("POST", "/record_search/", {"json": {**body, "results_found": True}}))
+        elif endpoint == "recent_searches":
+            requests.append(("GET", "/recent_searches/", {"params": {"limit": rng.randint(5, 20)}}))
+        else:
+            raise ValueError(f"Unknown endpoint '{endpoint}'")
+    return requests
+
+
+def latency_summary(latencies_ms: list[float], errors: int, elapsed_seconds: float) -> dict:
+    p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99])
+    return {
+        "requests": len(latencies_ms),
+        "errors": errors,
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "mean_ms": round(float(np.mean(latencies_ms)), 3),
+        "max_ms": round(float(np.max(latencies_ms)), 3),
+        "throughput_rps": round(len(latencies_ms) / elapsed_seconds, 1),
+    }
+
+
+async def run_requests(http_client, requests: list[tuple], concurrency: int) -> dict:
+    """Send the requests from concurrency workers and summarize their latencies.
+
+    Failed requests are counted as errors: HTTP errors and 200 responses carrying an "error".
+    """
+    pending = iter(requests)
+    latencies_ms = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        for method, path, kwargs in pending:
+            start = time.perf_counter()
+            response = await http_client.request(method, path, **kwargs)
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+            body = response.json() if response.status_code < 400 else None
+            if body is None or (isinstance(body, dict) and body.get("error")):
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latency_summary(latencies_ms, errors, time.perf_counter() - start)
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict:
+    # Imported only after configure_environment, as they read the settings at import time
+    import httpx
+    import backend.src.search_api as search_api
+    from benchmarks.synthetic_players import seed_async_qdrant, synthetic_players_df, write_player_name_files
+    from shared.config import settings
+
+    players_df = synthetic_players_df(args.players, seed=args.seed)
+    write_player_name_files(players_df, settings.RAW_NBA_DATA_PATH)
+    # connect() in the app lifespan keeps an existing client, so the app serves from this one
+    search_api.client.client = await seed_async_qdrant(
+        players_df, settings.QDRANT_COLLECTION_NAME, settings.QDRANT_VECTOR_DISTANCE_METRIC
+    )
+
+    rng = random.Random(args.seed)
+    player_names = players_df["PLAYER_NAME"].tolist()
+    endpoints = {}
+    async with search_api.lifespan(search_api.app):
+        transport = httpx.ASGITransport(app=search_api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as http_client:
+            readiness = await http_client.get("/ready")
+            if readiness.status_code != 200:
+                raise RuntimeError(f"API did not warm up: {readiness.json()}")
+
+            for endpoint in args.endpoints:
+                await run_requests(
+                    http_client, build_requests(endpoint, player_names, args.warmup, rng), args.concurrency
+                )
+                requests = build_requests(endpoint, player_names, args.requests, rng)
+                endpoints[endpoint] = await run_requests(http_client, requests, args.concurrency)
+                print(f"{endpoint}: {endpoints[endpoint]}")
+            cache_stats = (await http_client.get("/cache/stats")).json()
+
+    return {
+        "revision": git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "players": args.players,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "search_cache_enabled": settings.SEARCH_CACHE_ENABLED,
+            "search_backend": settings.SEARCH_BACKEND,
+            "distance_metric": settings.QDRANT_VECTOR_DISTANCE_METRIC,
+        },
+        "endpoints": endpoints,
+        "search_results_cache": cache_stats["search_results_cache"],
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline latency and throughput benchmark of the search API")
+    parser.add_argument("--players", type=int, default=5000, help="Synthetic players in the collection")
+    parser.add_argument("--requests", type=int, default=1000, help="Measured requests per endpoint")
+    parser.add_argument("--warmup", type=int, default=50, help="Unmeasured requests per endpoint before measuring")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight at once")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic players and the request mix")
+    parser.add_argument(
+        "--endpoints",
+        nargs="+",
+        default=["search_similar_players", "user_requested_player_career_stats", "record_search", "recent_searches"],
+        help="Endpoints to drive, in order",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable the search results cache")
+    # The in-memory Qdrant client searches in pure Python, far slower than a Qdrant server, so the
+    # qdrant backend numbers are only comparable between runs of this benchmark
+    parser.add_argument("--search-backend", choices=["qdrant", "numpy"], help="Override SEARCH_BACKEND")
+    parser.add_argument("--output", help="Results JSON path, default benchmarks/results/<revision>_<time>.json")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory(prefix="nba_benchmark_") as data_dir:
+        configure_environment(data_dir, search_cache_enabled=not args.no_cache, search_backend=args.search_backend)
+        results = asyncio.run(run_benchmark(args))
+
+    output_path = args.output or os.path.join(
+        RESULTS_DIR, f"{results['revision']}_{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Saved benchmark results to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
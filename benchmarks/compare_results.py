@@ -0,0 +1,70 @@
+"""Compare two api_benchmark result files, e.g. from the commits before and after a change.
+
+    python -m benchmarks.compare_results benchmarks/results/a1b2c3d_*.json benchmarks/results/e4f5a6b_*.json
+
+Exits with status 1 when any endpoint's p95 latency regressed by more than --max-regression.
+"""
+
+import argparse
+import json
+import sys
+
+COMPARED_METRICS = ["p50_ms", "p95_ms", "p99_ms", "throughput_rps"]
+
+
+def load_results(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def relative_change(baseline: float, current: float) -> float:
+    return (current - baseline) / baseline if baseline else 0.0
+
+
+def compare_results(baseline: dict, current: dict) -> dict[str, dict]:
+    """Per endpoint in both runs: {metric: (baseline, current, relative change)}."""
+    comparison = {}
+    for endpoint, current_summary in current["endpoints"].items():
+        baseline_summary = baseline["endpoints"].get(endpoint)
+        if baseline_summary is None:
+            continue
+        comparison[endpoint] = {
+            metric: (
+                baseline_summary[metric],
+                current_summary[metric],
+                relative_change(baseline_summary[metric], current_summary[metric]),
+            )
+            for metric in COMPARED_METRICS
+        }
+    return comparison
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two API benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument(
+        "--max-regression", type=float, default=0.1, help="Allowed relative p95 increase, 0.1 means 10%%"
+    )
+    args = parser.parse_args()
+
+    baseline, current = load_results(args.baseline), load_results(args.current)
+    print(f"{baseline['revision']} -> {current['revision']}")
+    if baseline["config"] != current["config"]:
+        print(f"Warning: configs differ\n  {baseline['config']}\n  {current['config']}")
+
+    regressions = []
+    for endpoint, metrics in compare_results(baseline, current).items():
+        print(endpoint)
+        for metric, (baseline_value, current_value, change) in metrics.items():
+            print(f"  {metric:<15} {baseline_value:>10} -> {current_value:>10}  ({change:+.1%})")
+        if metrics["p95_ms"][2] > args.max_regression:
+            regressions.append(endpoint)
+
+    if regressions:
+        print(f"p95 regressed by more than {args.max_regression:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Stress test of one recent searches log shared by several processes, like uvicorn workers.
+
+Writer processes append searches at the same time, one by one and in batches like the
+write-behind queue, while another process keeps compacting the log. Every unexpired search
+has to end up in the log exactly once; exits with status 1 otherwise.
+
+    python -m benchmarks.recent_searches_stress --processes 8 --searches 500
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.api_benchmark import configure_environment
+
+TTL_DAYS = 7
+STRESS_SOURCE = "stress"
+
+
+def expired_search(store) -> dict:
+    entry = store.new_entry("Expired Player", search_source=STRESS_SOURCE)
+    entry["searched_at"] = (datetime.now(timezone.utc) - timedelta(days=TTL_DAYS + 1)).isoformat()
+    return entry
+
+
+def write_searches(file_path: str, worker: int, searches: int, batch_size: int, start) -> None:
+    """Append searches tagged '<worker>-<i>' in their original_query, batch_size at a time.
+
+    Each append carries an expired search too, so every compaction has something to drop and rewrites the log.
+    """
+    from backend.src.recent_searches_store import RecentSearchesStore
+
+    store = RecentSearchesStore(file_path, ttl_days=TTL_DAYS)
+    start.wait()
+    for batch_start in range(0, searches, batch_size):
+        batch = [
+            store.new_entry(f"Stress Player {worker}", original_query=f"{worker}-{i}", search_source=STRESS_SOURCE)
+            for i in range(batch_start, min(batch_start + batch_size, searches))
+        ]
+        store.append_entries([*batch, expired_search(store)])
+
+
+def compact_until_stopped(file_path: str, start, stop) -> None:
+    from backend.src.recent_searches_store import RecentSearchesStore
+
+    store = RecentSearchesStore(file_path, ttl_days=TTL_DAYS)
+    start.wait()
+    while not stop.is_set():
+        store.compact()
+
+
+def verify_log(file_path: str, expected_ids: set[str]) -> dict:
+    from backend.src.recent_searches_store import MAX_ENTRIES, RecentSearchesStore
+
+    with open(file_path, "rb") as f:
+        lines = f.read().splitlines()
+    ids, corrupt_lines = [], 0
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            corrupt_lines += 1
+            continue
+        if entry.get("original_query"):
+            ids.append(entry["original_query"])
+    buffered = RecentSearchesStore(file_path, ttl_days=TTL_DAYS).get_recent_searches(MAX_ENTRIES)
+    return {
+        "expected": len(expected_ids),
+        "lost": len(expected_ids - set(ids)),
+        "duplicated": len(ids) - len(set(ids)),
+        "corrupt_lines": corrupt_lines,
+        "log_lines": len(lines),
+        "buffered": sum(1 for entry in buffered if entry.get("original_query")),
+    }
+
+
+def run_stress(args: argparse.Namespace, file_path: str) -> dict:
+    start, stop = multiprocessing.Event(), multiprocessing.Event()
+    writers = [
+        multiprocessing.Process(
+            target=write_searches,
+            args=(file_path, worker, args.searches, 1 if worker % 2 == 0 else args.batch_size, start),
+        )
+        for worker in range(args.processes)
+    ]
+    compactor = multiprocessing.Process(target=compact_until_stopped, args=(file_path, start, stop))
+    for process in [*writers, compactor]:
+        process.start()
+
+    started_at = time.perf_counter()
+    start.set()
+    for process in writers:
+        process.join()
+    elapsed_seconds = time.perf_counter() - started_at
+    stop.set()
+    compactor.join()
+
+    expected_ids = {f"{worker}-{i}" for worker in range(args.processes) for i in range(args.searches)}
+    return {**verify_log(file_path, expected_ids), "elapsed_seconds": round(elapsed_seconds, 2)}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Concurrent writes to the recent searches log from several processes")
+    parser.add_argument("--processes", type=int, default=8, help="Writer processes, besides the compacting one")
+    parser.add_argument("--searches", type=int, default=500, help="Searches written by each process")
+    parser.add_argument(
+        "--batch-size", type=int, default=20, help="Searches per append of the batching writers, every other one"
+    )
+    args = parser.parse_args()
+    # Compaction keeps the newest MAX_ENTRIES, past that dropped searches would not mean lost ones
+    if args.processes * args.searches > 5000:
+        parser.error("--processes times --searches has to stay within the store's 5000 entries")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory(prefix="nba_stress_") as data_dir:
+        configure_environment(data_dir, search_cache_enabled=False, search_backend=None)
+        results = run_stress(args, os.path.join(data_dir, "recent_searches.jsonl"))
+    print(results)
+    if results["lost"] or results["duplicated"] or results["corrupt_lines"] or results["buffered"] != results["expected"]:
+        print("Recent searches log lost or mangled searches")
+        sys.exit(1)
+    print("No searches lost")
+
+
+if __name__ == "__main__":
+    main()
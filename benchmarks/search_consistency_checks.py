@@ -0,0 +1,133 @@
+"""Offline checks that the search paths agree with each other, fully in-process like api_benchmark.
+
+Each check runs against an in-memory Qdrant seeded with synthetic players and prints the
+mismatches it finds; exits with status 1 when any check failed.
+
+    python -m benchmarks.search_consistency_checks
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+
+from benchmarks.api_benchmark import configure_environment
+
+# Canonical, lowercased and compound positions in both word orders
+CHECKED_POSITIONS = ["Guard", "guard", "CENTER", "Guard-Forward", "forward-guard", "Forward Center"]
+
+
+async def check_position_filter_parity(context: dict) -> list[str]:
+    """NumPy masks and Qdrant filters, with and without the POS_* flags, keep the same players."""
+    from backend.src.numpy_search_engine import NumpySearchEngine
+
+    client, records = context["client"], context["records"]
+    numpy_search_engine = NumpySearchEngine(distance_metric=context["distance_metric"])
+    numpy_search_engine.load(records)
+
+    failures = []
+    for record in records[:5]:
+        for position in CHECKED_POSITIONS:
+            search_kwargs = {"position": position, "limit": 10, "exclude_ids": [record.id]}
+            expected_ids = [
+                point.id for point in numpy_search_engine.search_similar_players(record.vector, **search_kwargs)
+            ]
+            if not expected_ids:
+                failures.append(f"No players matched position '{position}'")
+            for position_flags in [True, False]:
+                client.position_flags = position_flags
+                result_ids = [point.id for point in await client.search_similar_players(record.vector, **search_kwargs)]
+                if result_ids != expected_ids:
+                    failures.append(
+                        f"Position '{position}' (position_flags={position_flags}) for"
+                        f" {record.payload['PLAYER_NAME']}: Qdrant {result_ids} != NumPy {expected_ids}"
+                    )
+    client.position_flags = True
+    return failures
+
+
+async def check_stale_index_excludes_searched_player(context: dict) -> list[str]:
+    """After a re-ingest gives every point a new id, searches served while the in-memory index still
+    holds the old ids leave the searched player out of their own results."""
+    import httpx
+    import backend.src.search_api as search_api
+    from benchmarks.synthetic_players import seed_async_qdrant, write_player_name_files
+    from shared.config import settings
+
+    players_df = context["players_df"]
+    write_player_name_files(players_df, settings.RAW_NBA_DATA_PATH)
+    search_api.player_index.load(context["records"])
+    # Same players under new random point ids, the index is only refreshed PLAYER_INDEX_REFRESH_SECONDS later
+    search_api.client.client = await seed_async_qdrant(
+        players_df, settings.QDRANT_COLLECTION_NAME, settings.QDRANT_VECTOR_DISTANCE_METRIC
+    )
+
+    failures = []
+    transport = httpx.ASGITransport(app=search_api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://checks") as http_client:
+        for player_name in players_df["PLAYER_NAME"].head(5):
+            for path, similar_players_key in [
+                ("/search_similar_players/", None),
+                ("/player_profile_with_similar_players/", "similar_players"),
+            ]:
+                response = (await http_client.get(path, params={"player_name": player_name})).json()
+                similar_players = response[similar_players_key] if similar_players_key else response
+                similar_player_names = [similar_player["player_name"] for similar_player in similar_players]
+                if player_name.lower() in [name.lower() for name in similar_player_names]:
+                    failures.append(f"{path} returned {player_name} as similar to itself")
+    await search_api.client.close()
+    return failures
+
+
+CHECKS = [check_position_filter_parity, check_stale_index_excludes_searched_player]
+
+
+async def run_checks(args: argparse.Namespace) -> dict[str, list[str]]:
+    # Imported only after configure_environment, as they read the settings at import time
+    from backend.src.qdrant_wrapper import AsyncQdrantClientWrapper
+    from benchmarks.synthetic_players import seed_async_qdrant, synthetic_players_df
+    from shared.config import settings
+
+    players_df = synthetic_players_df(args.players, seed=args.seed)
+    client = AsyncQdrantClientWrapper(
+        host=settings.QDRANT_HOST, port=settings.QDRANT_PORT, collection_name=settings.QDRANT_COLLECTION_NAME
+    )
+    client.client = await seed_async_qdrant(
+        players_df, settings.QDRANT_COLLECTION_NAME, settings.QDRANT_VECTOR_DISTANCE_METRIC
+    )
+    context = {
+        "players_df": players_df,
+        "client": client,
+        "records": await client.fetch_all_players(),
+        "distance_metric": settings.QDRANT_VECTOR_DISTANCE_METRIC,
+    }
+    failures = {}
+    for check in CHECKS:
+        failures[check.__name__] = await check(context)
+    await client.close()
+    return failures
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline consistency checks of the search paths")
+    parser.add_argument("--players", type=int, default=500, help="Synthetic players in the collection")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic players")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory(prefix="nba_checks_") as data_dir:
+        configure_environment(data_dir, search_cache_enabled=False, search_backend="qdrant")
+        failures = asyncio.run(run_checks(args))
+
+    for check_name, check_failures in failures.items():
+        print(f"{check_name}: {'FAILED' if check_failures else 'ok'}")
+        for failure in check_failures:
+            print(f"  {failure}")
+    if any(failures.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
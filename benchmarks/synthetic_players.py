@@ -0,0 +1,102 @@
+import os
+import random
+import pandas as pd
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import VectorParams
+from backend.src.embeddings import NUMERIC_COLUMNS, PlayerEmbeddings
+from backend.src.qdrant_wrapper import DISTANCE_METRICS, QdrantClientWrapper
+
+POSITIONS = ["Guard", "Forward", "Center", "Guard-Forward", "Forward-Center", "Forward-Guard", "Center-Forward"]
+CONSONANTS = "bdfgklmnprstvz"
+VOWELS = "aeiou"
+
+# (low, high) of each stat, roughly the spread of real career averages
+STAT_RANGES = {
+    "HEIGHT_INCHES": (69, 88),
+    "WEIGHT": (160, 300),
+    "PTS_RESPONSIBILITY": (0.0, 35.0),
+    "LAST_PLAYED_AGE": (20, 42),
+    "TOTAL_SEASONS": (1, 21),
+    "GP": (1, 1600),
+    "GS": (0, 1500),
+    "PTS_PER_GAME": (0.0, 30.0),
+    "REB_PER_GAME": (0.0, 15.0),
+    "AST_PER_GAME": (0.0, 11.0),
+    "STL_PER_GAME": (0.0, 2.5),
+    "BLK_PER_GAME": (0.0, 3.5),
+    "TOV_PER_GAME": (0.0, 4.0),
+    "MIN_PER_GAME": (2.0, 42.0),
+    "TS%": (0.35, 0.65),
+    "EFG%": (0.35, 0.6),
+    "FG%": (30.0, 65.0),
+    "3P%": (0.0, 45.0),
+    "FT%": (40.0, 92.0),
+    "PER": (0.0, 30.0),
+    "WS/48": (-0.1, 0.3),
+    "USG%": (8.0, 35.0),
+    "PTS_PER_36": (3.0, 30.0),
+    "AST_TO_RATIO": (0.3, 4.0),
+    "STL%": (0.0, 3.5),
+    "BLK%": (0.0, 8.0),
+}
+INTEGER_STATS = {"HEIGHT_INCHES", "WEIGHT", "LAST_PLAYED_AGE", "TOTAL_SEASONS", "GP", "GS"}
+
+
+def synthetic_name_token(rng: random.Random) -> str:
+    return "".join(rng.choice(CONSONANTS) + rng.choice(VOWELS) for _ in range(3)).capitalize()
+
+
+def synthetic_player_names(players_count: int, rng: random.Random) -> list[str]:
+    """Unique names of two 6-letter tokens, so none is a substring of another and resolves as ambiguous."""
+    player_names = []
+    seen = set()
+    while len(player_names) < players_count:
+        player_name = f"{synthetic_name_token(rng)} {synthetic_name_token(rng)}"
+        if player_name not in seen:
+            seen.add(player_name)
+            player_names.append(player_name)
+    return player_names
+
+
+def synthetic_players_df(players_count: int, seed: int = 0) -> pd.DataFrame:
+    """Career averages in the processed data schema (metadata plus NUMERIC_COLUMNS), drawn from a fixed seed."""
+    rng = random.Random(seed)
+    rows = []
+    for player_id, player_name in enumerate(synthetic_player_names(players_count, rng), start=1):
+        last_played_year = rng.randint(1950, 2024)
+        row = {
+            "PLAYER_NAME": player_name,
+            "PLAYER_ID": player_id,
+            "POSITION": rng.choice(POSITIONS),
+            "LAST_PLAYED_SEASON": f"{last_played_year}-{(last_played_year + 1) % 100:02d}",
+        }
+        for column in NUMERIC_COLUMNS:
+            low, high = STAT_RANGES[column]
+            row[column] = rng.randint(low, high) if column in INTEGER_STATS else round(rng.uniform(low, high), 3)
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def write_player_name_files(players_df: pd.DataFrame, raw_data_dir: str) -> None:
+    """Empty '<First>_<Last>_career_stats.parquet' files: name resolution only reads the file names."""
+    os.makedirs(raw_data_dir, exist_ok=True)
+    for player_name in players_df["PLAYER_NAME"]:
+        file_name = f"{player_name.replace(' ', '_')}_career_stats.parquet"
+        open(os.path.join(raw_data_dir, file_name), "w").close()
+
+
+async def seed_async_qdrant(
+    players_df: pd.DataFrame, collection_name: str, distance_metric: str, batch_size: int = 500
+) -> AsyncQdrantClient:
+    """In-memory AsyncQdrantClient holding the players embedded and payloaded the way the ingest does it."""
+    embeddings_df = PlayerEmbeddings(players_df.copy()).create_players_embeddings()
+    points = [QdrantClientWrapper._row_to_points(row)[0] for _, row in embeddings_df.iterrows()]
+
+    client = AsyncQdrantClient(":memory:")
+    await client.create_collection(
+        collection_name=collection_name,
+        vectors_config=VectorParams(size=len(points[0].vector), distance=DISTANCE_METRICS[distance_metric]),
+    )
+    for start in range(0, len(points), batch_size):
+        await client.upsert(collection_name=collection_name, points=points[start : start + batch_size])
+    return client
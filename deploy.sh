@@ -258,9 +258,7 @@ docker_rebuild() {
     # No `down` first: `up --build -d` recreates only changed services, unchanged stay up (zero downtime).
     remote_sudo "sh -c 'cd $REMOTE_DIR && $DOCKER compose up --build -d --remove-orphans'" "Building and starting containers..."
 
-    # Wait for containers to stabilize (services need time to initialize)
-    log "Waiting for services to initialize (10s)..."
-    sleep 10
+    # No fixed wait: data_ingest() polls Qdrant /readyz and verify() polls /ready, which only passes once the API has warmed up
 
     log_success "Docker containers rebuilt"
 }
@@ -276,6 +274,12 @@ data_ingest() {
         return 1
     fi
 
+    # Containers may have just been (re)started, the ingest needs Qdrant to accept connections
+    if ! health_check "Qdrant" "http://localhost:6333/readyz" "$HEALTH_CHECK_TIMEOUT"; then
+        log_error "Qdrant not ready — cannot ingest"
+        return 1
+    fi
+
     log "This may take a few minutes..."
     remote_sudo "$DOCKER exec $container python -m tasks.data_ingesting.ingest_data_main" \
         "Ingesting data into Qdrant (27D vectors)..."
@@ -283,36 +287,6 @@ data_ingest() {
     log_success "Data ingestion complete"
 }
 
-# ============================================================================
-# VERIFICATION
-# ============================================================================
-
-verify() {
-    log_section "Verification"
-
-    # Check containers
-    local containers
-    containers=$(remote "sudo $DOCKER compose -f $REMOTE_DIR/docker-compose.yml ps --format '{{.Name}} {{.Status}}'" 2>/dev/null || \
-                 remote "sudo $DOCKER ps --filter 'name=nba-player' --format '{{.Names}} {{.Status}}'")
-
-    if echo "$containers" | grep -qi "nba-app.*up\|nba-app.*running"; then
-        log_success "nba-app container is running"
-    else
-        log_error "nba-app container is NOT running"
-    fi
-
-    if echo "$containers" | grep -qi "streamlit.*up\|streamlit.*running"; then
-        log_success "streamlit-app container is running"
-    else
-        log_error "streamlit-app container is NOT running"
-    fi
-
-    if echo "$containers" | grep -qi "qdrant.*up\|qdrant.*running"; then
-        log_success "qdrant container is running"
-    else
-        log_error "qdrant container is NOT running"
-    fi
-
 # ============================================================================
 # HEALTH CHECKS
 # ============================================================================
@@ -377,7 +351,8 @@ verify() {
     # Health checks with retry
     log_section "Health Checks (waiting up to ${HEALTH_CHECK_TIMEOUT}s)"
     
-    health_check "FastAPI" "http://localhost:8000/docs" "$HEALTH_CHECK_TIMEOUT"
+    # /ready answers 503 until the collection is verified and the in-memory indexes and warm queries are done
+    health_check "FastAPI" "http://localhost:8000/ready" "$HEALTH_CHECK_TIMEOUT"
     health_check "Streamlit UI" "http://localhost:8501" "$HEALTH_CHECK_TIMEOUT"
 
     # Show NAS commit
@@ -385,7 +360,6 @@ verify() {
     commit=$(remote "cd $REMOTE_DIR && git log -1 --oneline")
     log "Deployed commit: $commit"
 }
-}
 
 # ============================================================================
 # CLI ARGUMENT PARSING
@@ -0,0 +1,148 @@
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+import numpy as np
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.models import PointStruct, VectorParams
+from backend.src.qdrant_wrapper import DISTANCE_METRICS, AsyncQdrantClientWrapper, QdrantClientWrapper
+from shared.config import settings
+
+POSITIONS = ["Guard", "Forward", "Center", "Guard-Forward", "Forward-Center"]
+ERAS = [None, "1990s", "2000s", "2010s"]
+
+
+def build_synthetic_points(total_players: int, vector_size: int) -> list[PointStruct]:
+    rng = np.random.default_rng(42)
+    vectors = rng.random((total_players, vector_size), dtype=np.float32)
+    return [
+        PointStruct(
+            id=str(uuid.uuid4()),
+            vector=vector.tolist(),
+            payload={
+                "PLAYER_NAME_LOWER_CASE": f"player {i}",
+                "POSITION": POSITIONS[i % len(POSITIONS)],
+                "LAST_PLAYED_YEAR": int(rng.integers(1960, 2025)),
+            },
+        )
+        for i, vector in enumerate(vectors)
+    ]
+
+
+async def seed_in_memory_wrappers(
+    total_players: int = 2000,
+) -> tuple[QdrantClientWrapper, AsyncQdrantClientWrapper]:
+    """Two in-memory collections with identical points, one per client type."""
+    points = build_synthetic_points(total_players, settings.QDRANT_VECTOR_SIZE)
+    vectors_config = VectorParams(
+        size=settings.QDRANT_VECTOR_SIZE, distance=DISTANCE_METRICS[settings.QDRANT_VECTOR_DISTANCE_METRIC]
+    )
+
+    sync_wrapper = QdrantClientWrapper(
+        host=settings.QDRANT_HOST, port=settings.QDRANT_PORT, collection_name=settings.QDRANT_COLLECTION_NAME
+    )
+    sync_wrapper.client = QdrantClient(":memory:")
+    sync_wrapper.client.create_collection(settings.QDRANT_COLLECTION_NAME, vectors_config=vectors_config)
+    sync_wrapper.client.upsert(settings.QDRANT_COLLECTION_NAME, points=points)
+
+    async_wrapper = AsyncQdrantClientWrapper(
+        host=settings.QDRANT_HOST, port=settings.QDRANT_PORT, collection_name=settings.QDRANT_COLLECTION_NAME
+    )
+    # connect() keeps an already assigned client, so the wrapper uses the in-memory one
+    async_wrapper.client = AsyncQdrantClient(":memory:")
+    await async_wrapper.client.create_collection(settings.QDRANT_COLLECTION_NAME, vectors_config=vectors_config)
+    await async_wrapper.client.upsert(settings.QDRANT_COLLECTION_NAME, points=points)
+    return sync_wrapper, async_wrapper
+
+
+async def run_load(search, queries: list[tuple[list, str | None, str | None]], concurrency: int) -> dict:
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed_search(query_vector, position, era):
+        async with semaphore:
+            start = time.perf_counter()
+            await search(query_vector, position, era)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed_search(*query) for query in queries))
+    elapsed = time.perf_counter() - start
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "requests_per_second": round(len(queries) / elapsed, 1),
+        "p50_ms": round(quantiles[49], 2),
+        "p95_ms": round(quantiles[94], 2),
+    }
+
+
+async def benchmark(
+    sync_wrapper: QdrantClientWrapper,
+    async_wrapper: AsyncQdrantClientWrapper,
+    total_requests: int = 500,
+    concurrency: int = 32,
+) -> dict:
+    """Throughput of the old asyncio.to_thread path vs the native AsyncQdrantClient path.
+
+    The in-memory client searches in pure Python, so there both paths are CPU bound and only
+    the latency (thread pool queueing) differs; transport gains need a running Qdrant.
+    """
+    rng = random.Random(7)
+    queries = [
+        (
+            [rng.random() for _ in range(settings.QDRANT_VECTOR_SIZE)],
+            rng.choice([None] + POSITIONS[:3]),
+            rng.choice(ERAS),
+        )
+        for _ in range(total_requests)
+    ]
+
+    async def to_thread_search(query_vector, position, era):
+        return await asyncio.to_thread(sync_wrapper.search_similar_players, query_vector, position, era)
+
+    await async_wrapper.connect()
+    try:
+        results = {
+            "to_thread_sync_client": await run_load(to_thread_search, queries, concurrency),
+            "native_async_client": await run_load(async_wrapper.search_similar_players, queries, concurrency),
+        }
+    finally:
+        await async_wrapper.close()
+        sync_wrapper.client.close()
+    return results
+
+
+async def benchmark_local_qdrant(prefer_grpc: bool, total_requests: int = 500, concurrency: int = 32) -> dict:
+    """Same comparison against the running Qdrant from .env, using the ingested collection."""
+    sync_wrapper = QdrantClientWrapper(
+        host=settings.QDRANT_HOST, port=settings.QDRANT_PORT, collection_name=settings.QDRANT_COLLECTION_NAME
+    )
+    async_wrapper = AsyncQdrantClientWrapper(
+        host=settings.QDRANT_HOST,
+        port=settings.QDRANT_PORT,
+        collection_name=settings.QDRANT_COLLECTION_NAME,
+        prefer_grpc=prefer_grpc,
+        grpc_port=settings.QDRANT_GRPC_PORT,
+    )
+    return await benchmark(sync_wrapper, async_wrapper, total_requests, concurrency)
+
+
+async def main(local_qdrant: bool):
+    if local_qdrant:
+        print("Local Qdrant REST:", await benchmark_local_qdrant(prefer_grpc=False))
+        print("Local Qdrant gRPC:", await benchmark_local_qdrant(prefer_grpc=True))
+        return
+    sync_wrapper, async_wrapper = await seed_in_memory_wrappers()
+    print("In-memory client:", await benchmark(sync_wrapper, async_wrapper))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="to_thread sync client vs native async Qdrant client throughput")
+    parser.add_argument(
+        "--local-qdrant",
+        action="store_true",
+        help="Compare REST and gRPC against the running Qdrant from .env (ports 6333 and 6334, ingested collection)",
+    )
+    asyncio.run(main(parser.parse_args().local_qdrant))
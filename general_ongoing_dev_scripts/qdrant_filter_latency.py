@@ -0,0 +1,85 @@
+import random
+import statistics
+import time
+from qdrant_client import QdrantClient
+from qdrant_client.models import FieldCondition, Filter, MatchText, Range
+from backend.src.embeddings import PlayerEmbeddings
+from backend.src.qdrant_wrapper import QdrantClientWrapper
+from shared.config import settings
+from tasks.data_loading.process_data import fetch_all_players_from_local_files
+
+POSITIONS = ["Guard", "Forward", "Center"]
+ERAS = ["1960s", "1970s", "1980s", "1990s", "2000s", "2010s", "2020s"]
+
+
+def legacy_search_filter(position: str, era: str) -> Filter:
+    """Filter as built before payload indexes: full-text position match plus an unindexed year range."""
+    decade_start, decade_end = QdrantClientWrapper.era_to_year_range(era)
+    return Filter(
+        must=[
+            FieldCondition(key="POSITION", match=MatchText(text=position)),
+            FieldCondition(key="LAST_PLAYED_YEAR", range=Range(gte=decade_start, lte=decade_end)),
+        ]
+    )
+
+
+def measure_latency(wrapper: QdrantClientWrapper, queries: list, build_filter) -> dict:
+    latencies = []
+    for query_vector, position, era in queries:
+        start = time.perf_counter()
+        wrapper.client.search(
+            collection_name=wrapper.collection_name,
+            query_vector=query_vector,
+            query_filter=build_filter(position, era),
+            limit=settings.QDRANT_VECTOR_SEARCH_LIMIT,
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {"p50_ms": round(quantiles[49], 3), "p95_ms": round(quantiles[94], 3)}
+
+
+def compare_filtered_search_latency(client: QdrantClient, total_queries: int = 500) -> dict:
+    """Before/after latency of position + era filtered searches on two copies of the players collection.
+
+    "before" has no payload indexes and filters with MatchText, "after" has the ingest's payload
+    indexes and filters on the POS_* flags. Local (in-memory) Qdrant ignores payload indexes, so
+    run this against the server from .env to see the index effect.
+    """
+    players_df = PlayerEmbeddings(
+        fetch_all_players_from_local_files(settings.PROCESSED_NBA_DATA_PATH)
+    ).create_players_embeddings()
+
+    wrappers = {}
+    for label in ["before", "after"]:
+        wrapper = QdrantClientWrapper(
+            host=settings.QDRANT_HOST,
+            port=settings.QDRANT_PORT,
+            collection_name=f"{settings.QDRANT_COLLECTION_NAME}_latency_{label}",
+        )
+        wrapper.client = client
+        wrapper._initialize_collection(wrapper.collection_name, settings.QDRANT_VECTOR_SIZE, True, [])
+        if label == "after":
+            wrapper.create_payload_indexes()
+        wrapper.upsert_players_data_to_qdrant(players_df)
+        wrappers[label] = wrapper
+
+    rng = random.Random(3)
+    embeddings = players_df["embeddings"].tolist()
+    queries = [(rng.choice(embeddings), rng.choice(POSITIONS), rng.choice(ERAS)) for _ in range(total_queries)]
+
+    try:
+        return {
+            "before": measure_latency(wrappers["before"], queries, legacy_search_filter),
+            "after": measure_latency(
+                wrappers["after"],
+                queries,
+                lambda position, era: QdrantClientWrapper._build_search_filter(position=position, era=era),
+            ),
+        }
+    finally:
+        for wrapper in wrappers.values():
+            client.delete_collection(wrapper.collection_name)
+
+
+if __name__ == "__main__":
+    print(compare_filtered_search_latency(QdrantClient(host=settings.QDRANT_HOST, port=settings.QDRANT_PORT)))
@@ -0,0 +1,97 @@
+import json
+import random
+import statistics
+import time
+from contextlib import contextmanager
+from qdrant_client import QdrantClient
+from qdrant_client.models import SearchParams
+from backend.src.embeddings import PlayerEmbeddings
+from backend.src.qdrant_wrapper import QdrantClientWrapper
+from shared.config import settings
+from tasks.data_loading.process_data import fetch_all_players_from_local_files
+
+# Each configuration overrides the collection settings from .env for one collection build
+CONFIGURATIONS = {
+    "default": {},
+    "hnsw_m8_ef64": {"QDRANT_HNSW_M": 8, "QDRANT_HNSW_EF_CONSTRUCT": 64, "QDRANT_HNSW_EF": 64},
+    "hnsw_m32_ef256": {"QDRANT_HNSW_M": 32, "QDRANT_HNSW_EF_CONSTRUCT": 256, "QDRANT_HNSW_EF": 256},
+    "int8_rescore": {"QDRANT_QUANTIZATION_ENABLED": True, "QDRANT_QUANTIZATION_RESCORE": True},
+    "int8_no_rescore": {"QDRANT_QUANTIZATION_ENABLED": True, "QDRANT_QUANTIZATION_RESCORE": False},
+    "on_disk_int8_rescore": {
+        "QDRANT_VECTORS_ON_DISK": True,
+        "QDRANT_PAYLOAD_ON_DISK": True,
+        "QDRANT_QUANTIZATION_ENABLED": True,
+    },
+}
+
+
+@contextmanager
+def overridden_settings(overrides: dict):
+    original = {name: getattr(settings, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    try:
+        yield
+    finally:
+        for name, value in original.items():
+            setattr(settings, name, value)
+
+
+def search_ids(wrapper: QdrantClientWrapper, query_vector: list, search_params: SearchParams | None) -> list:
+    results = wrapper.client.search(
+        collection_name=wrapper.collection_name,
+        query_vector=query_vector,
+        search_params=search_params,
+        limit=settings.QDRANT_VECTOR_SEARCH_LIMIT,
+        with_payload=False,
+    )
+    return [result.id for result in results]
+
+
+def evaluate_configuration(wrapper: QdrantClientWrapper, query_vectors: list[list]) -> dict:
+    """Recall@limit of the configured search against exact search on the same collection, plus latency."""
+    recalls, latencies = [], []
+    for query_vector in query_vectors:
+        exact_ids = set(search_ids(wrapper, query_vector, SearchParams(exact=True)))
+        start = time.perf_counter()
+        approximate_ids = search_ids(wrapper, query_vector, wrapper._build_search_params())
+        latencies.append((time.perf_counter() - start) * 1000)
+        recalls.append(len(exact_ids.intersection(approximate_ids)) / len(exact_ids))
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "recall": round(statistics.mean(recalls), 4),
+        "p50_ms": round(quantiles[49], 3),
+        "p95_ms": round(quantiles[94], 3),
+    }
+
+
+def recall_report(client: QdrantClient, total_queries: int = 300) -> dict:
+    """Build one temporary collection per configuration from the processed players and evaluate each.
+
+    Local (in-memory) Qdrant always searches exactly, so meaningful numbers need the server from .env.
+    """
+    players_df = PlayerEmbeddings(
+        fetch_all_players_from_local_files(settings.PROCESSED_NBA_DATA_PATH)
+    ).create_players_embeddings()
+    query_vectors = random.Random(5).sample(players_df["embeddings"].tolist(), total_queries)
+
+    report = {}
+    for name, overrides in CONFIGURATIONS.items():
+        wrapper = QdrantClientWrapper(
+            host=settings.QDRANT_HOST,
+            port=settings.QDRANT_PORT,
+            collection_name=f"{settings.QDRANT_COLLECTION_NAME}_recall_{name}",
+        )
+        wrapper.client = client
+        with overridden_settings(overrides):
+            wrapper._initialize_collection(wrapper.collection_name, settings.QDRANT_VECTOR_SIZE, True, [])
+            try:
+                wrapper.upsert_players_data_to_qdrant(players_df)
+                report[name] = evaluate_configuration(wrapper, query_vectors)
+            finally:
+                client.delete_collection(wrapper.collection_name)
+    return report
+
+
+if __name__ == "__main__":
+    print(json.dumps(recall_report(QdrantClient(host=settings.QDRANT_HOST, port=settings.QDRANT_PORT)), indent=1))
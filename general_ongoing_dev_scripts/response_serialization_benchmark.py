@@ -0,0 +1,127 @@
+import gzip
+import json
+import random
+import statistics
+import time
+import brotli
+import orjson
+from fastapi.encoders import jsonable_encoder
+from qdrant_client.models import ScoredPoint
+from backend.src.api_responses import BROTLI_QUALITY, GZIP_COMPRESS_LEVEL, SearchJSONResponse
+from backend.src.qdrant_wrapper import QdrantClientWrapper
+from backend.utils.search_results import (
+    career_stats_fields,
+    format_similar_players_search_result,
+    format_user_requested_player_career_stats,
+    formatted_players,
+    similar_player_fields,
+)
+from shared.config import settings
+
+
+def legacy_similar_players(player_result: dict, search_result: list) -> list[dict]:
+    """Similar players formatted from each payload, as before the per-player fields were precomputed."""
+    return [
+        {"searched_player": player_result, **similar_player_fields(result.payload), "similarity_score": result.score}
+        for result in search_result
+    ]
+
+
+def stdlib_render(content) -> bytes:
+    # What FastAPI does with a returned dict by default: jsonable_encoder, then JSONResponse.render
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def median_us(function, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1e6)
+    return round(statistics.median(timings), 1)
+
+
+def serialization_report(records: list, k: int = 10, batch_size: int = 100, repeats: int = 300) -> dict:
+    """Median build + serialization time and bytes on the wire of a profile and a batch response.
+
+    "legacy" formats every result from its payload and renders through jsonable_encoder and
+    stdlib json, "current" uses the precomputed per-player fields and orjson.
+    """
+    rng = random.Random(17)
+    formatted_players.load(records)
+
+    def fake_search(record) -> tuple[dict, list]:
+        scored_points = [
+            ScoredPoint(id=neighbor.id, version=0, score=rng.random(), payload=neighbor.payload)
+            for neighbor in rng.sample(records, k)
+        ]
+        return {"player_name": record.payload["PLAYER_NAME"]}, scored_points
+
+    profile_record = rng.choice(records)
+    player_result, search_result = fake_search(profile_record)
+    batch = [fake_search(record) for record in rng.sample(records, batch_size)]
+
+    def legacy_profile() -> bytes:
+        career_stats = [{"searched_player": player_result, **career_stats_fields(profile_record.payload)}]
+        return stdlib_render(
+            {
+                "searched_player": player_result,
+                "career_stats": career_stats,
+                "similar_players": legacy_similar_players(player_result, search_result),
+                "error": None,
+            }
+        )
+
+    def current_profile() -> bytes:
+        return SearchJSONResponse(
+            {
+                "searched_player": player_result,
+                "career_stats": format_user_requested_player_career_stats(player_result, [profile_record]),
+                "similar_players": format_similar_players_search_result(player_result, search_result),
+                "error": None,
+            }
+        ).body
+
+    def batch_response(format_similar_players) -> dict:
+        return {
+            "results": {
+                result["player_name"]: {
+                    "searched_player": result,
+                    "similar_players": format_similar_players(result, scored_points),
+                    "error": None,
+                }
+                for result, scored_points in batch
+            }
+        }
+
+    cases = {
+        "profile": (legacy_profile, current_profile),
+        "batch": (
+            lambda: stdlib_render(batch_response(legacy_similar_players)),
+            lambda: SearchJSONResponse(batch_response(format_similar_players_search_result)).body,
+        ),
+    }
+    report = {}
+    for name, (legacy, current) in cases.items():
+        body = current()
+        # Same document either way, only the way it's built and rendered differs
+        assert orjson.loads(body) == json.loads(legacy())
+        report[name] = {
+            "legacy_us": median_us(legacy, repeats),
+            "current_us": median_us(current, repeats),
+            "identity_bytes": len(body),
+            "gzip_bytes": len(gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL)),
+            "br_bytes": len(brotli.compress(body, quality=BROTLI_QUALITY)),
+            "gzip_us": median_us(lambda: gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL), repeats),
+            "br_us": median_us(lambda: brotli.compress(body, quality=BROTLI_QUALITY), repeats),
+        }
+    return report
+
+
+if __name__ == "__main__":
+    with QdrantClientWrapper(
+        host=settings.QDRANT_HOST, port=settings.QDRANT_PORT, collection_name=settings.QDRANT_COLLECTION_NAME
+    ) as wrapper:
+        print(json.dumps(serialization_report(wrapper.fetch_all_players()), indent=1))
@@ -1,4 +1,4 @@
-from typing import Literal, ClassVar
+from typing import Literal, ClassVar, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 import os
@@ -8,6 +8,8 @@ class Settings(BaseSettings):
 
     QDRANT_HOST: str
     QDRANT_PORT: int
+    QDRANT_GRPC_PORT: int = Field(default=6334)
+    QDRANT_PREFER_GRPC: bool = Field(default=False, description="Use gRPC instead of REST for the API's Qdrant client")
     QDRANT_COLLECTION_NAME: str
     QDRANT_VECTOR_DISTANCE_METRIC: Literal["Cosine", "Dot", "Euclidean"] = Field(
         ..., description="Distance metric used for vector similarity"
@@ -16,6 +18,31 @@ class Settings(BaseSettings):
     QDRANT_VECTOR_SEARCH_SCORE_THRESHOLD: float = Field(..., ge=0.0, le=1.0)
     QDRANT_VECTOR_SIZE: int = Field(..., gt=0)
     QDRANT_RESET_COLLECTION: bool
+    QDRANT_HNSW_M: int = Field(default=16, gt=0)
+    QDRANT_HNSW_EF_CONSTRUCT: int = Field(default=100, gt=0)
+    QDRANT_HNSW_EF: Optional[int] = Field(default=None, gt=0, description="Search-time ef, None for the server default")
+    QDRANT_QUANTIZATION_ENABLED: bool = Field(default=False, description="int8 scalar quantization of the vectors")
+    QDRANT_QUANTIZATION_RESCORE: bool = Field(default=True)
+    QDRANT_QUANTIZATION_OVERSAMPLING: float = Field(default=2.0, ge=1.0)
+    QDRANT_VECTORS_ON_DISK: bool = Field(default=False)
+    QDRANT_PAYLOAD_ON_DISK: bool = Field(default=False)
+    QDRANT_DEBUG_COLLECTION_ENABLED: bool = Field(
+        default=False, description="Also store normalized stats in an on-disk '<collection>_debug' collection"
+    )
+
+    SEARCH_BACKEND: Literal["qdrant", "numpy"] = Field(
+        default="qdrant", description="Engine used for similarity search: Qdrant or the in-process NumPy matrix"
+    )
+    WEIGHTED_SEARCH_ENABLED: bool = Field(
+        default=True, description="Keep the vectors in process for feature-weighted similarity searches"
+    )
+    PLAYER_INDEX_ENABLED: bool = Field(default=True, description="Serve player name lookups from an in-memory index")
+    PLAYER_INDEX_REFRESH_SECONDS: int = Field(
+        default=60, gt=0, description="How often to check the collection for changes and rebuild in-memory indexes"
+    )
+    READINESS_RETRY_SECONDS: int = Field(
+        default=10, gt=0, description="Wait between startup warm-up attempts until /ready reports ready"
+    )
 
     FAST_API_HOST: str
     FAST_API_PORT: int
@@ -41,15 +68,68 @@ class Settings(BaseSettings):
             "/app" if os.path.exists("/app") else ".", "nba_data/processed_parquet_files"
         )
     )
+    PLAYER_ALIASES_FILE_PATH: str = Field(
+        default_factory=lambda: os.path.join(
+            "/app" if os.path.exists("/app") else ".", "nba_data", "player_aliases", "player_aliases.json"
+        )
+    )
+    PLAYER_SUGGEST_MAX_RESULTS: int = Field(default=10, gt=0)
+
+    RESPONSE_COMPRESSION_ENABLED: bool = Field(
+        default=True, description="Brotli/gzip compress API responses for clients sending Accept-Encoding"
+    )
+    RESPONSE_COMPRESSION_MIN_SIZE: int = Field(default=1024, ge=0)
+    METRICS_ENABLED: bool = Field(default=True, description="Expose Prometheus metrics on GET /metrics")
+    SERVER_TIMING_ENABLED: bool = Field(
+        default=True, description="Send per-stage search timings in a Server-Timing response header"
+    )
+
+    BATCH_SEARCH_MAX_ITEMS: int = Field(default=500, gt=0)
+    BLEND_SEARCH_MAX_PLAYERS: int = Field(default=5, gt=0)
+    SIMILAR_PLAYERS_MAX_K: int = Field(default=100, gt=0)
+    SIMILAR_PLAYERS_MAX_OFFSET: int = Field(default=1000, ge=0)
+
+    SEARCH_CACHE_ENABLED: bool = Field(default=True)
+    SEARCH_CACHE_MAX_ENTRIES: int = Field(default=2048, gt=0)
+    SEARCH_CACHE_TTL_SECONDS: int = Field(default=3600, gt=0)
+    DATASET_VERSION_FILE_PATH: str = Field(
+        default_factory=lambda: os.path.join(
+            "/app" if os.path.exists("/app") else ".", "nba_data", "dataset_version", "dataset_version.json"
+        )
+    )
+    NEIGHBOR_TABLE_ENABLED: bool = Field(
+        default=False, description="Build a precomputed neighbor table at ingest and serve searches from it"
+    )
+    NEIGHBOR_TABLE_FILE_PATH: str = Field(
+        default_factory=lambda: os.path.join(
+            "/app" if os.path.exists("/app") else ".", "nba_data", "neighbor_table", "neighbor_table.npz"
+        )
+    )
+    NEIGHBOR_TABLE_DEPTH: int = Field(
+        default=21, gt=1, description="Neighbors kept per player including itself, deeper pages are searched live"
+    )
 
     RECENT_SEARCHES_ENABLED: bool = Field(default=True)
     RECENT_SEARCHES_FILE_PATH: str = Field(
         default_factory=lambda: os.path.join(
-            "/app" if os.path.exists("/app") else ".", "nba_data", "recent_searches", "recent_searches.json"
+            "/app" if os.path.exists("/app") else ".", "nba_data", "recent_searches", "recent_searches.jsonl"
         )
     )
     RECENT_SEARCHES_DISPLAY_LIMIT: int = Field(default=8, gt=0)
     RECENT_SEARCHES_TTL_DAYS: int = Field(default=7, gt=0)
+    RECENT_SEARCHES_COMPACTION_SECONDS: int = Field(
+        default=300, gt=0, description="How often the recent searches log drops expired and surplus entries"
+    )
+    RECORD_SEARCH_QUEUE_MAX_SIZE: int = Field(
+        default=10000, gt=0, description="Searches waiting to be written before /record_search/ applies backpressure"
+    )
+    RECORD_SEARCH_FLUSH_BATCH_SIZE: int = Field(default=200, gt=0)
+    RECORD_SEARCH_FLUSH_INTERVAL_SECONDS: float = Field(
+        default=0.5, gt=0.0, description="Longest a queued search waits for its batch to fill up"
+    )
+    RECORD_SEARCH_ENQUEUE_TIMEOUT_SECONDS: float = Field(
+        default=1.0, gt=0.0, description="How long /record_search/ waits for room in a full queue before a 503"
+    )
 
     FETCH_RAW_DATA_FETCH: bool
     PROCESS_ALL_PLAYERS_METRIC: bool
@@ -8,9 +8,11 @@ API_BASE_URL = f"http://{settings.FAST_API_HOST}:{settings.FAST_API_PORT}"
 
 
 @st.cache_data
-def fetch_similar_players(requested_player_name: str, position: str | None = None, era: str | None = None) -> dict | list:
+def fetch_player_profile_with_similar_players(
+    requested_player_name: str, position: str | None = None, era: str | None = None
+) -> dict:
     requested_player_name = requested_player_name.title()
-    logger.info(f"Fetching similar players for: {requested_player_name} (position={position}, era={era})")
+    logger.info(f"Fetching profile and similar players for: {requested_player_name} (position={position}, era={era})")
     try:
         with st.spinner("Searching for similar players..."):
             params = {"player_name": requested_player_name}
@@ -19,7 +21,7 @@ def fetch_similar_players(requested_player_name: str, position: str | None = Non
             if era:
                 params["era"] = era
             response = requests.get(
-                f"{API_BASE_URL}/search_similar_players/",
+                f"{API_BASE_URL}/player_profile_with_similar_players/",
                 params=params,
                 timeout=settings.API_REQUEST_TIMEOUT,
             )
@@ -30,34 +32,41 @@ def fetch_similar_players(requested_player_name: str, position: str | None = Non
 
 
 @st.cache_data
-def fetch_user_input_player_stats(requested_player_name: str) -> dict | list:
-    requested_player_name = requested_player_name.title()
-    logger.info(f"Fetching career stats for: {requested_player_name}")
+def fetch_blended_players_with_similar_players(
+    requested_player_names: tuple[str, ...], position: str | None = None, era: str | None = None
+) -> dict:
+    requested_player_names = [player_name.title() for player_name in requested_player_names]
+    logger.info(f"Fetching similar players for the blend of: {requested_player_names} (position={position}, era={era})")
     try:
-        with st.spinner("Fetching career stats..."):
-            response = requests.get(
-                f"{API_BASE_URL}/user_requested_player_career_stats/",
-                params={"player_name": requested_player_name},
+        with st.spinner("Searching for similar players..."):
+            response = requests.post(
+                f"{API_BASE_URL}/search_similar_players/blend/",
+                json={
+                    "players": [{"player_name": player_name} for player_name in requested_player_names],
+                    "position": position,
+                    "era": era,
+                },
                 timeout=settings.API_REQUEST_TIMEOUT,
             )
-        response.raise_for_status()  # Raise an error for bad responses
+        response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
         return {"error": f"Error connecting to the server: {e}"}
 
 
 @st.cache_data(ttl=30)
-def fetch_recent_searches(limit: int = 8) -> list[dict]:
+def fetch_popular_searches(limit: int = 8) -> list[dict]:
+    """Most searched players of the recent searches window, one entry per player."""
     try:
         response = requests.get(
-            f"{API_BASE_URL}/recent_searches/",
-            params={"limit": limit},
+            f"{API_BASE_URL}/analytics/searches",
+            params={"top": limit},
             timeout=settings.API_REQUEST_TIMEOUT,
         )
         response.raise_for_status()
-        return response.json().get("recent_searches", [])
+        return response.json().get("top_players", [])
     except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to fetch recent searches: {e}")
+        logger.error(f"Failed to fetch popular searches: {e}")
         return []
 
 
@@ -96,14 +105,10 @@ def record_search(
         logger.error(f"Failed to record search: {e}")
 
 
-def get_user_input_stats(user_input: str) -> dict | list[dict]:
-    user_stats_result = fetch_user_input_player_stats(user_input)
-    logger.debug(f"User stats result: {user_stats_result} for user input: {user_input}")
-    if "error" in user_stats_result:
-        return {"error": user_stats_result["error"]}
-    if not user_stats_result:
+def get_user_input_stats(career_stats: list[dict]) -> dict | list[dict]:
+    if not career_stats:
         return {"error": "No stats found for the requested player."}
-    user_stats_result_player = user_stats_result[0]
+    user_stats_result_player = career_stats[0]
     return [
         {
             "player_name": user_stats_result_player["searched_player"]["player_name"].title(),
@@ -126,42 +131,77 @@ def get_user_input_stats(user_input: str) -> dict | list[dict]:
     ]
 
 
-def get_similar_player_stats(user_stats: dict | list[dict], position: str | None = None, era: str | None = None) -> dict | list[dict]:
+def get_similar_player_stats(
+    similar_players_result: list[dict], position: str | None = None, era: str | None = None
+) -> dict | list[dict]:
+    if not similar_players_result:
+        active_filters = []
+        if position:
+            active_filters.append(f"position: {position}")
+        if era:
+            active_filters.append(f"era: {era}")
+        filter_note = f" with filters ({', '.join(active_filters)})" if active_filters else ""
+        return {"error": f"No similar players found{filter_note}. Try removing some filters or broadening your search."}
+    return [
+        {
+            "player_name": player["player_name"].title(),
+            "position": player.get("position", "Unknown"),
+            "height_inches": player.get("height_inches", 0),
+            "weight": player.get("weight", 0),
+            "points_per_game": player["points_per_game"],
+            "assists_per_game": player["assists_per_game"],
+            "rebounds_per_game": player["rebounds_per_game"],
+            "blocks_per_game": player["blocks_per_game"],
+            "steals_per_game": player["steals_per_game"],
+            "true_shooting_percentage": (player["true_shooting_percentage"] or 0) * 100,
+            "field_goal_percentage": player["field_goal_percentage"],
+            "three_point_percentage": player["three_point_percentage"],
+            "free_throw_percentage": player["free_throw_percentage"],
+            "last_played_season": player["last_played_season"],
+            "last_played_age": player["last_played_age"],
+            "total_seasons": player["total_seasons"],
+            "similarity_score": (player["similarity_score"] or 0) * 100,
+        }
+        for player in similar_players_result
+    ]
+
+
+def get_player_profile_and_similar_stats(
+    user_input: str, position: str | None = None, era: str | None = None
+) -> tuple[dict | list[dict], dict | list[dict]]:
+    """Fetch the requested player's stats and their similar players with a single backend call.
+
+    Returns (user_stats, similar_player_stats); on failure both are the same {"error": ...} dict.
+    """
+    result = fetch_player_profile_with_similar_players(user_input, position=position, era=era)
+    logger.debug(f"Profile and similar players result: {result} for user input: {user_input}")
+    if result.get("error"):
+        error = {"error": result["error"]}
+        return error, error
+
+    user_stats = get_user_input_stats(result.get("career_stats", []))
     if "error" in user_stats:
-        return user_stats
-    similar_players_result = fetch_similar_players(user_stats[0]["player_name"], position=position, era=era)
-    logger.debug(f"Similar players result: {similar_players_result} for player: {user_stats[0]['player_name']}")
-    if isinstance(similar_players_result, dict) or not similar_players_result:
-        error_msg = similar_players_result.get("error") if isinstance(similar_players_result, dict) else None
-        if not error_msg:
-            active_filters = []
-            if position:
-                active_filters.append(f"position: {position}")
-            if era:
-                active_filters.append(f"era: {era}")
-            filter_note = f" with filters ({', '.join(active_filters)})" if active_filters else ""
-            error_msg = f"No similar players found{filter_note}. Try removing some filters or broadening your search."
-        return {"error": error_msg}
-    else:
-        return [
-            {
-                "player_name": player["player_name"].title(),
-                "position": player.get("position", "Unknown"),
-                "height_inches": player.get("height_inches", 0),
-                "weight": player.get("weight", 0),
-                "points_per_game": player["points_per_game"],
-                "assists_per_game": player["assists_per_game"],
-                "rebounds_per_game": player["rebounds_per_game"],
-                "blocks_per_game": player["blocks_per_game"],
-                "steals_per_game": player["steals_per_game"],
-                "true_shooting_percentage": (player["true_shooting_percentage"] or 0) * 100,
-                "field_goal_percentage": player["field_goal_percentage"],
-                "three_point_percentage": player["three_point_percentage"],
-                "free_throw_percentage": player["free_throw_percentage"],
-                "last_played_season": player["last_played_season"],
-                "last_played_age": player["last_played_age"],
-                "total_seasons": player["total_seasons"],
-                "similarity_score": (player["similarity_score"] or 0) * 100,
-            }
-            for player in similar_players_result
-        ]
+        return user_stats, user_stats
+    similar_player_stats = get_similar_player_stats(result.get("similar_players", []), position=position, era=era)
+    return user_stats, similar_player_stats
+
+
+def get_blended_players_and_similar_stats(
+    player_names: list[str], position: str | None = None, era: str | None = None
+) -> tuple[dict | list[dict], dict | list[dict]]:
+    """Same contract as get_player_profile_and_similar_stats, with one user_stats row per blended player."""
+    player_names = player_names[: settings.BLEND_SEARCH_MAX_PLAYERS]
+    result = fetch_blended_players_with_similar_players(tuple(player_names), position=position, era=era)
+    logger.debug(f"Blended players result: {result} for player names: {player_names}")
+    if result.get("error"):
+        error = {"error": result["error"]}
+        return error, error
+
+    user_stats = []
+    for career_stats in result.get("career_stats", []):
+        user_stats.extend(get_user_input_stats([career_stats]))
+    if not user_stats:
+        error = get_user_input_stats([])
+        return error, error
+    similar_player_stats = get_similar_player_stats(result.get("similar_players", []), position=position, era=era)
+    return user_stats, similar_player_stats
@@ -11,7 +11,12 @@ if str(project_root) not in sys.path:
 
 from shared.config import settings
 from shared.utils.app_logger import logger
-from streamlit_frontend.src.api_client import get_user_input_stats, get_similar_player_stats, fetch_recent_searches, record_search
+from streamlit_frontend.src.api_client import (
+    get_blended_players_and_similar_stats,
+    get_player_profile_and_similar_stats,
+    fetch_popular_searches,
+    record_search,
+)
 from streamlit_frontend.src.components import (
     display_chat_messages,
     format_stats_for_display,
@@ -26,6 +31,37 @@ from streamlit_frontend.src.utils import fetch_versions
 st.set_page_config(layout="wide", page_title="NBA Player Similarity Finder", page_icon="\U0001f3c0")
 
 
+def record_searches(
+    searched_player_names: list[str],
+    user_stats: dict | list[dict],
+    similar_player_stats: dict | list[dict],
+    position: str | None,
+    era: str | None,
+    original_query: str,
+    search_source: str,
+) -> None:
+    """One search per searched player, under the name the backend resolved it to when it was found."""
+    results_found = "error" not in user_stats and "error" not in similar_player_stats
+    if results_found:
+        # Typos and nicknames count toward the same player in popularity
+        searched_player_names = [player_stats["player_name"] for player_stats in user_stats]
+    geo = st.session_state.get("client_geolocation", {})
+    for player_name in searched_player_names:
+        record_search(
+            player_name=player_name,
+            position=position,
+            era=era,
+            original_query=original_query,
+            search_source=search_source,
+            results_found=results_found,
+            client_ip=st.session_state.get("client_ip", ""),
+            country=geo.get("country", ""),
+            region=geo.get("region", ""),
+            city=geo.get("city", ""),
+            timezone=geo.get("timezone", ""),
+        )
+
+
 def handle_user_input() -> None:
     user_input = st.session_state.user_input.strip()
     if not user_input:
@@ -51,18 +87,19 @@ def handle_user_input() -> None:
         st.session_state["user_input"] = ""
         return
 
-    if intent["multiple_players"]:
-        st.session_state["messages"].append({
-            "role": "assistant",
-            "content": f"Currently only single player comparison is supported. Showing results for {intent['player_name']}.",
-        })
-
     player_name = intent["player_name"]
     position = intent["position"]
     era = intent["era"]
 
-    user_stats = get_user_input_stats(player_name)
-    similar_player_stats = get_similar_player_stats(user_stats, position=position, era=era)
+    searched_player_names = [player_name]
+    if intent["multiple_players"] and len(intent["player_names"]) > 1:
+        searched_player_names = intent["player_names"]
+        # Several players: search around the blend of all of them
+        user_stats, similar_player_stats = get_blended_players_and_similar_stats(
+            intent["player_names"], position=position, era=era
+        )
+    else:
+        user_stats, similar_player_stats = get_player_profile_and_similar_stats(player_name, position=position, era=era)
 
     if "error" in user_stats or "error" in similar_player_stats:
         reply = user_stats["error"] if "error" in user_stats else similar_player_stats["error"]
@@ -74,20 +111,7 @@ def handle_user_input() -> None:
         chart_html = generate_radar_chart_html(user_stats, similar_player_stats)
         st.session_state["messages"].append({"role": "assistant", "content": html_reply, "type": "html", "chart": chart_html})
 
-    geo = st.session_state.get("client_geolocation", {})
-    record_search(
-        player_name=player_name,
-        position=position,
-        era=era,
-        original_query=user_input,
-        search_source="typed",
-        results_found="error" not in user_stats and "error" not in similar_player_stats,
-        client_ip=st.session_state.get("client_ip", ""),
-        country=geo.get("country", ""),
-        region=geo.get("region", ""),
-        city=geo.get("city", ""),
-        timezone=geo.get("timezone", ""),
-    )
+    record_searches(searched_player_names, user_stats, similar_player_stats, position, era, user_input, "typed")
 
     st.session_state["user_input"] = ""
 
@@ -132,8 +156,7 @@ def main() -> None:
         st.session_state["messages"].append({"role": "user", "content": display})
         st.session_state["last_processed_input"] = display
 
-        user_stats = get_user_input_stats(player_name)
-        similar_player_stats = get_similar_player_stats(user_stats, position=position, era=era)
+        user_stats, similar_player_stats = get_player_profile_and_similar_stats(player_name, position=position, era=era)
 
         if "error" in user_stats or "error" in similar_player_stats:
             reply = user_stats["error"] if "error" in user_stats else similar_player_stats["error"]
@@ -145,41 +168,16 @@ def main() -> None:
             chart_html = generate_radar_chart_html(user_stats, similar_player_stats)
             st.session_state["messages"].append({"role": "assistant", "content": html_reply, "type": "html", "chart": chart_html})
 
-        geo = st.session_state.get("client_geolocation", {})
-        record_search(
-            player_name=player_name,
-            position=position,
-            era=era,
-            original_query=display,
-            search_source="pill_click",
-            results_found="error" not in user_stats and "error" not in similar_player_stats,
-            client_ip=st.session_state.get("client_ip", ""),
-            country=geo.get("country", ""),
-            region=geo.get("region", ""),
-            city=geo.get("city", ""),
-            timezone=geo.get("timezone", ""),
-        )
+        record_searches([player_name], user_stats, similar_player_stats, position, era, display, "pill_click")
 
     if settings.RECENT_SEARCHES_ENABLED:
-        recent = fetch_recent_searches(settings.RECENT_SEARCHES_DISPLAY_LIMIT)
-        if recent:
-            st.markdown('<p class="recent-searches-label">Recent searches by others</p>', unsafe_allow_html=True)
-            pill_labels = []
-            for s in recent:
-                label = s["player_name"].title()
-                parts = []
-                if s.get("position"):
-                    parts.append(s["position"])
-                if s.get("era"):
-                    parts.append(s["era"])
-                if parts:
-                    label += f" ({', '.join(parts)})"
-                pill_labels.append(label)
-            selected_idx = st.pills("recent_searches", pill_labels, label_visibility="collapsed", key="recent_pills")
-            if selected_idx is not None:
-                # Find the matching search entry by label
-                idx = pill_labels.index(selected_idx)
-                st.session_state["pending_pill_search"] = recent[idx]
+        popular = fetch_popular_searches(settings.RECENT_SEARCHES_DISPLAY_LIMIT)
+        if popular:
+            st.markdown('<p class="recent-searches-label">Popular searches by others</p>', unsafe_allow_html=True)
+            pill_labels = [player["player_name"].title() for player in popular]
+            selected_label = st.pills("recent_searches", pill_labels, label_visibility="collapsed", key="recent_pills")
+            if selected_label is not None:
+                st.session_state["pending_pill_search"] = {"player_name": selected_label}
                 del st.session_state["recent_pills"]
                 st.rerun()
 
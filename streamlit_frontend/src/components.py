@@ -85,7 +85,8 @@ def format_stats_for_display(user_stats: list[dict], similar_player_stats: list[
     ) if active_filters else ""
     filter_html_styled = f"<p>{filter_badges}</p>" if filter_badges else ""
 
-    escaped_heading_name = html.escape(user_stats[0]['player_name'])
+    # Blended searches list every input player, a single search has one row
+    escaped_heading_name = html.escape(" + ".join(player["player_name"] for player in user_stats))
     escaped_llm_summary = html.escape(llm_summary)
 
     html_content = f"""
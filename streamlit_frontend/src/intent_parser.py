@@ -14,6 +14,7 @@ Return a JSON object with these fields:
 - "era": The TARGET decade/era to search for similar players in (e.g., "1990s", "2000s", "2010s", "2020s") or null if not specified. This is the era the user wants RESULTS from, not the era when the mentioned player was active.
 - "position": The position to filter similar players by, normalized to one of: "Guard", "Forward", "Center", or null if not specified
 - "multiple_players": true if multiple player names are mentioned, false otherwise
+- "player_names": All NBA players mentioned, in the order they are mentioned (empty list if none)
 
 CRITICAL: The era field refers to WHEN THE SIMILAR PLAYERS should have played, not when the named player played.
 Examples:
@@ -35,7 +36,7 @@ Era mapping hints:
 - "80s" -> "1980s"
 - "2010", "2010s", "the 2010s" -> "2010s"
 
-If multiple players are mentioned, set "player_name" to the first player mentioned and "multiple_players" to true.
+If multiple players are mentioned (e.g. "a mix of Curry and Shaq"), set "player_name" to the first player mentioned, "player_names" to all of them and "multiple_players" to true.
 If the input is just a player name with no filters, return the name with null for era and position.
 
 Always return valid JSON only, no extra text."""
@@ -44,7 +45,7 @@ Always return valid JSON only, no extra text."""
 def parse_user_intent(user_input: str) -> dict:
     """Parse natural language user input into structured search parameters.
 
-    Returns a dict with keys: player_name, era, position, multiple_players.
+    Returns a dict with keys: player_name, era, position, multiple_players, player_names.
     Falls back to treating input as a plain player name if LLM call fails.
     """
     default_result = {
@@ -52,6 +53,7 @@ def parse_user_intent(user_input: str) -> dict:
         "era": None,
         "position": None,
         "multiple_players": False,
+        "player_names": [user_input.strip()] if user_input.strip() else [],
     }
 
     try:
@@ -74,11 +76,14 @@ def parse_user_intent(user_input: str) -> dict:
             logger.warning(f"Intent parser returned non-dict JSON: {type(parsed)}. Falling back to plain input.")
             return default_result
 
+        player_name = parsed.get("player_name") or None
+        player_names = [name for name in parsed.get("player_names") or [] if isinstance(name, str) and name.strip()]
         return {
-            "player_name": parsed.get("player_name") or None,
+            "player_name": player_name,
             "era": parsed.get("era") or None,
             "position": parsed.get("position") or None,
             "multiple_players": bool(parsed.get("multiple_players", False)),
+            "player_names": player_names or ([player_name] if player_name else []),
         }
 
     except json.JSONDecodeError as e:
@@ -5,7 +5,7 @@ client = OpenAI(api_key=settings.LLM_API_KEY)
 
 
 def generate_analysis(user_req_players_stats: list, similar_player_stats: list) -> str:
-    user_player = user_req_players_stats[0]["player_name"]
+    user_player = " and ".join(player["player_name"] for player in user_req_players_stats)
     similar_players = [player["player_name"] for player in similar_player_stats]
 
     context = (
@@ -1,5 +1,7 @@
 import datetime
 from backend.src.qdrant_wrapper import QdrantClientWrapper
+from backend.src.dataset_version import new_dataset_version, write_dataset_version
+from backend.src.neighbor_table import NeighborTable
 from shared.utils.app_logger import logger
 from shared.config import settings
 import time
@@ -17,7 +19,21 @@ if __name__ == "__main__":
             vector_size=settings.QDRANT_VECTOR_SIZE,
             reset_collection=settings.QDRANT_RESET_COLLECTION,  # True to allow duplication of the data
         )
-        qdrant_object.store_players_embedding(data_dir=folder_path)
+        dataset_version = new_dataset_version()
+        processed_df = qdrant_object.store_players_embedding(data_dir=folder_path)
+        if settings.NEIGHBOR_TABLE_ENABLED:
+            logger.info("Building precomputed neighbor table...")
+            NeighborTable.build(
+                processed_df,
+                distance_metric=settings.QDRANT_VECTOR_DISTANCE_METRIC,
+                # at least one extra slot so the searched player itself can be dropped from a full default page
+                depth=max(settings.NEIGHBOR_TABLE_DEPTH, settings.QDRANT_VECTOR_SEARCH_LIMIT + 1),
+                dataset_version=dataset_version,
+            ).save(settings.NEIGHBOR_TABLE_FILE_PATH)
+        # Bump the dataset version last so API caches only switch over once the collection is complete
+        write_dataset_version(
+            settings.DATASET_VERSION_FILE_PATH, collection_name=settings.QDRANT_COLLECTION_NAME, version=dataset_version
+        )
         logger.info(
             f"Finished data fetching process on {datetime.datetime.now()} and it took in minutes {round((time.time() - start_time) / 60, 2)}"
         )